@@ -39,6 +39,10 @@ SELECT
     acc_fk.R_CONSTRAINT_NAME AS REFERENCED_CONSTRAINT,
     acc_uk.CONSTRAINT_TYPE AS UK_CONSTRAINT_TYPE,
     acc_uk.CONSTRAINT_NAME AS UK_CONSTRAINT_NAME,
+    -- 제약조건 안에서의 컬럼 위치 (다중 컬럼 외래키를 참조 컬럼과 위치로 짝지음)
+    acc.POSITION AS PK_POSITION,
+    acc_fk.POSITION AS FK_POSITION,
+    acc_uk.POSITION AS UK_POSITION,
     acc_ck.CONSTRAINT_TYPE AS CK_CONSTRAINT_TYPE,
     acc_ck.CONSTRAINT_NAME AS CK_CONSTRAINT_NAME,
     acc_ck.SEARCH_CONDITION,
@@ -68,7 +72,8 @@ FROM
             acc.TABLE_NAME,
             acc.CONSTRAINT_NAME,
             acc.CONSTRAINT_TYPE,
-            accc.COLUMN_NAME
+            accc.COLUMN_NAME,
+            accc.POSITION
         FROM 
             ALL_CONSTRAINTS acc
             INNER JOIN ALL_CONS_COLUMNS accc 
@@ -87,7 +92,8 @@ FROM
             acc.CONSTRAINT_NAME,
             acc.CONSTRAINT_TYPE,
             acc.R_CONSTRAINT_NAME,
-            accc.COLUMN_NAME
+            accc.COLUMN_NAME,
+            accc.POSITION
         FROM 
             ALL_CONSTRAINTS acc
             INNER JOIN ALL_CONS_COLUMNS accc 
@@ -105,7 +111,8 @@ FROM
             acc.TABLE_NAME,
             acc.CONSTRAINT_NAME,
             acc.CONSTRAINT_TYPE,
-            accc.COLUMN_NAME
+            accc.COLUMN_NAME,
+            accc.POSITION
         FROM 
             ALL_CONSTRAINTS acc
             INNER JOIN ALL_CONS_COLUMNS accc 
@@ -388,6 +395,165 @@ ORDER BY
 */
 
 
+-- ============================================================================
+-- 옵션 5: 컬럼 통계 + 인덱스 + 파티션 방식 정보 포함 (RANGE 파티션, 클러스터 자동 추천)
+-- ============================================================================
+-- ALL_TAB_COL_STATISTICS의 최솟값/최댓값(RAW)과 고유값 수, ALL_TABLES의 행 수,
+-- ALL_IND_COLUMNS의 인덱스 사용 정보, ALL_PART_TABLES의 파티션 방식을 함께 추출합니다.
+-- - 숫자(INT64) 파티션 키 컬럼은 최솟값/최댓값으로
+--     PARTITION BY RANGE_BUCKET(컬럼, GENERATE_ARRAY(시작, 끝, 간격))
+--   이 생성됩니다. (통계가 없으면 파티션 생략, DBMS_STATS로 통계를 먼저 수집하세요)
+-- - 날짜 파티션 키 컬럼은 테이블 크기(BLOCKS)와 최솟값/최댓값 범위로 DAY/MONTH/YEAR 단위를
+--   고르고, 큰 테이블에는 require_partition_filter=true를 설정합니다. (작은 테이블은 파티션 생략)
+-- - --recommend-clusters 옵션을 주면 CLUSTER_YN이 없는 테이블에 인덱스 선두 컬럼과
+--   선택도(NUM_DISTINCT / NUM_ROWS)로 클러스터 컬럼(최대 4개)을 추천합니다.
+-- - Oracle 파티션 방식(PARTITIONING_TYPE, INTERVAL, SUBPARTITIONING_TYPE)을 BigQuery로 옮깁니다.
+--     RANGE INTERVAL: NUMTOYMINTERVAL(1,'MONTH') → MONTH 단위 등 같은 간격의 파티션
+--     LIST/HASH 파티션 키와 서브파티션 키 → 클러스터 컬럼 (enable_clustering 필요)
+--     다중 컬럼 RANGE 키 → 첫 날짜(없으면 첫 정수) 키만 파티션, 나머지 키는 클러스터
+-- - estimate 명령은 NUM_ROWS, NUM_NULLS, AVG_COL_LEN으로 BigQuery 저장/스캔 크기를 추정합니다.
+-- LOW_VALUE/HIGH_VALUE는 RAWTOHEX 그대로 저장하며 변환 도구가 해석합니다.
+-- ============================================================================
+/*
+SELECT 
+    atc.TABLE_NAME,
+    atc.OWNER,
+    atc.COLUMN_NAME,
+    atc.COLUMN_ID,
+    atc.DATA_TYPE,
+    atc.DATA_LENGTH,
+    atc.DATA_PRECISION,
+    atc.DATA_SCALE,
+    atc.NULLABLE,
+    atc.DATA_DEFAULT,
+    CASE 
+        WHEN acc.CONSTRAINT_TYPE = 'P' THEN 'Y'
+        ELSE 'N'
+    END AS IS_PRIMARY_KEY,
+    acc.CONSTRAINT_NAME AS PK_CONSTRAINT_NAME,
+    atc_comments.COMMENTS AS TABLE_COMMENT,
+    acc_col_comments.COMMENTS AS COLUMN_COMMENT,
+    CASE 
+        WHEN part_key.COLUMN_NAME IS NOT NULL THEN 'Y'
+        ELSE 'N'
+    END AS PARTITION_YN,
+    'N' AS CLUSTER_YN,
+    -- 컬럼 통계
+    RAWTOHEX(stats.LOW_VALUE) AS LOW_VALUE,
+    RAWTOHEX(stats.HIGH_VALUE) AS HIGH_VALUE,
+    stats.NUM_DISTINCT,
+    stats.NUM_NULLS,
+    stats.AVG_COL_LEN,
+    tab.NUM_ROWS,
+    tab.BLOCKS,
+    -- 인덱스 사용 정보 (클러스터 추천용)
+    NVL(idx.INDEX_COUNT, 0) AS INDEX_COUNT,
+    NVL(idx.LEADING_INDEX_COUNT, 0) AS LEADING_INDEX_COUNT,
+    idx.MIN_INDEX_POSITION,
+    idx.UNIQUE_INDEX_POSITION,
+    -- 파티션 방식 (파티션 테이블이 아니면 비어 있음)
+    apt.PARTITIONING_TYPE,
+    apt.SUBPARTITIONING_TYPE,
+    apt.INTERVAL AS PARTITION_INTERVAL,
+    part_key.COLUMN_POSITION AS PARTITION_KEY_POSITION,
+    subpart_key.COLUMN_POSITION AS SUBPARTITION_KEY_POSITION
+FROM 
+    ALL_TAB_COLUMNS atc
+    LEFT JOIN ALL_TAB_COMMENTS atc_comments 
+        ON atc.OWNER = atc_comments.OWNER 
+        AND atc.TABLE_NAME = atc_comments.TABLE_NAME
+    LEFT JOIN ALL_COL_COMMENTS acc_col_comments 
+        ON atc.OWNER = acc_col_comments.OWNER 
+        AND atc.TABLE_NAME = acc_col_comments.TABLE_NAME 
+        AND atc.COLUMN_NAME = acc_col_comments.COLUMN_NAME
+    LEFT JOIN (
+        SELECT 
+            acc.OWNER,
+            acc.TABLE_NAME,
+            acc.CONSTRAINT_NAME,
+            acc.CONSTRAINT_TYPE,
+            accc.COLUMN_NAME
+        FROM 
+            ALL_CONSTRAINTS acc
+            INNER JOIN ALL_CONS_COLUMNS accc 
+                ON acc.OWNER = accc.OWNER 
+                AND acc.CONSTRAINT_NAME = accc.CONSTRAINT_NAME
+        WHERE 
+            acc.CONSTRAINT_TYPE = 'P'
+    ) acc ON atc.OWNER = acc.OWNER 
+        AND atc.TABLE_NAME = acc.TABLE_NAME 
+        AND atc.COLUMN_NAME = acc.COLUMN_NAME
+    -- 파티션 키 컬럼 정보
+    LEFT JOIN (
+        SELECT 
+            apkc.OWNER,
+            apkc.NAME AS TABLE_NAME,
+            apkc.COLUMN_NAME,
+            apkc.COLUMN_POSITION
+        FROM 
+            ALL_PART_KEY_COLUMNS apkc
+        WHERE 
+            apkc.OBJECT_TYPE = 'TABLE'
+    ) part_key ON atc.OWNER = part_key.OWNER 
+        AND atc.TABLE_NAME = part_key.TABLE_NAME 
+        AND atc.COLUMN_NAME = part_key.COLUMN_NAME
+    -- 파티션 방식 (RANGE/LIST/HASH, INTERVAL, 서브파티션 방식)
+    LEFT JOIN ALL_PART_TABLES apt 
+        ON atc.OWNER = apt.OWNER 
+        AND atc.TABLE_NAME = apt.TABLE_NAME
+    -- 서브파티션 키 컬럼 정보
+    LEFT JOIN (
+        SELECT 
+            askc.OWNER,
+            askc.NAME AS TABLE_NAME,
+            askc.COLUMN_NAME,
+            askc.COLUMN_POSITION
+        FROM 
+            ALL_SUBPART_KEY_COLUMNS askc
+        WHERE 
+            askc.OBJECT_TYPE = 'TABLE'
+    ) subpart_key ON atc.OWNER = subpart_key.OWNER 
+        AND atc.TABLE_NAME = subpart_key.TABLE_NAME 
+        AND atc.COLUMN_NAME = subpart_key.COLUMN_NAME
+    -- 컬럼 통계 (최솟값, 최댓값, 고유값 수)
+    LEFT JOIN ALL_TAB_COL_STATISTICS stats 
+        ON atc.OWNER = stats.OWNER 
+        AND atc.TABLE_NAME = stats.TABLE_NAME 
+        AND atc.COLUMN_NAME = stats.COLUMN_NAME
+    -- 테이블 통계 (행 수, 블록 수)
+    LEFT JOIN ALL_TABLES tab 
+        ON atc.OWNER = tab.OWNER 
+        AND atc.TABLE_NAME = tab.TABLE_NAME
+    -- 인덱스 사용 정보 (컬럼이 포함된 인덱스 수, 선두 컬럼인 인덱스 수, 위치)
+    LEFT JOIN (
+        SELECT 
+            aic.TABLE_OWNER AS OWNER,
+            aic.TABLE_NAME,
+            aic.COLUMN_NAME,
+            COUNT(*) AS INDEX_COUNT,
+            SUM(CASE WHEN aic.COLUMN_POSITION = 1 THEN 1 ELSE 0 END) AS LEADING_INDEX_COUNT,
+            MIN(aic.COLUMN_POSITION) AS MIN_INDEX_POSITION,
+            MIN(CASE WHEN ai.UNIQUENESS = 'UNIQUE' THEN aic.COLUMN_POSITION END) AS UNIQUE_INDEX_POSITION
+        FROM 
+            ALL_IND_COLUMNS aic
+            INNER JOIN ALL_INDEXES ai 
+                ON aic.INDEX_OWNER = ai.OWNER 
+                AND aic.INDEX_NAME = ai.INDEX_NAME
+        GROUP BY 
+            aic.TABLE_OWNER,
+            aic.TABLE_NAME,
+            aic.COLUMN_NAME
+    ) idx ON atc.OWNER = idx.OWNER 
+        AND atc.TABLE_NAME = idx.TABLE_NAME 
+        AND atc.COLUMN_NAME = idx.COLUMN_NAME
+WHERE 
+    atc.OWNER = 'YOUR_SCHEMA_NAME'
+ORDER BY 
+    atc.OWNER,
+    atc.TABLE_NAME,
+    atc.COLUMN_ID;
+*/
+
 -- ============================================================================
 -- CSV 파일로 저장하는 방법
 -- ============================================================================
@@ -441,6 +607,8 @@ ORDER BY
 --       - CSV 파일을 Excel이나 텍스트 에디터로 열기
 --       - 자주 조회되는 컬럼의 CLUSTER_YN을 'Y'로 변경 (최대 4개)
 --       - 예: 고객ID, 상품ID, 지역코드 등
+--    ✅ 자동 추천: 옵션 5 쿼리로 추출하고 --recommend-clusters 옵션 사용
+--       (CLUSTER_YN이 없는 테이블만, 선택 이유는 --emit cluster-report로 확인)
 --
 -- 3. 파티션 정보 확인 쿼리:
 --    -- Oracle에서 파티션 테이블 목록 확인
@@ -471,4 +639,12 @@ ORDER BY
 --      CREATE TABLE `project.schema.SALES` (...)
 --      PARTITION BY DATE(SALE_DATE);
 --
+--    Oracle 복합 파티션 테이블 (옵션 5로 추출):
+--      PARTITION BY RANGE (SALE_DATE) INTERVAL (NUMTOYMINTERVAL(1,'MONTH'))
+--      SUBPARTITION BY LIST (REGION) (...);
+--
+--    BigQuery DDL 생성 결과:
+--      PARTITION BY DATETIME_TRUNC(SALE_DATE, MONTH)
+--      CLUSTER BY REGION;
+--
 -- ============================================================================
@@ -8,6 +8,7 @@ Oracle to BigQuery Migration Tool - Windows 포터블 버전 자동화 테스트
 - 성능 테스트: 대용량 데이터셋 처리
 """
 
+import io
 import os
 import sys
 import csv
@@ -15,6 +16,7 @@ import json
 import shutil
 import subprocess
 import tempfile
+import threading
 import unittest
 import time
 from pathlib import Path
@@ -416,6 +418,1099 @@ class DDLGeneratorUnitTests(unittest.TestCase):
         ddl_timestamp = self.tool.create_table_ddl('TestSchema', 'TestTable', columns_timestamp)
         self.assertIn('PARTITION BY DATETIME_TRUNC(CreateDate, DAY)', ddl_timestamp, "TIMESTAMP 타입은 DATETIME으로 변환되어 DATETIME_TRUNC 파티션을 지원해야 함")
 
+    def test_default_row_fields_match_extract_query(self):
+        """기본 튜플 필드 순서가 추출 쿼리 옵션 1의 SELECT 컬럼 순서와 같은지 테스트"""
+        import re
+        from oracle_to_bq_cli import convert_rows, ConversionOptions, DEFAULT_ROW_FIELDS
+
+        query = (Path(__file__).parent.parent / 'oracle_extract_query.sql').read_text(encoding='utf-8')
+        option_1 = query.split('옵션 2:')[0]
+        select_list = option_1[option_1.index('SELECT'):option_1.index('FROM')]
+        select_list = re.sub(r'--[^\n]*', '', select_list)  # 주석 제거
+        select_list = re.sub(r'CASE.*?END', 'CASE', select_list, flags=re.S)
+        fields = []
+        for item in select_list[len('SELECT'):].split(','):
+            tokens = item.split()
+            fields.append(tokens[-1].split('.')[-1])
+        self.assertEqual(tuple(fields), DEFAULT_ROW_FIELDS)
+
+        # 옵션 1 순서의 튜플 행 (커서 결과처럼 필드명 없이)
+        values = {'TABLE_NAME': 'ORDERS', 'OWNER': 'S', 'COLUMN_NAME': 'ORDER_DATE', 'COLUMN_ID': '1',
+                  'DATA_TYPE': 'DATE', 'NULLABLE': 'N', 'IS_PRIMARY_KEY': 'N', 'PK_POSITION': '',
+                  'COLUMN_COMMENT': '주문일', 'PARTITION_YN': 'Y', 'CLUSTER_YN': 'N'}
+        row = tuple(values.get(name, '') for name in fields)
+        (_, ddl), = list(convert_rows([row], ConversionOptions(project_id='p')))
+        self.assertIn('PARTITION BY', ddl)
+        self.assertIn("description='주문일'", ddl.replace('"', "'"))
+
+    def test_convert_rows_streaming_api(self):
+        """스트리밍 라이브러리 API 테스트 (매핑/튜플 행, 지연 반환)"""
+        from oracle_to_bq_cli import convert_rows, ConversionOptions
+        
+        options = ConversionOptions(project_id='lib-project')
+        rows = [
+            {'OWNER': 'HR', 'TABLE_NAME': 'EMP', 'COLUMN_NAME': 'ID', 'DATA_TYPE': 'NUMBER',
+             'DATA_PRECISION': 10, 'DATA_SCALE': 0, 'NULLABLE': 'N', 'IS_PRIMARY_KEY': 'Y'},
+            {'owner': 'HR', 'table_name': 'EMP', 'column_name': 'NAME', 'data_type': 'VARCHAR2',
+             'data_precision': None, 'data_scale': None, 'nullable': 'Y'},
+            {'OWNER': 'HR', 'TABLE_NAME': 'DEPT', 'COLUMN_NAME': 'ID', 'DATA_TYPE': 'NUMBER',
+             'DATA_PRECISION': 4, 'DATA_SCALE': 0, 'NULLABLE': 'N'},
+        ]
+        
+        consumed = []
+        def source():
+            for row in rows:
+                consumed.append(row)
+                yield row
+        
+        results = convert_rows(source(), options)
+        table_key, ddl = next(results)
+        self.assertEqual(table_key, 'HR.EMP')
+        self.assertEqual(len(consumed), 3, "첫 테이블은 다음 테이블 행이 나오는 즉시 반환되어야 함")
+        self.assertIn('`lib-project.HR.EMP`', ddl)
+        self.assertIn('PRIMARY KEY (ID) NOT ENFORCED', ddl)
+        self.assertEqual([key for key, _ in results], ['HR.DEPT'])
+        
+        # 튜플 행 (필드명 지정)
+        tuple_rows = [('HR', 'EMP', 'ID', 'NUMBER', '10', '0', 'N')]
+        fieldnames = ['OWNER', 'TABLE_NAME', 'COLUMN_NAME', 'DATA_TYPE', 'DATA_PRECISION', 'DATA_SCALE', 'NULLABLE']
+        (_, tuple_ddl), = list(convert_rows(tuple_rows, options, fieldnames=fieldnames))
+        self.assertIn('ID INT64 NOT NULL', tuple_ddl)
+        
+        # 정렬되지 않은 입력은 오류
+        unsorted = rows + [rows[0]]
+        with self.assertRaises(ValueError):
+            list(convert_rows(unsorted, options))
+        
+        # 옵션 객체는 불변
+        with self.assertRaises(Exception):
+            options.project_id = 'other'
+    
+    def test_convert_rows_thread_safety(self):
+        """여러 스레드에서 서로 다른 옵션으로 동시에 변환 테스트"""
+        from concurrent.futures import ThreadPoolExecutor
+        from oracle_to_bq_cli import convert_rows, ConversionOptions
+        
+        rows = [
+            {'OWNER': 'S', 'TABLE_NAME': f'T{i:03d}', 'COLUMN_NAME': 'C', 'DATA_TYPE': 'VARCHAR2',
+             'DATA_LENGTH': '20', 'NULLABLE': 'Y'}
+            for i in range(200)
+        ]
+        
+        def run(index):
+            options = ConversionOptions(project_id=f'p{index}', preserve_string_length=(index % 2 == 0))
+            return index, list(convert_rows(rows, options))
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for index, results in executor.map(run, range(16)):
+                self.assertEqual(len(results), 200)
+                expected_type = 'STRING(20)' if index % 2 == 0 else 'STRING'
+                for _, ddl in results:
+                    self.assertIn(f'`p{index}.S.', ddl)
+                    self.assertIn(f'C {expected_type}', ddl)
+
+    def test_schema_watcher_incremental(self):
+        """감시 모드에서 변경된 테이블만 다시 변환하는지 테스트"""
+        from oracle_to_bq_cli import SchemaWatcher
+        
+        header = 'OWNER,TABLE_NAME,COLUMN_NAME,DATA_TYPE,DATA_PRECISION,DATA_SCALE,NULLABLE\n'
+        table_a = 'S,A,ID,NUMBER,10,0,N\n'
+        table_b = 'S,B,ID,NUMBER,10,0,N\n'
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            drop_dir = Path(temp_dir)
+            csv_file = drop_dir / 'export.csv'
+            csv_file.write_text(header + table_a + table_b, encoding='utf-8')
+            
+            watcher = SchemaWatcher(self.tool, drop_dir)
+            self.assertEqual(watcher.scan_once(), {csv_file: ['S.A', 'S.B']})
+            self.assertEqual(watcher.scan_once(), {}, "변경이 없으면 다시 변환하지 않아야 함")
+            
+            # 테이블 B만 변경
+            csv_file.write_text(header + table_a + 'S,B,ID,NUMBER,20,0,N\n', encoding='utf-8')
+            stat = csv_file.stat()
+            os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(watcher.scan_once(), {csv_file: ['S.B']})
+            
+            merged = (drop_dir / 'export.sql').read_text(encoding='utf-8')
+            self.assertIn('-- Total tables: 2', merged)
+            self.assertIn('NUMERIC(20, 0)', merged)
+            
+            # 0 이하 간격은 time.sleep 예외 대신 사용법 오류로 종료
+            cli = Path(__file__).parent / "windows" / "src" / "oracle_to_bq_cli.py"
+            result = subprocess.run([sys.executable, str(cli), 'watch', str(drop_dir), '--interval', '-1'],
+                                    capture_output=True, timeout=60)
+            self.assertEqual(result.returncode, 1)
+            self.assertIn('--interval은 0보다 큰 숫자', result.stdout.decode('utf-8'))
+            self.assertNotIn('Traceback', result.stderr.decode('utf-8'))
+
+    def test_json_schema_generation(self):
+        """bq JSON 스키마 생성 테스트"""
+        columns = [
+            {'column_name': 'ID', 'data_type': 'NUMBER', 'data_precision': '10', 'data_scale': '0',
+             'nullable': 'N', 'column_comment': '아이디'},
+            {'column_name': 'AMOUNT', 'data_type': 'NUMBER', 'data_precision': '15', 'data_scale': '2',
+             'nullable': 'Y', 'column_comment': ''},
+            {'column_name': 'NAME', 'data_type': 'VARCHAR2', 'data_precision': '', 'data_scale': '',
+             'char_length': '50', 'nullable': 'Y', 'column_comment': ''},
+        ]
+        self.tool.preserve_string_length = True
+        
+        schema = self.tool.create_table_json_schema(columns)
+        self.assertEqual(schema[0], {'name': 'ID', 'type': 'INT64', 'mode': 'REQUIRED', 'description': '아이디'})
+        self.assertEqual(schema[1], {'name': 'AMOUNT', 'type': 'NUMERIC', 'precision': '15', 'scale': '2', 'mode': 'NULLABLE'})
+        self.assertEqual(schema[2], {'name': 'NAME', 'type': 'STRING', 'maxLength': '50', 'mode': 'NULLABLE'})
+
+    def test_multi_emitter_output(self):
+        """한 번의 파싱으로 DDL, JSON 스키마, 컬럼 목록 동시 생성 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_file = Path(temp_dir) / 'schema.csv'
+            with open(input_file, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['OWNER', 'TABLE_NAME', 'COLUMN_NAME', 'DATA_TYPE', 'DATA_PRECISION',
+                                 'DATA_SCALE', 'DATA_LENGTH', 'NULLABLE', 'IS_PRIMARY_KEY'])
+                writer.writerow(['S', 'T', 'ID', 'NUMBER', '10', '0', '22', 'N', 'Y'])
+                writer.writerow(['S', 'T', 'AMOUNT', 'NUMBER', '15', '2', '22', 'Y', 'N'])
+
+            output_dir = Path(temp_dir) / 'out'
+            self.tool.output_filename = 'schema.sql'
+            self.tool.emitters = ['ddl', 'json-schema', 'inventory-csv']
+            self.assertTrue(self.tool.process_csv_file(input_file, output_dir))
+
+            ddl = (output_dir / 'schema.sql').read_text(encoding='utf-8')
+            self.assertIn('ID INT64 NOT NULL', ddl)
+            self.assertIn('AMOUNT NUMERIC(15, 2)', ddl)
+
+            schema = json.loads((output_dir / 'json_schema' / 'S_T.json').read_text(encoding='utf-8'))
+            self.assertEqual([field['type'] for field in schema], ['INT64', 'NUMERIC'])
+
+            with open(output_dir / 'schema_inventory.csv', encoding='utf-8', newline='') as f:
+                inventory = list(csv.DictReader(f))
+            self.assertEqual([row['BQ_COLUMN_TYPE'] for row in inventory], ['INT64', 'NUMERIC(15, 2)'])
+            self.assertEqual(inventory[0]['IS_PRIMARY_KEY'], 'Y')
+
+    def test_profile_fan_out(self):
+        """설정 파일 프로필별 출력 테스트 (한 번의 파싱, 프로필별 디렉토리)"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_file = Path(temp_dir) / 'schema.csv'
+            with open(input_file, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['OWNER', 'TABLE_NAME', 'COLUMN_NAME', 'DATA_TYPE', 'DATA_PRECISION',
+                                 'DATA_SCALE', 'DATA_LENGTH', 'NULLABLE'])
+                writer.writerow(['S', 'T', 'NAME', 'VARCHAR2', '', '', '50', 'Y'])
+
+            self.tool.profiles = {
+                'dev': {'project_id': 'my-dev'},
+                'prod': {'project_id': 'my-prod', 'string_mode': 'string_only', 'preserve_string_length': False},
+            }
+            self.tool.preserve_string_length = True
+            self.tool.output_filename = 'schema.sql'
+            output_dir = Path(temp_dir) / 'out'
+            self.assertTrue(self.tool.process_csv_file_profiles(input_file, output_dir, ['dev', 'prod']))
+
+            dev_ddl = (output_dir / 'dev' / 'schema.sql').read_text(encoding='utf-8')
+            prod_ddl = (output_dir / 'prod' / 'schema.sql').read_text(encoding='utf-8')
+            self.assertIn('`my-dev.S.T`', dev_ddl)
+            self.assertIn('NAME STRING(50)', dev_ddl)
+            self.assertIn('`my-prod.S.T`', prod_ddl)
+            self.assertIn('NAME STRING', prod_ddl)
+            self.assertNotIn('STRING(50)', prod_ddl)
+
+            self.tool.profiles['bad'] = {'unknown_key': 1}
+            with self.assertRaises(ValueError):
+                self.tool.profile_options('bad')
+
+    def test_ddl_sharding(self):
+        """병합 DDL의 크기/문장 수 기준 분할 및 매니페스트 테스트"""
+        columns = [{'column_name': 'ID', 'data_type': 'NUMBER', 'data_precision': '10', 'data_scale': '0',
+                    'nullable': 'N', 'is_primary_key': 'Y'}]
+        tables = {f"S.T{i}": {'schema_name': 'S', 'table_name': f"T{i}", 'columns': columns} for i in range(5)}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            self.tool.output_filename = 'schema.sql'
+            self.tool.max_statements = 2
+            self.tool.emit_outputs(tables, output_dir)
+
+            manifest = json.loads((output_dir / 'schema_manifest.json').read_text(encoding='utf-8'))
+            self.assertEqual([shard['tables'] for shard in manifest['shards']],
+                             [['S.T0', 'S.T1'], ['S.T2', 'S.T3'], ['S.T4']])
+            for shard in manifest['shards']:
+                content = (output_dir / shard['file']).read_bytes()
+                self.assertEqual(len(content), shard['bytes'])
+                self.assertEqual(content.decode('utf-8').count('CREATE TABLE'), len(shard['tables']))
+
+            # 바이트 제한: 모든 파일이 제한 이하이고 테이블 순서 유지
+            self.tool.max_statements = None
+            self.tool.max_script_bytes = 600
+            self.tool.emit_outputs(tables, output_dir)
+            manifest = json.loads((output_dir / 'schema_manifest.json').read_text(encoding='utf-8'))
+            self.assertGreater(len(manifest['shards']), 1)
+            self.assertTrue(all(shard['bytes'] <= 600 for shard in manifest['shards']))
+            self.assertEqual([key for shard in manifest['shards'] for key in shard['tables']], list(tables))
+
+    def test_ddl_apply_with_fake_client(self):
+        """DDL 동시 실행 테스트 (테이블별 순서, 재시도, 상태 파일로 재개)"""
+        from oracle_to_bq_cli import (BigQueryClientBase, DDLApplier, FakeBigQueryClient, TransientApplyError,
+                                      parse_ddl_statements)
+
+        class IncompleteClient(BigQueryClientBase):
+            pass
+
+        with self.assertRaises(TypeError):  # execute가 없으면 첫 문장이 아니라 생성 시점에 실패
+            IncompleteClient()
+
+        script = "\n".join([
+            "-- Oracle to BigQuery DDL Migration",
+            "",
+            "DROP TABLE IF EXISTS `p.S.A`;",
+            "",
+            "CREATE TABLE `p.S.A` (",
+            "  ID INT64",
+            ")",
+            ";",
+            "CREATE TABLE `p.S.B` (",
+            "  ID INT64",
+            ");",
+            "CREATE TABLE `p.T.C` (ID INT64);",
+        ])
+        statements = parse_ddl_statements(script)
+        self.assertEqual([s.table for s in statements], ['p.S.A', 'p.S.A', 'p.S.B', 'p.T.C'])
+        self.assertEqual([s.dataset for s in statements], ['S', 'S', 'S', 'T'])
+        self.assertEqual(len({s.statement_id for s in statements}), 4)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_file = Path(temp_dir) / 'state.json'
+            client = FakeBigQueryClient(failures={
+                'p.S.A': [TransientApplyError('rateLimitExceeded')],
+                'p.S.B': [RuntimeError('Access Denied')],
+            })
+            delays = []
+            applier = DDLApplier(client, max_workers=3, rate_per_dataset=100, max_retries=2,
+                                 state_file=state_file, sleep=delays.append)
+            with self.assertLogs('oracle_to_bq', level='ERROR') as logs:
+                totals = applier.run(statements)
+            self.assertEqual(totals, {'done': 3, 'skipped': 0, 'failed': 1, 'pending': 0})
+            self.assertEqual(logs.output, ['ERROR:oracle_to_bq:❌ p.S.B: Access Denied'])  # 실패는 로거로 (--quiet에서도 표시)
+            self.assertEqual(client.tables, {'p.S.A', 'p.T.C'})
+            self.assertIn(1.0, delays)  # 일시적 오류 후 백오프
+            # DROP이 CREATE보다 먼저 실행됨
+            a_statements = [sql for sql in client.executed if '`p.S.A`' in sql]
+            self.assertTrue(a_statements[0].startswith('DROP'))
+
+            # 같은 상태 파일로 다시 실행하면 실패한 문장만 실행
+            retry_client = FakeBigQueryClient()
+            totals = DDLApplier(retry_client, state_file=state_file, sleep=delays.append).run(statements)
+            self.assertEqual(totals, {'done': 1, 'skipped': 3, 'failed': 0, 'pending': 0})
+            self.assertEqual(retry_client.tables, {'p.S.B'})
+
+            # 실행이 끝나면 저널은 상태 파일로 합쳐짐
+            journal_file = Path(temp_dir) / 'state.json.journal'
+            self.assertFalse(journal_file.exists())
+            saved = json.loads(state_file.read_text(encoding='utf-8'))['statements']
+            self.assertEqual({entry['status'] for entry in saved.values()}, {'done'})
+
+            # 합치기 전에 중단된 실행의 저널도 다음 실행에서 읽음
+            state_file.unlink()
+            interrupted = DDLApplier(FakeBigQueryClient(), state_file=state_file)
+            interrupted.record(statements[3], 'done', 1)
+            interrupted.journal.close()
+            self.assertTrue(journal_file.exists())
+            resumed = DDLApplier(FakeBigQueryClient(), state_file=state_file)
+            self.assertEqual(resumed.state[statements[3].statement_id]['status'], 'done')
+
+    def test_batch_type_classification_matches_per_column(self):
+        """배치 타입 분류 결과가 컬럼별 convert_oracle_type과 정확히 같은지 비교"""
+        import itertools
+        from oracle_to_bq_cli import map_oracle_types_batch
+
+        values = [None, '', ' ', '0', '1', '9', '10', '18', '19', '29', '30', '38', '39', '76', '77',
+                  '-1', '-84', ' 12 ', 'abc', '5.5', '127', '99999999999999999999999']
+        types = ['NUMBER', 'number', 'NUMBER(10,2)', 'VARCHAR2', 'DATE', 'TIMESTAMP(6)', 'BLOB',
+                 'FLOAT', 'XMLTYPE']
+        cases = list(itertools.product(types, values, values))
+        oracle_types = [case[0] for case in cases]
+        precisions = [case[1] for case in cases]
+        scales = [case[2] for case in cases]
+        expected = [self.tool.convert_oracle_type(*case) for case in cases]
+
+        # NumPy 경로(설치된 경우)와 순수 Python 경로 모두 비교
+        for use_numpy in (True, False):
+            with self.subTest(use_numpy=use_numpy):
+                self.assertEqual(map_oracle_types_batch(oracle_types, precisions, scales, use_numpy), expected)
+
+        # 넓은 테이블(NumPy 설치 시 배치 경로)도 같은 결과
+        columns = [{'column_name': f"C{i}", 'data_type': t, 'data_precision': p, 'data_scale': s}
+                   for i, (t, p, s) in enumerate(cases)]
+        self.assertEqual([bq_type for bq_type, declared in self.tool.resolve_column_types(columns)], expected)
+
+    def test_table_plan(self):
+        """TablePlan 생성(타입, 식별자, 기본키, 파티션/클러스터)과 캐시 테스트"""
+        columns = [
+            {'column_name': '주문ID', 'data_type': 'NUMBER', 'data_precision': '10', 'data_scale': '0',
+             'nullable': 'N', 'is_primary_key': 'Y', 'cluster_yn': 'Y'},
+            {'column_name': 'ORDER_DATE', 'data_type': 'DATE', 'data_precision': '', 'data_scale': '',
+             'nullable': 'Y', 'partition_yn': 'Y', 'column_comment': '주문일'},
+        ]
+        self.tool.enable_partitioning = True
+        self.tool.enable_clustering = True
+
+        plan = self.tool.build_table_plan('S', 'ORDERS', columns)
+        self.assertEqual(plan.full_name, '`test-project.S.ORDERS`')
+        self.assertEqual([(c.identifier, c.bq_type) for c in plan.columns],
+                         [('`주문ID`', 'INT64'), ('ORDER_DATE', 'DATETIME')])
+        self.assertEqual(plan.primary_key, ('`주문ID`',))
+        self.assertEqual(plan.partition_column.name, 'ORDER_DATE')
+        self.assertEqual(plan.partition_clause, 'PARTITION BY DATETIME_TRUNC(ORDER_DATE, DAY)')
+        self.assertEqual(plan.cluster_clause, 'CLUSTER BY `주문ID`')
+
+        # 같은 입력과 옵션이면 캐시된 계획 재사용, 옵션이 바뀌면 다시 생성
+        self.assertIs(self.tool.build_table_plan('S', 'ORDERS', columns), plan)
+        self.tool.enable_clustering = False
+        self.assertIsNone(self.tool.build_table_plan('S', 'ORDERS', columns).cluster_clause)
+
+        # DDL과 JSON 스키마가 같은 계획을 사용
+        ddl = self.tool.render_table_ddl(plan)
+        self.assertIn('PARTITION BY DATETIME_TRUNC(ORDER_DATE, DAY)', ddl)
+        self.assertEqual(self.tool.render_json_schema(plan)[1],
+                         {'name': 'ORDER_DATE', 'type': 'DATETIME', 'mode': 'NULLABLE', 'description': '주문일'})
+
+    def test_integer_range_partition(self):
+        """컬럼 통계(LOW_VALUE/HIGH_VALUE RAW)로 정수 RANGE 파티션 생성 테스트"""
+        from decimal import Decimal
+        from oracle_to_bq_cli import decode_oracle_number, plan_integer_range
+
+        # Oracle NUMBER 내부 형식 (양수, 음수, 0, 소수, 무한대)
+        for raw, expected in [('80', Decimal(0)), ('C102', Decimal(1)), ('C20B', Decimal(1000)),
+                              ('C4150B0202', Decimal(20100101)), ('3D6466', Decimal(-100)),
+                              ('C10203', Decimal('1.02')), ('FF65', None), ('', None), ('XYZ', None)]:
+            with self.subTest(raw=raw):
+                self.assertEqual(decode_oracle_number(raw), expected)
+
+        # YYYYMMDD 키는 월 단위, 대리키는 버킷 수 제한 안에서 1/2/5 x 10^n 간격
+        self.assertEqual(plan_integer_range(Decimal(20100101), Decimal(20261231)), (20100100, 20293500, 100))
+        start, end, step = plan_integer_range(Decimal(1), Decimal(52000000), 52000000, max_buckets=4000)
+        self.assertEqual(step, 20000)
+        self.assertLessEqual((end - start) // step, 4000)
+        self.assertGreaterEqual(end, 52000001)
+        self.assertEqual(plan_integer_range(Decimal(1), Decimal(12), 12), (1, 15, 1))
+
+        columns = [
+            {'column_name': 'ORDER_ID', 'data_type': 'NUMBER', 'data_precision': '12', 'data_scale': '0',
+             'nullable': 'N', 'partition_yn': 'Y', 'low_value': 'C102', 'high_value': 'C406', 'num_distinct': '5000000'},
+        ]
+        self.tool.enable_partitioning = True
+        self.tool.partition_expiration_days = 30
+        ddl = self.tool.create_table_ddl('S', 'ORDERS', columns)
+        self.assertIn('PARTITION BY RANGE_BUCKET(ORDER_ID, GENERATE_ARRAY(0, 6002000, 2000))', ddl)
+        self.assertNotIn('partition_expiration_days', ddl)  # 정수 RANGE 파티션은 만료 미지원
+
+        # 통계가 없으면 파티션 없이 경고 요약에 기록
+        del columns[0]['low_value']
+        self.assertNotIn('PARTITION BY', self.tool.create_table_ddl('S', 'ORDERS2', columns))
+        self.assertIn('numeric_partition', self.tool.warning_summary.tables)
+
+    def test_partition_granularity_from_stats(self):
+        """테이블 크기와 날짜 범위 통계로 파티션 단위와 require_partition_filter 결정 테스트"""
+        from datetime import datetime
+        from oracle_to_bq_cli import decode_oracle_date, choose_partition_granularity
+
+        self.assertEqual(decode_oracle_date('787A0101010101'), datetime(2022, 1, 1))
+        self.assertEqual(decode_oracle_date('787E0C1F183C3C0BEBC200'), datetime(2026, 12, 31, 23, 59, 59, 200000))
+        self.assertIsNone(decode_oracle_date('C102'))
+
+        gb = 1024 ** 3
+        self.assertEqual(choose_partition_granularity(None, None, gb, gb), 'DAY')  # 통계 없음
+        self.assertIsNone(choose_partition_granularity(0.5 * gb, 3000, gb, gb))  # 작은 테이블
+        self.assertEqual(choose_partition_granularity(2000 * gb, 3650, gb, gb), 'MONTH')
+        self.assertEqual(choose_partition_granularity(50 * gb, 3650, gb, gb), 'YEAR')
+        self.assertEqual(choose_partition_granularity(None, 40000, gb, gb), 'MONTH')  # 파티션 수 제한
+
+        def columns(blocks):
+            # 2016-01-01 ~ 2025-12-31 (약 10년)
+            return [{'column_name': 'SALE_DATE', 'data_type': 'DATE', 'data_precision': '', 'data_scale': '',
+                     'nullable': 'N', 'partition_yn': 'Y', 'blocks': str(blocks),
+                     'low_value': '78740101010101', 'high_value': '787D0C1F010101'}]
+
+        self.tool.enable_partitioning = True
+        self.tool.partition_expiration_days = None
+        blocks_per_gb = 1024 ** 3 // 8192
+        ddl = self.tool.create_table_ddl('S', 'SALES', columns(2000 * blocks_per_gb))
+        self.assertIn('PARTITION BY DATETIME_TRUNC(SALE_DATE, MONTH)', ddl)
+        self.assertIn('OPTIONS(require_partition_filter=true)', ddl)
+        ddl = self.tool.create_table_ddl('S', 'SALES_SMALL', columns(5 * blocks_per_gb))
+        self.assertIn('PARTITION BY DATETIME_TRUNC(SALE_DATE, YEAR)', ddl)
+        self.assertNotIn('require_partition_filter', ddl)
+        self.assertNotIn('PARTITION BY', self.tool.create_table_ddl('S', 'SALES_TINY', columns(100)))
+
+    def test_cluster_recommendation(self):
+        """인덱스/통계 기반 클러스터 컬럼 추천과 선택 이유 보고서 테스트"""
+        def column(name, data_type='VARCHAR2', index_count='', leading='', position='', unique='', distinct='', **extra):
+            row = {'column_name': name, 'data_type': data_type, 'data_precision': '', 'data_scale': '',
+                   'nullable': 'Y', 'num_rows': '1000000', 'index_count': index_count, 'leading_index_count': leading,
+                   'min_index_position': position, 'unique_index_position': unique, 'num_distinct': distinct}
+            row.update(extra)
+            return row
+
+        columns = [
+            column('ORDER_ID', 'NUMBER', '1', '1', '1', '1', '1000000', is_primary_key='Y'),
+            column('CUST_ID', 'NUMBER', '2', '1', '1', '', '50000'),
+            column('STATUS', index_count='1', position='2', distinct='5'),
+            column('REGION', index_count='1', position='2', distinct='1'),  # 값이 하나뿐이면 제외
+            column('AMOUNT', 'FLOAT', '1', '1', '1', '', '900000'),  # 클러스터 불가 타입
+            column('MEMO', distinct='999999'),  # 인덱스 정보 없음
+            column('ORDER_DATE', 'DATE', '3', '3', '1', '', '3650', partition_yn='Y'),  # 파티션 컬럼 제외
+        ]
+        self.tool.enable_partitioning = True
+        self.tool.enable_clustering = True
+        self.tool.recommend_clustering = True
+        plan = self.tool.build_table_plan('S', 'ORDERS', columns)
+        self.assertEqual(plan.cluster_clause, 'CLUSTER BY CUST_ID, ORDER_ID, STATUS')
+        self.assertEqual(plan.cluster_source, 'recommended')
+        self.assertIn('선두 인덱스 컬럼 1개', dict(plan.cluster_reasons)['CUST_ID'])
+
+        # CLUSTER_YN 수동 지정이 있으면 추천하지 않음
+        columns = [dict(col) for col in columns]
+        columns[5]['cluster_yn'] = 'Y'
+        plan = self.tool.build_table_plan('S', 'ORDERS', columns)
+        self.assertEqual((plan.cluster_clause, plan.cluster_source), ('CLUSTER BY MEMO', 'manual'))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.tool.output_filename = 'schema.sql'
+            self.tool.emitters = ['cluster-report']
+            self.tool.emit_outputs({'S.ORDERS': {'schema_name': 'S', 'table_name': 'ORDERS', 'columns': columns}},
+                                   Path(temp_dir))
+            with open(Path(temp_dir) / 'schema_cluster_report.csv', encoding='utf-8', newline='') as f:
+                rows = list(csv.DictReader(f))
+        self.assertEqual([(row['CLUSTER_POSITION'], row['COLUMN_NAME'], row['SOURCE']) for row in rows],
+                         [('1', 'MEMO', 'manual')])
+
+    def test_oracle_partitioning_scheme(self):
+        """Oracle 파티션 방식(INTERVAL, LIST/HASH, 복합, 다중 키)의 BigQuery 파티션/클러스터 변환 테스트"""
+        from oracle_to_bq_cli import parse_oracle_interval
+
+        self.assertEqual(parse_oracle_interval("NUMTOYMINTERVAL(1,'MONTH')"), 'MONTH')
+        self.assertEqual(parse_oracle_interval("NUMTOYMINTERVAL(12, 'MONTH')"), 'YEAR')
+        self.assertEqual(parse_oracle_interval("NUMTOYMINTERVAL(3,'MONTH')"), 'MONTH')  # 분기는 월 단위로
+        self.assertEqual(parse_oracle_interval("NUMTODSINTERVAL(7,'DAY')"), 'DAY')
+        self.assertEqual(parse_oracle_interval("INTERVAL '1' HOUR"), 'HOUR')
+        self.assertEqual(parse_oracle_interval('1000000'), 1000000)
+        self.assertIsNone(parse_oracle_interval(''))
+
+        def column(name, data_type='VARCHAR2', **extra):
+            row = {'column_name': name, 'data_type': data_type, 'data_precision': '', 'data_scale': '',
+                   'nullable': 'N', 'partitioning_type': 'RANGE', 'subpartitioning_type': 'LIST',
+                   'partition_interval': "NUMTOYMINTERVAL(1,'MONTH')"}
+            row.update(extra)
+            return row
+
+        self.tool.enable_partitioning = True
+        self.tool.enable_clustering = True
+        self.tool.partition_expiration_days = None
+
+        # RANGE INTERVAL 월 단위 + LIST 서브파티션
+        columns = [column('SALE_DATE', 'DATE', partition_yn='Y', partition_key_position='1'),
+                   column('REGION', subpartition_key_position='1'),
+                   column('AMOUNT', 'NUMBER')]
+        plan = self.tool.build_table_plan('S', 'SALES', columns)
+        self.assertEqual(plan.partition_clause, 'PARTITION BY DATETIME_TRUNC(SALE_DATE, MONTH)')
+        self.assertEqual((plan.cluster_clause, plan.cluster_source), ('CLUSTER BY REGION', 'partitioning'))
+
+        # 다중 컬럼 RANGE 키: 첫 날짜 키만 파티션, 앞선 키는 클러스터
+        columns = [column('REGION', partition_yn='Y', partition_key_position='1', partition_interval=''),
+                   column('SALE_DATE', 'DATE', partition_yn='Y', partition_key_position='2', partition_interval='')]
+        plan = self.tool.build_table_plan('S', 'SALES_MULTI', columns)
+        self.assertEqual(plan.partition_column.name, 'SALE_DATE')
+        self.assertEqual(plan.cluster_clause, 'CLUSTER BY REGION')
+
+        # HASH 파티션은 클러스터로만, 숫자 INTERVAL은 같은 간격의 RANGE_BUCKET
+        columns = [column('CUST_ID', 'NUMBER', partition_yn='Y', partitioning_type='HASH', data_precision='10',
+                          data_scale='0')]
+        plan = self.tool.build_table_plan('S', 'CUSTOMERS', columns)
+        self.assertEqual((plan.partition_clause, plan.cluster_clause), (None, 'CLUSTER BY CUST_ID'))
+        # 클러스터를 지원하지 않는 타입(FLOAT64, BYTES)의 HASH/서브파티션 키는 생략하고 경고
+        columns = [column('K', 'FLOAT', partition_yn='Y', partitioning_type='HASH', subpartitioning_type='HASH'),
+                   column('R', 'RAW', partitioning_type='HASH', subpartitioning_type='HASH', subpartition_key_position='1'),
+                   column('C', partitioning_type='HASH', subpartitioning_type='HASH', subpartition_key_position='2')]
+        plan = self.tool.build_table_plan('S', 'HASHED', columns)
+        self.assertEqual((plan.partition_clause, plan.cluster_clause), (None, 'CLUSTER BY C'))
+        self.assertIn('S.HASHED', self.tool.warning_summary.tables['partition_scheme'])
+        columns = [column('ORDER_ID', 'NUMBER', partition_yn='Y', data_precision='10', data_scale='0',
+                          partition_interval='1000000', low_value='C102', high_value='C406')]
+        plan = self.tool.build_table_plan('S', 'ORDERS', columns)
+        self.assertEqual(plan.partition_clause,
+                         'PARTITION BY RANGE_BUCKET(ORDER_ID, GENERATE_ARRAY(0, 7000000, 1000000))')
+
+    def test_number_type_narrowing(self):
+        """샘플 값/통계 기반 NUMBER 타입 축소 (INT64, NUMERIC(P, S)) 테스트"""
+        from oracle_to_bq_cli import summarize_number_values, narrow_number_type
+
+        sample = summarize_number_values(['12', '', '-3', '99999'])
+        self.assertEqual((sample.min_value, sample.max_value, sample.max_scale, sample.count), (-3, 99999, 0, 3))
+        self.assertEqual(narrow_number_type(sample, 2), ('INT64', None, None))
+        self.assertEqual(narrow_number_type(summarize_number_values(['1.50', '1234.125']), 2), ('NUMERIC', 9, 3))
+        self.assertIsNone(narrow_number_type(summarize_number_values(['1.5']), 2, integer_only=True))
+        self.assertIsNone(summarize_number_values(['1', 'N/A']))  # 숫자가 아닌 값이 있으면 축소하지 않음
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sample_dir = Path(temp_dir)
+            with open(sample_dir / 'S.ORDERS.csv', 'w', encoding='utf-8') as f:
+                f.write("ORDER_ID,AMOUNT,BIG_ID,RATE\n1,10.5,123,0.125\n20000000,99.25,4567,0.5\n")
+            self.assertEqual(self.tool.load_type_samples(sample_dir), 4)
+
+            columns = [
+                {'column_name': 'ORDER_ID', 'data_type': 'NUMBER', 'data_precision': '', 'data_scale': '',
+                 'nullable': 'N', 'partition_yn': 'Y', 'low_value': 'C102', 'high_value': 'C415'},
+                {'column_name': 'AMOUNT', 'data_type': 'NUMBER', 'data_precision': '', 'data_scale': '', 'nullable': 'Y'},
+                {'column_name': 'BIG_ID', 'data_type': 'NUMBER', 'data_precision': '22', 'data_scale': '0',
+                 'nullable': 'Y'},
+                {'column_name': 'RATE', 'data_type': 'NUMBER', 'data_precision': '5', 'data_scale': '3',
+                 'nullable': 'Y'},  # 소수 자릿수가 선언되어 있으면 그대로
+            ]
+            self.tool.enable_partitioning = True
+            plan = self.tool.build_table_plan('S', 'ORDERS', columns)
+            self.assertEqual([(c.declared_type, c.narrowed_from) for c in plan.columns],
+                             [('INT64', 'NUMERIC'), ('NUMERIC(6, 2)', 'NUMERIC'), ('INT64', 'NUMERIC(22, 0)'),
+                              ('NUMERIC(5, 3)', '')])
+            # INT64로 축소된 파티션 키는 RANGE 파티션 대상
+            self.assertTrue(plan.partition_clause.startswith('PARTITION BY RANGE_BUCKET(ORDER_ID'))
+
+            # 미리 계산한 통계 CSV, 여유 자릿수 설정
+            stats_file = sample_dir / 'stats.csv'
+            with open(stats_file, 'w', encoding='utf-8') as f:
+                f.write("OWNER,TABLE_NAME,COLUMN_NAME,MIN_VALUE,MAX_VALUE,HAS_FRACTION,MAX_SCALE\n"
+                        "S,ORDERS,AMOUNT,0,99.25,Y,2\nS,ORDERS,ORDER_ID,1,99999999999999999,N,\n")
+            self.assertEqual(self.tool.load_type_samples(stats_file), 2)
+            plan = self.tool.build_table_plan('S', 'ORDERS', list(columns))
+            self.assertEqual([c.declared_type for c in plan.columns[:2]], ['NUMERIC(19, 0)', 'NUMERIC(6, 2)'])
+            self.tool.narrowing_margin_digits = 0
+            plan = self.tool.build_table_plan('S', 'ORDERS', list(columns))
+            self.assertEqual([c.declared_type for c in plan.columns[:2]], ['INT64', 'NUMERIC(4, 2)'])
+
+    def test_storage_estimate(self):
+        """NUM_ROWS/AVG_COL_LEN 통계 기반 논리 크기와 파티션별 스캔 크기 추정 테스트"""
+        from oracle_to_bq_cli import estimate_column_bytes
+
+        self.assertEqual(estimate_column_bytes('INT64', 1000, 100), (7200, 'stats'))
+        self.assertEqual(estimate_column_bytes('STRING', 1000, 0, 11), (12000, 'stats'))
+        self.assertEqual(estimate_column_bytes('STRING', 1000, None, None, 20), (22000, 'declared'))
+        self.assertEqual(estimate_column_bytes('STRING', None), (None, ''))
+
+        header = ('OWNER,TABLE_NAME,COLUMN_NAME,DATA_TYPE,DATA_PRECISION,DATA_SCALE,DATA_LENGTH,NULLABLE,'
+                  'PARTITION_YN,NUM_ROWS,NUM_NULLS,AVG_COL_LEN,LOW_VALUE,HIGH_VALUE,NUM_DISTINCT\n')
+        rows = [
+            # 2016-01-01 ~ 2025-12-31, 1억 행
+            'S,SALES,SALE_DATE,DATE,,,7,N,Y,100000000,0,8,78740101010101,787D0C1F010101,3653\n',
+            'S,SALES,MEMO,VARCHAR2,,,200,Y,N,100000000,50000000,41,,,\n',
+            'S,CODES,CODE,VARCHAR2,,,10,N,N,,,,,,\n',
+        ]
+        self.tool.enable_partitioning = True
+        self.tool.partition_expiration_days = None
+        with tempfile.TemporaryDirectory() as temp_dir:
+            schema_file = Path(temp_dir) / 'schema.csv'
+            with open(schema_file, 'w', encoding='utf-8') as f:
+                f.write(header + ''.join(rows))
+            report, columns_report = io.StringIO(), io.StringIO()
+            self.assertEqual(self.tool.write_estimate_report(schema_file, report, 'json', columns_report), 2)
+
+        sales, codes = json.loads(report.getvalue())
+        # DATETIME 8바이트 x 1억 + (41 + 1)바이트 x 5천만
+        self.assertEqual(sales['LOGICAL_BYTES'], 800000000 + 2100000000)
+        self.assertEqual((sales['PARTITION_UNIT'], sales['PARTITION_COUNT']), ('DAY', 3653))
+        self.assertEqual(sales['PARTITION_SCAN_BYTES'], 10 * 1024 ** 2)  # 파티션 하나는 최소 과금 크기
+        self.assertEqual((sales['FULL_SCAN_BYTES'], sales['BASIS']), (2900000000, 'stats'))
+        self.assertEqual((codes['LOGICAL_BYTES'], codes['BASIS']), (None, 'missing'))
+        self.assertEqual([row['LOGICAL_BYTES'] for row in json.loads(columns_report.getvalue())],
+                         [800000000, 2100000000, None])
+
+    def test_export_sql(self):
+        """BigQuery 타입에 맞춘 데이터 추출 SELECT와 NUM_ROWS 기반 ORA_HASH 청크 분할 테스트"""
+        from oracle_to_bq_cli import plan_export_chunks
+
+        self.assertEqual(plan_export_chunks(None), 1)
+        self.assertEqual(plan_export_chunks(12000000, 5000000, 64), 3)
+        self.assertEqual(plan_export_chunks(10 ** 12, 5000000, 64), 64)
+
+        def column(name, data_type, precision='', scale=''):
+            return {'column_name': name, 'data_type': data_type, 'data_precision': precision,
+                    'data_scale': scale, 'nullable': 'Y', 'num_rows': '12000000'}
+
+        columns = [
+            column('ID', 'NUMBER', '12', '0'),
+            column('AMOUNT', 'NUMBER', '38', '20'),
+            column('CREATED', 'DATE'),
+            column('UPDATED', 'TIMESTAMP(6) WITH TIME ZONE'),
+            column('TOKEN', 'RAW'),
+            column('memo', 'VARCHAR2'),
+        ]
+        plan = self.tool.build_table_plan('S', 'ORDERS', columns)
+        self.assertEqual(plan.columns[1].bq_type, 'BIGNUMERIC')
+        chunk_count, sql = self.tool.render_export_sql(plan)
+
+        self.assertEqual(chunk_count, 3)
+        self.assertIn("TO_CHAR(t.\"AMOUNT\", 'TM9', 'NLS_NUMERIC_CHARACTERS=''.,''') AS \"AMOUNT\"", sql)
+        self.assertIn("TO_CHAR(t.\"CREATED\", 'YYYY-MM-DD HH24:MI:SS') AS \"CREATED\"", sql)
+        self.assertIn("TO_CHAR(SYS_EXTRACT_UTC(t.\"UPDATED\"), 'YYYY-MM-DD HH24:MI:SS.FF6')", sql)
+        self.assertIn('RAWTOHEX(t."TOKEN") AS "TOKEN"', sql)
+        self.assertIn('  t."memo"\nFROM "S"."ORDERS" t', sql)
+        self.assertEqual([line for line in sql.splitlines() if line.startswith('WHERE')],
+                         [f"WHERE ORA_HASH(t.ROWID, 2) = {chunk};" for chunk in range(3)])
+
+    def test_transcode_data(self):
+        """데이터 CSV 값의 타입별 변환과 Parquet 행 그룹 단위 변환 테스트"""
+        from datetime import datetime
+        from decimal import Decimal
+        from oracle_to_bq_cli import parse_data_value
+
+        self.assertEqual(parse_data_value('1E+3', 'INT64'), 1000)
+        self.assertEqual(parse_data_value('-.5', 'NUMERIC', 10, 2), Decimal('-0.50'))
+        self.assertEqual(parse_data_value('12345678901234567.5', 'BIGNUMERIC', 38, 20),
+                         Decimal('12345678901234567.5'))
+        self.assertEqual(parse_data_value('2024-01-02 03:04:05.000001', 'DATETIME'),
+                         datetime(2024, 1, 2, 3, 4, 5, 1))
+        self.assertEqual(parse_data_value('DEADBEEF', 'BYTES'), b'\xde\xad\xbe\xef')
+        self.assertIsNone(parse_data_value('', 'INT64'))
+        for value, bq_type, precision, scale in (('1.5', 'INT64', None, None), ('1.234', 'NUMERIC', 10, 2),
+                                                 ('123456789', 'NUMERIC', 10, 2), ('abc', 'NUMERIC', None, None),
+                                                 ('2024-13-01', 'DATETIME', None, None), ('XZ', 'BYTES', None, None)):
+            with self.subTest(value=value, bq_type=bq_type):
+                with self.assertRaises(ValueError):
+                    parse_data_value(value, bq_type, precision, scale)
+
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest("pyarrow가 설치되어 있지 않음")
+
+        header = 'OWNER,TABLE_NAME,COLUMN_NAME,DATA_TYPE,DATA_PRECISION,DATA_SCALE,NULLABLE\n'
+        rows = [
+            'S,ORDERS,ID,NUMBER,10,0,N\n',
+            'S,ORDERS,AMOUNT,NUMBER,12,2,Y\n',
+            'S,ORDERS,ORDERED_AT,DATE,,,Y\n',
+            'S,ORDERS,BIG_ID,NUMBER,45,,Y\n',  # bq_type은 NUMERIC이지만 BIGNUMERIC(45)로 선언됨
+            'S,CODES,CODE,NUMBER,5,0,N\n',
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            schema_file = Path(temp_dir) / 'schema.csv'
+            schema_file.write_text(header + ''.join(rows), encoding='utf-8')
+            data_dir = Path(temp_dir) / 'data'
+            data_dir.mkdir()
+            (data_dir / 'S.ORDERS.csv').write_text(
+                'ID,AMOUNT,ORDERED_AT,BIG_ID\n1,12.5,2024-01-02 03:04:05,123456789012345678901234567890123456789012345\n'
+                '2,,,\n3,-0.25,2024-12-31 23:59:59,\n', encoding='utf-8')
+            (data_dir / 'CODES.csv').write_text('CODE\n1\n\n', encoding='utf-8')  # NOT NULL 위반
+            output_dir = Path(temp_dir) / 'out'
+
+            with self.assertLogs('oracle_to_bq', level='ERROR') as logs:
+                self.assertEqual(self.tool.transcode_tables(schema_file, data_dir, output_dir, 'parquet', 1, 2), (1, 1))
+            self.assertIn('S.CODES 데이터 변환 실패', logs.output[0])
+            self.assertFalse((output_dir / 'S_CODES.parquet').exists())  # 실패한 테이블은 파일을 남기지 않음
+            parquet = pq.ParquetFile(output_dir / 'S_ORDERS.parquet')
+            self.assertEqual(parquet.metadata.num_row_groups, 2)
+            self.assertEqual(str(parquet.schema_arrow.field('BIG_ID').type), 'decimal256(45, 0)')
+            self.assertEqual(parquet.read().to_pylist()[::2], [
+                {'ID': 1, 'AMOUNT': Decimal('12.50'), 'ORDERED_AT': datetime(2024, 1, 2, 3, 4, 5),
+                 'BIG_ID': Decimal('123456789012345678901234567890123456789012345')},
+                {'ID': 3, 'AMOUNT': Decimal('-0.25'), 'ORDERED_AT': datetime(2024, 12, 31, 23, 59, 59), 'BIG_ID': None},
+            ])
+
+    def test_validate_data(self):
+        """데이터 CSV 값을 생성된 타입/NOT NULL로 배치 검사하고 최대 오류 수에서 중단하는 테스트"""
+        from datetime import datetime, timezone
+        from oracle_to_bq_cli import check_value_batch, parse_data_value
+
+        self.assertEqual(check_value_batch(['1', '', '1.5', '1.5'], 'INT64', nullable=False),
+                         [(1, 'NOT NULL 컬럼에 빈 값'), (2, 'INT64 범위를 넘거나 정수가 아닌 값: 1.5'),
+                          (3, 'INT64 범위를 넘거나 정수가 아닌 값: 1.5')])
+        self.assertEqual(check_value_batch(['abc', ''], 'STRING'), [])
+        self.assertEqual([offset for offset, message in check_value_batch(['abc', 'abcd'], 'STRING', 3)], [1])
+        # BigQuery CSV 적재가 읽는 날짜/시각 형식만 허용 (시간대는 TIMESTAMP만)
+        accepted = {
+            'DATE': ['2024-01-01', '2024-1-1'],
+            'DATETIME': ['2024-01-01', '2024-01-01 10:00:00', '2024-01-01T10:00:00', '2024-01-01 10:00',
+                         '2024-01-01T10:00:00.5', '2024-01-01 9:05:07.123456'],
+            'TIMESTAMP': ['2024-01-01 10:00:00', '2024-01-01T10:00:00Z', '2024-01-01 10:00:00+09:00',
+                          '2024-01-01 10:00:00+09', '2024-01-01 10:00-08', '2024-01-01 10:00:00 UTC',
+                          '2024-01-01 10:00:00.25 +05:30'],
+        }
+        rejected = {
+            'DATE': ['20240101', '2024-01-01 10:00:00', '2024-02-30', '24-01-01'],
+            'DATETIME': ['20240101', '2024-01-01T10:00:00+09:00', '2024-01-01 10:00:00Z', '2024-01-01 10:00:00 UTC',
+                         '2024-01-01 10', '2024-01-01 25:00:00', '2024-01-01 10:00:00.1234567', '2024-01-01t10:00'],
+            'TIMESTAMP': ['2024-01-01 10:00:00+0900', '2024-01-01 10:00:00 KST', '2024-01-01 10:00:00+24:00'],
+        }
+        for bq_type in accepted:
+            with self.subTest(bq_type=bq_type):
+                self.assertEqual(check_value_batch(accepted[bq_type], bq_type), [])
+                self.assertEqual([offset for offset, message in check_value_batch(rejected[bq_type], bq_type)],
+                                 list(range(len(rejected[bq_type]))))
+        self.assertEqual(parse_data_value('2024-01-01 10:00+09', 'TIMESTAMP'),
+                         datetime(2024, 1, 1, 1, 0, tzinfo=timezone.utc))
+        # NumPy 마스크로 거른 결과와 값마다 해석한 결과가 같아야 함
+        values = ['1', '-12', '007', '1.5', '', ' 3', '12345678901234567890', '1\x00', 'abc', '-', '1.']
+        for bq_type, precision, scale in (('INT64', None, None), ('NUMERIC', 5, 2), ('BIGNUMERIC', None, None), ('STRING', 3, None)):
+            with self.subTest(bq_type=bq_type):
+                self.assertEqual(check_value_batch(values, bq_type, precision, scale, False, use_numpy=True),
+                                 check_value_batch(values, bq_type, precision, scale, False, use_numpy=False))
+
+        header = 'OWNER,TABLE_NAME,COLUMN_NAME,DATA_TYPE,DATA_PRECISION,DATA_SCALE,NULLABLE\n'
+        rows = [
+            'S,ORDERS,ID,NUMBER,10,0,N\n',
+            'S,ORDERS,AMOUNT,NUMBER,12,2,Y\n',
+            'S,ORDERS,ORDERED_AT,DATE,,,Y\n',
+        ]
+        data = ('ID,AMOUNT,ORDERED_AT\n'
+                '1,12.5,2024-01-02 03:04:05\n'
+                ',1.234,2024-02-30 00:00:00\n'
+                '3,0.5,2024-12-31\n'
+                '4,9.999,\n'
+                '5,x,\n')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            schema_file = Path(temp_dir) / 'schema.csv'
+            schema_file.write_text(header + ''.join(rows), encoding='utf-8')
+            data_file = Path(temp_dir) / 'orders.csv'
+            data_file.write_text(data, encoding='utf-8')
+
+            report = io.StringIO()
+            with self.assertLogs('oracle_to_bq', level='ERROR'):
+                self.assertEqual(self.tool.validate_data(schema_file, data_file, report, 'json', 0, 2), (1, 5))
+            errors = json.loads(report.getvalue())
+            self.assertEqual([(error['ROW_NUMBER'], error['COLUMN_NAME']) for error in errors],
+                             [(2, 'ID'), (2, 'AMOUNT'), (2, 'ORDERED_AT'), (4, 'AMOUNT'), (5, 'AMOUNT')])
+
+            # 최대 오류 수에 이르면 나머지 행은 검사하지 않음
+            report = io.StringIO()
+            with self.assertLogs('oracle_to_bq', level='ERROR'):
+                self.assertEqual(self.tool.validate_data(schema_file, data_file, report, 'json', 2, 2), (1, 2))
+            self.assertEqual(len(json.loads(report.getvalue())), 2)
+
+    def test_foreign_key_waves(self):
+        """외래키 NOT ENFORCED 생성, 웨이브 순서, 순환 참조 ALTER 분리 테스트"""
+        from oracle_to_bq_cli import plan_table_waves, parse_ddl_statements
+
+        def column(name, pk='', fk='', ref=''):
+            return {'column_name': name, 'data_type': 'NUMBER', 'data_precision': '10', 'data_scale': '0',
+                    'nullable': 'N', 'is_primary_key': 'Y' if pk else 'N', 'pk_constraint_name': pk,
+                    'fk_constraint_name': fk, 'referenced_constraint': ref}
+
+        tables = {
+            'S.LINE': {'schema_name': 'S', 'table_name': 'LINE',
+                       'columns': [column('ORDER_ID', fk='FK_LINE_ORD', ref='PK_ORDERS')]},
+            'S.ORDERS': {'schema_name': 'S', 'table_name': 'ORDERS',
+                         'columns': [column('ORDER_ID', pk='PK_ORDERS'),
+                                     column('CUST_ID', fk='FK_ORD_CUST', ref='PK_CUST')]},
+            'S.CUST': {'schema_name': 'S', 'table_name': 'CUST',
+                       'columns': [column('CUST_ID', pk='PK_CUST'),
+                                   column('LAST_ORDER_ID', fk='FK_CUST_LAST', ref='PK_ORDERS')]},
+            'S.AUDIT': {'schema_name': 'S', 'table_name': 'AUDIT',
+                        'columns': [column('LINE_ID', fk='FK_AUDIT_LINE', ref='PK_MISSING')]},
+        }
+        foreign_keys = self.tool.resolve_foreign_keys(tables)
+        self.assertNotIn('S.AUDIT', foreign_keys)  # 참조 제약조건을 찾을 수 없으면 건너뜀
+        self.assertEqual(foreign_keys['S.LINE'][0]['ref_columns'], ['ORDER_ID'])
+
+        waves, deferred = plan_table_waves(list(tables), foreign_keys)
+        self.assertEqual(waves, {'S.LINE': 2, 'S.ORDERS': 1, 'S.CUST': 1, 'S.AUDIT': 1})
+        self.assertEqual(sorted(fk['name'] for key, fk in deferred), ['FK_CUST_LAST', 'FK_ORD_CUST'])
+
+        # 다중 컬럼 외래키: 컬럼 순서가 달라도 ALL_CONS_COLUMNS.POSITION으로 짝을 맞춤
+        composite = {
+            'S.PAIR': {'schema_name': 'S', 'table_name': 'PAIR',
+                       'columns': [dict(column('A_ID', pk='PK_PAIR'), pk_position='1'),
+                                   dict(column('B_ID', pk='PK_PAIR'), pk_position='2')]},
+            'S.CHILD': {'schema_name': 'S', 'table_name': 'CHILD',
+                        'columns': [dict(column('A_ID', fk='FK_CHILD_PAIR', ref='PK_PAIR'), fk_position='2'),
+                                    dict(column('B_ID', fk='FK_CHILD_PAIR', ref='PK_PAIR'), fk_position='1')]},
+        }
+        resolved = self.tool.resolve_foreign_keys(composite)['S.CHILD'][0]
+        self.assertEqual(list(zip(resolved['columns'], resolved['ref_columns'])), [('B_ID', 'A_ID'), ('A_ID', 'B_ID')])
+        # 위치 정보가 없으면 경고 후 컬럼 순서로 짝지음
+        for col in composite['S.CHILD']['columns']:
+            col.pop('fk_position')
+        resolved = self.tool.resolve_foreign_keys(composite)['S.CHILD'][0]
+        self.assertEqual(resolved['ref_columns'], ['A_ID', 'B_ID'])
+        self.assertIn('S.CHILD', self.tool.warning_summary.tables['foreign_key_order'])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.tool.output_filename = 'schema.sql'
+            self.tool.emit_outputs(tables, Path(temp_dir))
+            ddl = (Path(temp_dir) / 'schema.sql').read_text(encoding='utf-8')
+
+        self.assertIn("CONSTRAINT FK_LINE_ORD FOREIGN KEY (ORDER_ID) REFERENCES `test-project.S.ORDERS`(ORDER_ID) NOT ENFORCED", ddl)
+        self.assertIn("ALTER TABLE `test-project.S.ORDERS` ADD CONSTRAINT FK_ORD_CUST FOREIGN KEY", ddl)
+        statements = parse_ddl_statements(ddl)
+        # 참조되는 테이블 생성 -> 참조하는 테이블 생성 -> 순환 외래키 추가
+        self.assertEqual([(s.wave, s.table) for s in statements], [
+            (1, 'test-project.S.ORDERS'), (1, 'test-project.S.CUST'), (1, 'test-project.S.AUDIT'),
+            (2, 'test-project.S.LINE'), (3, 'test-project.S.ORDERS'), (3, 'test-project.S.CUST'),
+        ])
+
+    def test_warning_summary_logging(self):
+        """테이블별 경고를 요약으로 모으고 --quiet/로그 파일 설정을 따르는지 테스트"""
+        import io
+        from contextlib import redirect_stdout
+        from oracle_to_bq_cli import configure_logging, logger
+
+        def columns(data_type, pk_count=1):
+            return [{'column_name': f"C{i}", 'data_type': data_type, 'data_precision': '', 'data_scale': '', 'nullable': 'N',
+                     'is_primary_key': 'Y', 'partition_yn': 'Y' if i == 0 else 'N'} for i in range(pk_count)]
+
+        self.tool.enable_partitioning = True
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / 'convert.log'
+            output = io.StringIO()
+            try:
+                with redirect_stdout(output):
+                    configure_logging(quiet=True, log_file=str(log_file))
+                    for name in ('T1', 'T2'):
+                        self.tool.build_table_plan('S', name, columns('VARCHAR2', pk_count=17))
+                    self.tool.build_table_plan('S', 'T3', columns('NUMBER'))
+                    self.tool.report_warnings()
+            finally:
+                configure_logging()
+            log_text = log_file.read_text(encoding='utf-8')
+
+        # 콘솔에는 테이블별 메시지 없이 종류별 요약만 출력
+        console = output.getvalue()
+        self.assertNotIn('DEBUG', console)
+        self.assertIn('기본키 컬럼 16개 초과 (처음 16개만 사용): 2개 테이블 (S.T1, S.T2)', console)
+        self.assertIn('숫자 타입 파티션 컬럼 (INT64가 아니거나 범위 통계가 없어 파티션 생략): 1개 테이블 (S.T3)', console)
+        # 로그 파일에는 테이블별 자세한 내용까지 기록
+        self.assertIn('DEBUG S.T1: 기본키 컬럼이 17개입니다.', log_text)
+        self.assertEqual(self.tool.warning_summary.render(), [])
+        self.assertEqual(len(logger.handlers), 1)
+        # 다음 테스트의 로그가 콘솔로 새지 않도록 설정 전 상태(핸들러 없음)로 되돌림
+        handler, = logger.handlers
+        logger.removeHandler(handler)
+        handler.close()
+
+    def test_progress_reporter(self):
+        """진행 상황 표시 (바이트 진행률, 행 속도, 남은 시간, 터미널이 아니면 꺼짐) 테스트"""
+        import io
+        from oracle_to_bq_cli import ProgressReporter
+
+        now = [100.0]
+        progress = ProgressReporter(stream=io.StringIO(), enabled=False, clock=lambda: now[0])
+        self.assertFalse(ProgressReporter(stream=io.StringIO()).enabled)  # 터미널이 아니면 자동으로 꺼짐
+
+        progress.start('파싱', total_bytes=4 * 1024 * 1024)
+        progress.bytes_read = 1024 * 1024
+        progress.rows = 5000
+        progress.tables = 3
+        now[0] += 10
+        self.assertEqual(progress.render(),
+                         '파싱 | 25.0% 1.0MB/4.0MB | 5,000행 (500행/초) | 테이블 3개 | 남은 시간 00:00:30')
+
+        # 변환 중 읽은 바이트와 행, 테이블 수를 셈
+        csv_file = Path(tempfile.mkdtemp()) / 'schema.csv'
+        try:
+            csv_file.write_text("OWNER,TABLE_NAME,COLUMN_NAME,DATA_TYPE,NULLABLE\n"
+                                "S,A,ID,NUMBER,N\nS,A,NAME,VARCHAR2,Y\nS,B,ID,NUMBER,N\n", encoding='utf-8')
+            progress.enabled = True
+            progress.interval = 60
+            self.tool.progress = progress
+            tables, schemas = self.tool.read_schema_tables(csv_file)
+            progress.stop()
+            self.assertEqual((progress.bytes_read, progress.total_bytes), (csv_file.stat().st_size,) * 2)
+            self.assertEqual((progress.rows, progress.tables), (3, 2))
+        finally:
+            shutil.rmtree(csv_file.parent)
+
+        # 진행 줄이 표시 중일 때 콘솔 로그는 줄을 지운 뒤 출력 (진행 줄 뒤에 이어 붙지 않음)
+        from contextlib import redirect_stdout
+        from oracle_to_bq_cli import configure_logging, logger
+        console = io.StringIO()
+        progress = ProgressReporter(stream=console, interval=60, enabled=True, clock=lambda: now[0])
+        progress.start('파싱')
+        try:
+            with redirect_stdout(console):
+                configure_logging()
+                progress.draw()
+                logger.warning('⚠️ 압축 파일은 색인을 사용할 수 없어 전체를 읽습니다.')
+        finally:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+            progress.stop()
+        line = progress.render()
+        self.assertEqual(console.getvalue(), '\r' + line + '\r' + ' ' * len(line) + '\r'
+                         + '⚠️ 압축 파일은 색인을 사용할 수 없어 전체를 읽습니다.\n')
+
+    def test_conversion_http_service(self):
+        """로컬 HTTP 변환 서비스 테스트 (DDL, JSON 스키마, 비교, 메트릭)"""
+        import urllib.request
+        import urllib.error
+        from oracle_to_bq_cli import ConversionHTTPServer, ConversionService, ConversionOptions, IDENTIFIER_CACHE_SIZE
+        
+        server = ConversionHTTPServer(('127.0.0.1', 0), ConversionService(ConversionOptions(project_id='svc')), max_workers=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        
+        def post(payload):
+            request = urllib.request.Request(base_url + '/convert', data=json.dumps(payload).encode('utf-8'),
+                                             headers={'Content-Type': 'application/json'})
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return json.loads(response.read().decode('utf-8'))
+        
+        rows = [{'OWNER': 'S', 'TABLE_NAME': 'T', 'COLUMN_NAME': 'ID', 'DATA_TYPE': 'NUMBER',
+                 'DATA_PRECISION': '10', 'DATA_SCALE': '0', 'NULLABLE': 'N'}]
+        try:
+            ddl_result = post({'rows': rows})
+            self.assertIn('`svc.S.T`', ddl_result['tables'][0]['ddl'])
+            
+            override_result = post({'rows': rows, 'options': {'project_id': 'other'}})
+            self.assertIn('`other.S.T`', override_result['tables'][0]['ddl'])
+            
+            schema_result = post({'rows': rows, 'format': 'json-schema'})
+            self.assertEqual(schema_result['tables'][0]['schema'][0]['type'], 'INT64')
+            
+            changed_rows = [dict(rows[0], DATA_PRECISION='20')]
+            diff_result = post({'rows': changed_rows, 'base_rows': rows, 'format': 'diff'})
+            self.assertEqual(diff_result['changed'], ['S.T'])
+            self.assertIn('+  ID NUMERIC(20, 0) NOT NULL', diff_result['diff'])
+            
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                post({'rows': rows, 'options': {'no_such_option': True}})
+            self.assertEqual(context.exception.code, 400)
+            
+            with urllib.request.urlopen(base_url + '/metrics', timeout=10) as response:
+                metrics = response.read().decode('utf-8')
+            self.assertIn('oracle_to_bq_request_seconds_count{endpoint="/convert",status="200"} 4', metrics)
+            self.assertIn('oracle_to_bq_cache_hits{cache="type_mapping"}', metrics)
+            self.assertIn('oracle_to_bq_cache_hit_ratio{cache="type_mapping"}', metrics)
+            self.assertIn(f'oracle_to_bq_cache_max_entries{{cache="identifier"}} {IDENTIFIER_CACHE_SIZE}', metrics)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_stdin_stdout_streaming(self):
+        """표준 입력/출력 파이프라인 테스트 (상태 메시지는 표준 에러로)"""
+        cli = Path(__file__).parent / "windows" / "src" / "oracle_to_bq_cli.py"
+        csv_text = (
+            'OWNER,TABLE_NAME,COLUMN_NAME,DATA_TYPE,DATA_PRECISION,DATA_SCALE,NULLABLE\n'
+            'S,고객,ID,NUMBER,10,0,N\n'
+            'S,주문,ID,NUMBER,10,0,N\n'
+        )
+        
+        result = subprocess.run(
+            [sys.executable, str(cli), 'convert', '-', '--project-id', 'pipe'],
+            input=csv_text.encode('euc-kr'), capture_output=True, timeout=60
+        )
+        self.assertEqual(result.returncode, 0, result.stderr.decode('utf-8', errors='ignore'))
+        stdout = result.stdout.decode('utf-8')
+        self.assertTrue(stdout.startswith('-- Oracle to BigQuery DDL Migration'), "표준 출력에는 DDL만 있어야 함")
+        self.assertIn('`pipe.S.고객`', stdout)
+        self.assertIn('`pipe.S.주문`', stdout)
+        self.assertIn('euc-kr', result.stderr.decode('utf-8'))
+    
+    def test_peek_stream(self):
+        """되감을 수 없는 스트림의 앞부분 확인 후 처음부터 다시 읽기 테스트"""
+        import io
+        from oracle_to_bq_cli import peek_stream
+        
+        prefix, stream = peek_stream(io.BytesIO(b'0123456789' * 1000), 16)
+        self.assertEqual(prefix, b'0123456789012345')
+        self.assertEqual(stream.read(), b'0123456789' * 1000)
+
+    def test_compressed_input(self):
+        """gzip/bz2/xz 압축 입력을 매직 바이트로 감지하여 스트리밍 처리하는지 테스트"""
+        import bz2
+        import gzip
+        import lzma
+        
+        csv_bytes = ('OWNER,TABLE_NAME,COLUMN_NAME,DATA_TYPE,DATA_PRECISION,DATA_SCALE,NULLABLE\n'
+                     'S,고객,ID,NUMBER,10,0,N\n').encode('euc-kr')
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name, compress in (('schema.csv.gz', gzip.compress),
+                                   ('schema.csv.bz2', bz2.compress),
+                                   ('schema.dat', lzma.compress)):  # 확장자와 무관하게 내용으로 감지
+                with self.subTest(name=name):
+                    input_file = Path(temp_dir) / name
+                    input_file.write_bytes(compress(csv_bytes))
+                    
+                    self.assertEqual(self.tool.detect_encoding(input_file), 'euc-kr')
+                    output_dir = Path(temp_dir) / 'out'
+                    self.assertTrue(self.tool.process_csv_file(input_file, output_dir))
+                    merged = (output_dir / self.tool.output_filename).read_text(encoding='utf-8')
+                    self.assertIn('`test-project.S.고객`', merged)
+        
+        from oracle_to_bq_cli import schema_output_stem
+        self.assertEqual(schema_output_stem(Path('schema.csv.gz')), 'schema')
+        self.assertEqual(schema_output_stem(Path('schema.csv')), 'schema')
+
+    def test_table_offset_index(self):
+        """테이블 오프셋 색인으로 선택한 테이블만 읽는지 테스트 (따옴표 안 줄바꿈, 원본 변경 시 무효화)"""
+        from oracle_to_bq_cli import TableOffsetIndex
+        
+        csv_text = (
+            'OWNER,TABLE_NAME,COLUMN_NAME,DATA_TYPE,DATA_PRECISION,DATA_SCALE,NULLABLE,COLUMN_COMMENT\r\n'
+            'S,A,ID,NUMBER,10,0,N,"여러 줄\r\n코멘트, 쉼표 포함"\r\n'
+            'S,B,ID,NUMBER,10,0,N,\r\n'
+            'S,B,NAME,VARCHAR2,,,Y,"따옴표 ""포함"""\r\n'
+            'T,A,ID,NUMBER,5,0,N,\r\n'
+        )
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_file = Path(temp_dir) / 'schema.csv'
+            input_file.write_bytes(csv_text.encode('utf-8'))
+            
+            index = TableOffsetIndex.build(input_file, 'utf-8')
+            index.save()
+            self.assertEqual(list(index.tables), ['S.A', 'S.B', 'T.A'])
+            self.assertEqual(len(index.tables['S.B']), 1, "연속된 레코드는 한 범위로 합쳐져야 함")
+            self.assertEqual(index.select(['A']), ['S.A', 'T.A'])
+            
+            # 색인으로 읽은 결과가 전체 읽기 결과와 같아야 함
+            with self.tool.open_schema_input(input_file) as f:
+                full_tables, _ = self.tool.group_rows(csv.DictReader(f))
+            self.tool.table_filter = ['S.B', 'S.A']
+            selected, schemas = self.tool.read_schema_tables(input_file)
+            self.assertEqual(list(selected), ['S.A', 'S.B'])
+            self.assertEqual(selected['S.A'], full_tables['S.A'])
+            self.assertEqual(selected['S.B'], full_tables['S.B'])
+            self.assertEqual(schemas, {'S'})
+            
+            # 원본이 바뀌면 색인은 무효
+            self.assertIsNotNone(TableOffsetIndex.load(input_file))
+            with open(input_file, 'ab') as f:
+                f.write(b'U,C,ID,NUMBER,5,0,N,\r\n')
+            self.assertIsNone(TableOffsetIndex.load(input_file))
+            self.tool.table_filter = ['C']
+            selected, _ = self.tool.read_schema_tables(input_file)
+            self.assertEqual(list(selected), ['U.C'])
+
+    def test_parallel_chunked_parsing(self):
+        """병렬 청크 파싱 결과가 순차 파싱과 정확히 같은지 테스트 (청크에 걸친 테이블, 따옴표 안 줄바꿈)"""
+        from oracle_to_bq_cli import plan_csv_chunks
+        
+        lines = ['OWNER,TABLE_NAME,COLUMN_NAME,DATA_TYPE,DATA_PRECISION,DATA_SCALE,NULLABLE,COLUMN_COMMENT,DATA_DEFAULT']
+        for table in range(40):
+            # 테이블 하나는 청크 경계 탐색 범위보다 커서 반드시 청크에 걸치도록 함
+            column_count = 2500 if table == 7 else 30
+            for column in range(column_count):
+                comment = f'"긴 설명 {table}-{column}\n두 번째 줄, ""인용"""' if column % 3 == 0 else ''
+                lines.append(f'OWN,T{table:03d},C{column:04d},NUMBER,{column % 30 + 1},0,Y,{comment},"SYSDATE\n"')
+        # 정렬되지 않은 행도 순차 파싱과 같은 순서로 합쳐져야 함
+        lines.append('OWN,T000,EXTRA,VARCHAR2,,,Y,,')
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_file = Path(temp_dir) / 'schema.csv'
+            input_file.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+            
+            with self.tool.open_schema_input(input_file) as f:
+                serial = self.tool.group_rows(csv.DictReader(f))
+            
+            fieldnames, chunks = plan_csv_chunks(input_file, 'utf-8', 6, min_chunk_bytes=1024)
+            self.assertEqual(len(chunks), 6)
+            self.assertEqual(fieldnames[0], 'OWNER')
+            
+            parallel = self.tool.parse_csv_parallel(input_file, 6, min_chunk_bytes=1024)
+            self.assertIsNotNone(parallel)
+            self.assertEqual(list(parallel[0]), list(serial[0]))
+            self.assertEqual(parallel, serial)
+
 
 class WindowsPortableTestSuite:
     """Windows 포터블 버전 통합 테스트 스위트"""
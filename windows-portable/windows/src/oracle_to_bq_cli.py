@@ -4,20 +4,1222 @@ Oracle to BigQuery Migration Tool - Simplified CLI for Portable Version
 pandas 의존성 없이 작동하는 간단한 버전
 """
 
+import io
+import os
+import bz2
+import gzip
+import lzma
+import mmap
 import sys
 import csv
 import json
+import time
+import codecs
+import hashlib
 import argparse
+import re
+import difflib
+import logging
+import logging.handlers
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timedelta, timezone
+from decimal import Context, Decimal, ROUND_CEILING, ROUND_FLOOR
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Mapping, Sequence, Tuple, Union
+
+# 인코딩 감지에 사용할 입력 앞부분 크기 (바이트)
+ENCODING_SAMPLE_BYTES = 8192
+
+# 압축 형식별 매직 바이트 (확장자가 아닌 내용으로 판단)
+COMPRESSION_MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+
+# 출력 파일명을 정할 때 떼어낼 압축 확장자
+COMPRESSION_SUFFIXES = ('.gz', '.bz2', '.xz', '.zst')
+
+# 병렬 파싱 시 청크당 최소 크기 (이보다 작은 입력은 순차 파싱이 더 빠름)
+PARALLEL_MIN_CHUNK_BYTES = 4 * 1024 * 1024
+
+# 청크 경계를 테이블 경계로 옮길 때 앞으로 살펴볼 최대 레코드 수
+CHUNK_TABLE_LOOKAHEAD = 2000
+
+# 추출 쿼리(oracle_extract_query.sql 옵션 1)의 컬럼 순서
+# 튜플 형태의 행(DB 커서 결과 등)을 받을 때 기본 필드명으로 사용
+DEFAULT_ROW_FIELDS = (
+    'TABLE_NAME', 'OWNER', 'COLUMN_NAME', 'COLUMN_ID', 'DATA_TYPE', 'DATA_LENGTH',
+    'DATA_PRECISION', 'DATA_SCALE', 'NULLABLE', 'DATA_DEFAULT', 'IS_PRIMARY_KEY',
+    'PK_CONSTRAINT_NAME', 'FK_CONSTRAINT_TYPE', 'FK_CONSTRAINT_NAME', 'REFERENCED_CONSTRAINT',
+    'UK_CONSTRAINT_TYPE', 'UK_CONSTRAINT_NAME', 'PK_POSITION', 'FK_POSITION', 'UK_POSITION',
+    'CK_CONSTRAINT_TYPE', 'CK_CONSTRAINT_NAME',
+    'SEARCH_CONDITION', 'TABLE_COMMENT', 'COLUMN_COMMENT', 'PARTITION_YN', 'CLUSTER_YN'
+)
+
+# 컬럼 수가 이 이상인 테이블은 NUMBER 타입을 NumPy 배열 단위로 한 번에 분류 (map_oracle_types_batch)
+BATCH_CLASSIFY_MIN_COLUMNS = 256
+
+# 배치 분류에서 비어 있거나 숫자가 아닌 정밀도/스케일 표시 (array('q') 범위 안의 값)
+MISSING_NUMBER = -(2 ** 62)
+
+# 도구별로 보관할 테이블 계획(TablePlan) 최대 개수
+PLAN_CACHE_SIZE = 1024
+
+# 프로세스 전체에서 공유하는 타입 매핑/식별자 캐시의 최대 항목 수 (serve 장시간 실행 시 메모리 상한)
+TYPE_CACHE_SIZE = 4096
+IDENTIFIER_CACHE_SIZE = 16384
+
+# 정수 RANGE 파티션 기본 최대 버킷 수 (BigQuery 작업 하나가 수정할 수 있는 파티션 수 4,000 기준)
+RANGE_PARTITION_MAX_BUCKETS = 4000
+
+# BigQuery 테이블당 최대 파티션 수 (max_range_partitions 설정의 상한)
+BIGQUERY_MAX_PARTITIONS = 10000
+
+# 통계 수집 이후 늘어날 값을 위해 파티션 범위를 통계 범위보다 늘려 잡는 비율 (RANGE 버킷, 날짜 파티션 수)
+RANGE_PARTITION_HEADROOM = 0.2
+
+# 날짜 파티션 단위별 평균 일수 (통계의 날짜 범위로 파티션 수를 계산할 때 사용)
+PARTITION_GRANULARITY_DAYS = OrderedDict([('HOUR', 1 / 24), ('DAY', 1.0), ('MONTH', 30.44), ('YEAR', 365.25)])
+
+# BigQuery 날짜 파티션 컬럼 타입
+TIME_PARTITION_TYPES = ('DATE', 'TIMESTAMP', 'DATETIME')
+
+# 통계 기반 날짜 파티션 기본값 (GB 단위, 테이블 크기는 BLOCKS x oracle_block_size)
+PARTITION_MIN_TABLE_GB = 1.0  # 이보다 작은 테이블은 파티션하지 않음
+PARTITION_TARGET_GB = 1.0  # 파티션당 평균 크기가 이보다 작아지지 않는 가장 작은 단위 선택
+REQUIRE_PARTITION_FILTER_GB = 10.0  # 이보다 큰 테이블은 require_partition_filter=true
+
+# Oracle 기본 블록 크기 (바이트)
+ORACLE_BLOCK_SIZE = 8192
+
+# 샘플 기반 NUMBER 타입 축소 시 샘플 최댓값의 정수 자릿수에 더하는 여유 자릿수
+NARROWING_MARGIN_DIGITS = 2
+
+# INT64로 축소할 수 있는 최대 정수 자릿수 (INT64 최댓값은 19자리)
+INT64_SAFE_DIGITS = 18
+
+# 데이터 추출 SELECT 청크 기본값 (청크 수 = NUM_ROWS / 청크당 행 수, 최대 청크 수까지)
+EXPORT_ROWS_PER_CHUNK = 5000000
+EXPORT_MAX_CHUNKS = 64
+
+# 데이터 추출 SELECT의 값 형식 (BigQuery CSV 로드가 그대로 읽는 형식)
+EXPORT_NUMBER_TYPES = frozenset({'NUMBER', 'FLOAT', 'INTEGER', 'DECIMAL', 'BINARY_FLOAT', 'BINARY_DOUBLE'})
+EXPORT_NUMBER_FORMAT = "'TM9', 'NLS_NUMERIC_CHARACTERS=''.,'''"  # 지수 표기/자릿수 자름 없이 전체 자릿수
+EXPORT_DATE_FORMAT = 'YYYY-MM-DD'
+EXPORT_DATETIME_FORMAT = 'YYYY-MM-DD HH24:MI:SS'
+EXPORT_TIMESTAMP_FORMAT = 'YYYY-MM-DD HH24:MI:SS.FF6'  # BigQuery DATETIME 정밀도 (마이크로초)
+
+# BigQuery INT64 범위
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+# 변환이 끝난 뒤 요약으로 모아 보고하는 경고 종류
+WARNING_CATEGORIES = OrderedDict([
+    ('primary_key_limit', '기본키 컬럼 16개 초과 (처음 16개만 사용)'),
+    ('numeric_partition', '숫자 타입 파티션 컬럼 (INT64가 아니거나 범위 통계가 없어 파티션 생략)'),
+    ('small_table_partition', '작거나 파티션 수 제한을 넘는 테이블 (통계 기준, 파티션 생략)'),
+    ('unsupported_partition', '파티션을 지원하지 않는 타입 (파티션 생략)'),
+    ('partition_scheme', 'BigQuery에 없는 Oracle 파티션 방식 (HASH/LIST/다중 키, 클러스터로 대체, 클러스터 불가 타입 키는 생략)'),
+    ('unresolved_foreign_key', '참조 제약조건을 찾을 수 없는 외래키 (생략)'),
+    ('foreign_key_order', '제약조건 컬럼 위치(POSITION)가 없는 다중 컬럼 외래키 (컬럼 순서로 짝지음)'),
+    ('missing_data_file', '데이터 파일을 찾을 수 없는 테이블 (transcode 생략)'),
+    ('oversized_shard', '분할 제한보다 큰 테이블 DDL (단독 파일로 생성)'),
+])
+
+# 로그 파일에 쓰기 전에 메모리에 모아 둘 최대 레코드 수
+LOG_BUFFER_RECORDS = 1000
+
+# 진행 상황 표시 갱신 간격 (초, 행마다가 아니라 타이머로 갱신)
+PROGRESS_INTERVAL_SECONDS = 0.5
+
+# BigQuery 테이블당 최대 클러스터 컬럼 수
+MAX_CLUSTER_COLUMNS = 4
+
+# BigQuery 클러스터 컬럼으로 사용할 수 있는 타입
+CLUSTERABLE_TYPES = frozenset({
+    'STRING', 'INT64', 'NUMERIC', 'BIGNUMERIC', 'DATE', 'DATETIME', 'TIMESTAMP', 'BOOL', 'GEOGRAPHY'
+})
+
+# convert --emit 으로 선택할 수 있는 출력 형식
+EMITTERS = ('ddl', 'json-schema', 'inventory-csv', 'cluster-report', 'export-sql')
+
+# 컬럼 목록(inventory-csv) 출력 헤더
+INVENTORY_FIELDS = (
+    'OWNER', 'TABLE_NAME', 'COLUMN_NAME', 'ORACLE_TYPE', 'DATA_PRECISION', 'DATA_SCALE',
+    'CHAR_LENGTH', 'NULLABLE', 'IS_PRIMARY_KEY', 'PARTITION_YN', 'CLUSTER_YN',
+    'BQ_TYPE', 'BQ_COLUMN_TYPE', 'COLUMN_COMMENT'
+)
+
+# 클러스터 선택 이유(cluster-report) 출력 헤더
+CLUSTER_REPORT_FIELDS = ('OWNER', 'TABLE_NAME', 'CLUSTER_POSITION', 'COLUMN_NAME', 'SOURCE', 'REASON')
+
+# BigQuery 타입별 값 하나의 논리 크기 (바이트, 여기 없는 STRING/BYTES 등은 2 + 값 길이)
+BIGQUERY_TYPE_BYTES = {
+    'INT64': 8, 'FLOAT64': 8, 'NUMERIC': 16, 'BIGNUMERIC': 32, 'BOOL': 1,
+    'DATE': 8, 'DATETIME': 8, 'TIME': 8, 'TIMESTAMP': 8, 'INTERVAL': 16,
+}
+
+# BigQuery 주문형 쿼리가 테이블마다 과금하는 최소 스캔 크기 (10MB)
+BIGQUERY_MIN_SCAN_BYTES = 10 * 1024 ** 2
+
+# transcode 명령 출력 형식과 행 그룹 크기 (데이터 CSV도 행 그룹 하나만큼씩만 메모리에 읽음)
+TRANSCODE_FORMATS = ('parquet', 'avro')
+TRANSCODE_ROW_GROUP_ROWS = 100000
+
+# 정밀도가 선언되지 않은 NUMERIC/BIGNUMERIC의 Parquet/Avro decimal (정밀도, 스케일)
+DEFAULT_DECIMAL_PRECISION = {'NUMERIC': (38, 9), 'BIGNUMERIC': (76, 38)}
+DECIMAL_CONTEXT = Context(prec=80)  # BIGNUMERIC 값도 반올림 없이 스케일을 맞출 수 있는 정밀도
+
+# Avro 필드명 규칙 (한글 등 이 규칙에 맞지 않는 컬럼명은 Parquet으로 변환)
+AVRO_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# validate-data 명령 기본값과 오류 보고서 컬럼 (ROW_NUMBER는 헤더를 뺀 데이터 행 번호)
+VALIDATION_BATCH_ROWS = 10000  # 컬럼별로 한 번에 검사할 행 수
+VALIDATION_MAX_ERRORS = 100  # 테이블당 이만큼 오류가 나오면 나머지 행은 읽지 않음 (0이면 끝까지)
+VALIDATION_VALUE_PREVIEW = 100  # 보고서에 남길 값 앞부분 길이
+
+# 데이터 CSV의 날짜/시각 값 형식 (BigQuery CSV 적재 형식 YYYY-[M]M-[D]D[( |T)[H]H:[M]M[:[S]S[.F]]][시간대])
+# 시간대(Z, UTC, ±H[H][:MM])는 TIMESTAMP만 허용
+MOMENT_VALUE_PATTERN = re.compile(
+    r'^(?P<year>[0-9]{4})-(?P<month>[0-9]{1,2})-(?P<day>[0-9]{1,2})'
+    r'(?:[T ](?P<hour>[0-9]{1,2}):(?P<minute>[0-9]{1,2})(?::(?P<second>[0-9]{1,2})(?:\.(?P<fraction>[0-9]{1,6}))?)?'
+    r'(?: ?(?P<zone>Z|UTC|(?P<sign>[+-])(?P<zone_hour>[0-9]{1,2})(?::(?P<zone_minute>[0-9]{2}))?))?)?$')
+
+# 값 검사에서 NumPy로 숫자 형식/자릿수를 한 번에 거를 최대 값 길이 (BIGNUMERIC 76자리 + 부호/소수점)
+VECTOR_SCREEN_MAX_WIDTH = 80
+VALIDATION_FIELDS = ('OWNER', 'TABLE_NAME', 'ROW_NUMBER', 'COLUMN_NAME', 'BQ_TYPE', 'VALUE', 'ERROR')
+
+# estimate 명령 보고서 컬럼 (테이블별, --columns 컬럼별)
+ESTIMATE_FIELDS = (
+    'OWNER', 'TABLE_NAME', 'NUM_ROWS', 'COLUMN_COUNT', 'ORACLE_BYTES', 'LOGICAL_BYTES',
+    'PARTITION_COLUMN', 'PARTITION_UNIT', 'PARTITION_COUNT', 'FULL_SCAN_BYTES', 'PARTITION_SCAN_BYTES', 'BASIS'
+)
+ESTIMATE_COLUMN_FIELDS = (
+    'OWNER', 'TABLE_NAME', 'COLUMN_NAME', 'BQ_TYPE', 'NUM_ROWS', 'NUM_NULLS', 'AVG_COL_LEN', 'LOGICAL_BYTES', 'BASIS'
+)
+
+
+@dataclass(frozen=True)
+class ConversionOptions:
+    """DDL 변환 옵션 (불변 객체 - 여러 스레드에서 공유 가능)"""
+    project_id: str = ''
+    string_mode: str = 'auto'
+    preserve_string_length: bool = False
+    use_schema_as_dataset: bool = True
+    create_primary_keys: bool = True
+    create_foreign_keys: bool = True
+    create_or_replace: bool = False
+    enable_partitioning: bool = True
+    enable_clustering: bool = True
+    partition_expiration_days: Optional[int] = None
+    debug_mode: bool = False
+    drop_partition_table_before_create: bool = False
+    max_range_partitions: int = RANGE_PARTITION_MAX_BUCKETS
+    recommend_clustering: bool = False
+    partition_min_table_gb: float = PARTITION_MIN_TABLE_GB
+    partition_target_gb: float = PARTITION_TARGET_GB
+    require_partition_filter_gb: Optional[float] = REQUIRE_PARTITION_FILTER_GB
+    oracle_block_size: int = ORACLE_BLOCK_SIZE
+    narrowing_margin_digits: int = NARROWING_MARGIN_DIGITS
+    export_rows_per_chunk: int = EXPORT_ROWS_PER_CHUNK
+    export_max_chunks: int = EXPORT_MAX_CHUNKS
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """타입과 식별자 결정이 끝난 컬럼 (TablePlan의 구성 요소)"""
+    name: str
+    identifier: str
+    oracle_type: str
+    bq_type: str
+    declared_type: str
+    nullable: bool
+    is_primary_key: bool
+    description: Optional[str]
+    source: Dict
+    narrowed_from: str = ''  # 샘플 기반 축소 전 타입 (축소하지 않았으면 빈 문자열)
+
+
+@dataclass(frozen=True)
+class TablePlan:
+    """테이블 하나에 대한 변환 결정 (DDL, JSON 스키마, 컬럼 목록 출력이 모두 이 값을 사용)"""
+    schema_name: Optional[str]
+    table_name: str
+    full_name: str
+    columns: Tuple[ColumnPlan, ...]
+    primary_key: Tuple[str, ...]
+    has_partition: bool
+    partition_column: Optional[ColumnPlan]
+    partition_clause: Optional[str]
+    cluster_columns: Tuple[str, ...]
+    cluster_clause: Optional[str]
+    cluster_source: str = ''  # 'manual'(CLUSTER_YN), 'partitioning'(Oracle 파티션 키) 또는 'recommended'(인덱스/통계 기반 추천)
+    require_partition_filter: bool = False
+    cluster_reasons: Tuple[Tuple[str, str], ...] = ()  # (컬럼명, 선택 이유)
+
+
+@dataclass(frozen=True)
+class NumberSample:
+    """컬럼 값 샘플(또는 미리 계산한 통계)의 숫자 요약 - NUMBER 타입 축소용"""
+    min_value: Decimal
+    max_value: Decimal
+    max_scale: Optional[int]  # 소수점 아래 최대 자릿수 (정수만 있으면 0, 소수가 있지만 모르면 None)
+    count: int = 0  # 샘플 값 수 (미리 계산한 통계면 0)
+
+
+# 기본 Oracle -> BigQuery 타입 매핑 (세부 규칙은 map_oracle_type 참고)
+ORACLE_TYPE_MAPPINGS = {
+    'VARCHAR2': 'STRING',
+    'CHAR': 'STRING', 
+    'NVARCHAR2': 'STRING',
+    'NCHAR': 'STRING',
+    'NUMBER': 'INT64',
+    'INTEGER': 'INT64',
+    'FLOAT': 'FLOAT64',
+    'DATE': 'DATE',
+    'TIMESTAMP': 'TIMESTAMP',
+    'CLOB': 'STRING',
+    'BLOB': 'BYTES',
+    'RAW': 'BYTES'
+}
+
+# BigQuery 예약어 (일부)
+BIGQUERY_RESERVED_WORDS = frozenset({
+    'ALL', 'AND', 'ANY', 'ARRAY', 'AS', 'ASC', 'ASSERT_ROWS_MODIFIED',
+    'AT', 'BETWEEN', 'BY', 'CASE', 'CAST', 'COLLATE', 'CONTAINS',
+    'CREATE', 'CROSS', 'CUBE', 'CURRENT', 'DEFAULT', 'DEFINE',
+    'DESC', 'DISTINCT', 'ELSE', 'END', 'ENUM', 'ESCAPE', 'EXCEPT',
+    'EXCLUDE', 'EXISTS', 'EXTRACT', 'FALSE', 'FETCH', 'FOLLOWING',
+    'FOR', 'FROM', 'FULL', 'GROUP', 'GROUPING', 'GROUPS', 'HASH',
+    'HAVING', 'IF', 'IGNORE', 'IN', 'INNER', 'INTERSECT', 'INTERVAL',
+    'INTO', 'IS', 'JOIN', 'LATERAL', 'LEFT', 'LIKE', 'LIMIT',
+    'LOOKUP', 'MERGE', 'NATURAL', 'NEW', 'NO', 'NOT', 'NULL',
+    'NULLS', 'OF', 'ON', 'OR', 'ORDER', 'OUTER', 'OVER',
+    'PARTITION', 'PRECEDING', 'PROTO', 'RANGE', 'RECURSIVE',
+    'RESPECT', 'RIGHT', 'ROLLUP', 'ROWS', 'SELECT', 'SET',
+    'SOME', 'STRUCT', 'TABLESAMPLE', 'THEN', 'TO', 'TREAT',
+    'TRUE', 'UNBOUNDED', 'UNION', 'UNNEST', 'USING', 'WHEN',
+    'WHERE', 'WINDOW', 'WITH', 'WITHIN'
+})
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def map_oracle_type(oracle_type: str, precision: Optional[str] = None, scale: Optional[str] = None) -> str:
+    """Oracle 타입을 BigQuery 타입으로 변환 (정밀도와 스케일 정보 보존, 최근 결과를 프로세스 전체에서 캐시)"""
+    base_type = oracle_type.upper().split('(')[0]
+
+    # string_only 모드는 문자열 타입에만 영향을 줌 (다른 타입은 정상 변환)
+
+    # auto 모드: Oracle 타입에 따라 최적의 BigQuery 타입으로 변환
+    if base_type == 'NUMBER':
+        # NUMBER 타입의 정밀한 변환 로직
+        if precision is None and scale is None:
+            # NUMBER without precision/scale -> NUMERIC (정밀도 보존)
+            return 'NUMERIC'
+
+        # 정밀도와 스케일을 숫자로 변환
+        try:
+            prec = int(precision) if precision and str(precision).strip() else None
+            sc = int(scale) if scale and str(scale).strip() else None
+        except (ValueError, TypeError):
+            prec = None
+            sc = None
+
+        # NUMBER with scale 0 (정수형)
+        if sc is not None and sc == 0:
+            if prec is not None and prec <= 18:
+                return 'INT64'  # INT64 범위 내의 정수
+            elif prec is not None and prec <= 29:
+                return 'NUMERIC'  # NUMERIC(P, 0)에서 P <= 29
+            else:
+                return 'BIGNUMERIC'  # 큰 정수는 BIGNUMERIC으로 처리
+
+        # NUMBER with scale > 0 (소수점 포함)
+        if sc is not None and sc > 0:
+            if prec is not None:
+                # BigQuery NUMERIC 한계 확인 (38자리 정밀도, 9자리 소수점)
+                if prec <= 38 and sc <= 9:
+                    return 'NUMERIC'
+                # BigQuery NUMERIC 한계를 초과하는 경우 BIGNUMERIC 사용
+                elif prec <= 76 and sc <= 38:
+                    return 'BIGNUMERIC'
+                else:
+                    # 극한의 정밀도는 STRING으로 처리
+                    return 'STRING'
+            else:
+                return 'NUMERIC'
+
+        # NUMBER with negative scale (소수점 왼쪽 반올림)
+        if sc is not None and sc < 0:
+            return 'NUMERIC'
+
+        # 기타 모든 경우 NUMERIC으로 안전하게 처리
+        return 'NUMERIC'
+
+    # TIMESTAMP 타입들
+    if base_type.startswith('TIMESTAMP'):
+        return 'DATETIME'
+
+    # 문자열 타입들
+    if base_type in ['VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR', 'CLOB', 'NCLOB', 'LONG']:
+        return 'STRING'
+
+    # 바이너리 타입들
+    if base_type in ['BLOB', 'RAW']:
+        return 'BYTES'
+
+    # DATE 타입
+    if base_type == 'DATE':
+        return 'DATETIME'
+
+    # 기타 타입들
+    return ORACLE_TYPE_MAPPINGS.get(base_type, 'STRING')
+
+
+@lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
+def identifier_needs_backticks(name: str) -> bool:
+    """이름에 백틱이 필요한지 확인 (한글, 특수문자, 예약어 등, 최근 결과를 프로세스 전체에서 캐시)"""
+    # 한글이 포함되어 있는지 확인
+    if re.search(r'[가-힣]', name):
+        return True
+
+    # 숫자로 시작하는지 확인
+    if name and name[0].isdigit():
+        return True
+
+    # 특수문자가 포함되어 있는지 확인 (언더스코어 제외)
+    if re.search(r'[^a-zA-Z0-9_]', name):
+        return True
+
+    # BigQuery 예약어 확인 (일부만)
+    if name.upper() in BIGQUERY_RESERVED_WORDS:
+        return True
+
+    return False
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def format_type_with_precision(bq_type: str, precision: Optional[str], scale: Optional[str],
+                               char_length: Optional[str], string_mode: str = 'auto',
+                               preserve_string_length: bool = False) -> str:
+    """BigQuery 타입에 정밀도/스케일 정보 추가 (최근 결과를 프로세스 전체에서 캐시)"""
+    try:
+        prec = int(precision) if precision and str(precision).strip() else None
+        sc = int(scale) if scale and str(scale).strip() else None
+        length = int(char_length) if char_length and str(char_length).strip() else None
+    except (ValueError, TypeError):
+        prec = None
+        sc = None
+        length = None
+
+    # NUMERIC/BIGNUMERIC 타입에 정밀도와 스케일 추가
+    if bq_type in ['NUMERIC', 'BIGNUMERIC']:
+        if prec is not None and sc is not None:
+            # BigQuery NUMERIC 제한사항 확인
+            if bq_type == 'NUMERIC':
+                # NUMERIC(P, 0)에서 P > 29인 경우 BIGNUMERIC으로 변경
+                if sc == 0 and prec > 29:
+                    return f"BIGNUMERIC({prec}, {sc})"
+                # NUMERIC(P, S)에서 P > 38 또는 S > 9인 경우 BIGNUMERIC으로 변경
+                elif prec > 38 or sc > 9:
+                    return f"BIGNUMERIC({prec}, {sc})"
+            return f"{bq_type}({prec}, {sc})"
+        elif prec is not None:
+            # 정밀도만 있는 경우도 동일한 제한사항 적용
+            if bq_type == 'NUMERIC' and prec > 29:
+                return f"BIGNUMERIC({prec})"
+            return f"{bq_type}({prec})"
+
+    # STRING 타입에 길이 정보 추가 (선택적)
+    if bq_type == 'STRING' and length is not None:
+        if string_mode == 'string_only':
+            # string_only 모드: 길이 정보 무시하고 단순 STRING
+            return 'STRING'
+        elif preserve_string_length:
+            # auto 모드 + preserve_string_length: 길이 정보 포함
+            return f"STRING({length})"
+        else:
+            # auto 모드: 길이 정보 없이 STRING
+            return 'STRING'
+
+    return bq_type
+
+
+def decode_oracle_number(raw_hex: Optional[str]) -> Optional[Decimal]:
+    """Oracle NUMBER 내부 형식(RAWTOHEX로 추출한 16진수 문자열)을 Decimal로 변환
+    
+    ALL_TAB_COL_STATISTICS의 LOW_VALUE/HIGH_VALUE 해석용이며, NUMBER 형식이 아니거나
+    무한대 값이면 None을 반환합니다.
+    """
+    try:
+        data = bytes.fromhex((raw_hex or '').strip())
+    except ValueError:
+        return None
+    if not data:
+        return None
+    if data == b'\x80':
+        return Decimal(0)
+    
+    # 첫 바이트는 부호와 100진수 지수, 나머지는 100진수 자릿수 (음수는 보수 표현 + 종료 바이트 102)
+    if data[0] > 0x80:
+        negative = False
+        exponent = data[0] - 0xC1
+        digits = [byte - 1 for byte in data[1:]]
+    else:
+        negative = True
+        exponent = 0x3E - data[0]
+        body = data[1:-1] if data[-1:] == b'\x66' else data[1:]
+        digits = [101 - byte for byte in body]
+    if not digits or any(digit < 0 or digit > 99 for digit in digits):
+        return None
+    
+    decimal_digits = tuple(int(char) for char in ''.join(f"{digit:02d}" for digit in digits))
+    return Decimal((1 if negative else 0, decimal_digits, 2 * (exponent - len(digits) + 1)))
+
+
+def _looks_like_yyyymmdd(value: int) -> bool:
+    """YYYYMMDD 형식의 날짜 숫자인지 확인"""
+    return 19000101 <= value <= 29991231 and 1 <= value // 100 % 100 <= 12 and 1 <= value % 100 <= 31
+
+
+def _looks_like_yyyymm(value: int) -> bool:
+    """YYYYMM 형식의 연월 숫자인지 확인"""
+    return 190001 <= value <= 299912 and 1 <= value % 100 <= 12
+
+
+def _round_up_step(step: int) -> int:
+    """버킷 간격을 1, 2, 5 x 10^n 중 step 이상인 가장 작은 값으로 올림"""
+    magnitude = 1
+    while True:
+        for factor in (1, 2, 5):
+            if factor * magnitude >= step:
+                return factor * magnitude
+        magnitude *= 10
+
+
+def plan_integer_range(low: Decimal, high: Decimal, num_distinct: Optional[int] = None,
+                       max_buckets: int = RANGE_PARTITION_MAX_BUCKETS,
+                       headroom: float = RANGE_PARTITION_HEADROOM,
+                       step: Optional[int] = None) -> Optional[Tuple[int, int, int]]:
+    """컬럼 통계(최솟값, 최댓값, 고유값 수)로 RANGE_BUCKET 파티션의 (start, end, interval) 결정
+    
+    - 통계 이후 늘어날 값을 위해 끝을 범위의 headroom 비율만큼 늘림
+    - YYYYMMDD 형식 키는 월(100) 단위, 넘치면 연(10000) 단위 버킷 (YYYYMM은 월(1), 연(100) 단위)
+    - 그 외에는 통계 범위의 버킷 수가 max_buckets와 고유값 수를 넘지 않도록 1, 2, 5 x 10^n 간격
+    - step(Oracle INTERVAL 파티션 간격)이 주어지면 그 간격을, 버킷 수가 넘치면 그 배수를 사용
+    INT64 범위를 벗어나거나 max_buckets 안에 들어가지 않으면 None을 반환합니다.
+    """
+    if low is None or high is None or high < low or max_buckets < 1:
+        return None
+    low_value = int(low.to_integral_value(ROUND_FLOOR))
+    high_value = int(high.to_integral_value(ROUND_CEILING))
+    span = high_value - low_value + 1
+    end_value = high_value + 1 + int(span * headroom)
+    
+    if step:
+        multiple = max(1, -(-(end_value - low_value) // (step * max_buckets)))
+        steps = [step * multiple, step * (multiple + 1)]
+    elif _looks_like_yyyymmdd(low_value) and _looks_like_yyyymmdd(high_value):
+        steps = [100, 10000]
+    elif _looks_like_yyyymm(low_value) and _looks_like_yyyymm(high_value):
+        steps = [1, 100]
+    else:
+        buckets = min(max_buckets, num_distinct) if num_distinct and num_distinct > 0 else max_buckets
+        step = _round_up_step(-(-span // buckets))
+        steps = [step, _round_up_step(step + 1), _round_up_step(step * 10)]
+    
+    for step in steps:
+        start = low_value // step * step
+        end = -(-end_value // step) * step
+        if (end - start) // step <= max_buckets:
+            if start < INT64_MIN or end > INT64_MAX:
+                return None
+            return start, end, step
+    return None
+
+
+def decode_oracle_date(raw_hex: Optional[str]) -> Optional[datetime]:
+    """Oracle DATE/TIMESTAMP 내부 형식(RAWTOHEX 16진수 문자열)을 datetime으로 변환 (형식이 아니면 None)
+    
+    앞 7바이트는 세기+100, 연도+100, 월, 일, 시+1, 분+1, 초+1이고 TIMESTAMP는 나노초 4바이트가 뒤에 붙습니다.
+    """
+    try:
+        data = bytes.fromhex((raw_hex or '').strip())
+    except ValueError:
+        return None
+    if len(data) not in (7, 11):
+        return None
+    year = (data[0] - 100) * 100 + (data[1] - 100)
+    microsecond = int.from_bytes(data[7:11], 'big') // 1000 if len(data) == 11 else 0
+    try:
+        return datetime(year, data[2], data[3], data[4] - 1, data[5] - 1, data[6] - 1, microsecond)
+    except ValueError:
+        return None
+
+
+def choose_partition_granularity(table_bytes: Optional[float], span_days: Optional[float],
+                                 min_table_bytes: float, target_bytes: float,
+                                 max_partitions: int = BIGQUERY_MAX_PARTITIONS,
+                                 headroom: float = RANGE_PARTITION_HEADROOM,
+                                 granularity: Optional[str] = None) -> Optional[str]:
+    """테이블 크기와 날짜 범위(일)로 날짜 파티션 단위(DAY, MONTH, YEAR) 결정 (파티션하지 않으면 None)
+    
+    - 테이블이 min_table_bytes보다 작으면 파티션하지 않음
+    - 파티션 수(범위를 headroom만큼 늘려 계산)가 max_partitions 이하이고 파티션당 평균 크기가
+      target_bytes 이상인 가장 작은 단위를 선택 (크기 조건을 만족하는 단위가 없으면 YEAR)
+    - granularity(Oracle INTERVAL에서 정한 단위)가 주어지면 크기 조건 없이 그 단위를 사용하고,
+      파티션 수가 넘칠 때만 더 큰 단위로 올림
+    - 통계가 없으면 기존과 같이 DAY (granularity가 있으면 그 단위)
+    """
+    if table_bytes is not None and table_bytes < min_table_bytes:
+        return None
+    units = list(PARTITION_GRANULARITY_DAYS)
+    first = units.index(granularity if granularity in PARTITION_GRANULARITY_DAYS else 'DAY')
+    if span_days is None:
+        return units[first]
+    
+    fitting = []
+    for unit in units[first:]:
+        unit_days = PARTITION_GRANULARITY_DAYS[unit]
+        if int(span_days * (1 + headroom) / unit_days) + 1 > max_partitions:
+            continue
+        fitting.append(unit)
+        if granularity or table_bytes is None or table_bytes / (int(span_days / unit_days) + 1) >= target_bytes:
+            return unit
+    return fitting[-1] if fitting else None
+
+
+# Oracle INTERVAL 파티션 식 (NUMTOYMINTERVAL/NUMTODSINTERVAL 함수 또는 INTERVAL 리터럴)
+ORACLE_INTERVAL_PATTERN = re.compile(
+    r"^(?:NUMTO(?:YM|DS)INTERVAL\s*\(\s*(\d+)\s*,\s*'(\w+)'\s*\)"
+    r"|INTERVAL\s*'(\d+)'\s*(\w+))$", re.IGNORECASE)
+
+
+def parse_oracle_interval(interval: Optional[str]) -> Union[str, int, None]:
+    """ALL_PART_TABLES.INTERVAL 값을 BigQuery 파티션 단위로 변환
+    
+    날짜 간격은 같거나 더 작은 BigQuery 단위(HOUR, DAY, MONTH, YEAR)로, 숫자 간격은 RANGE_BUCKET 간격(int)으로
+    돌려줍니다. 3개월, 7일처럼 BigQuery에 없는 간격은 더 작은 단위로 옮겨 파티션 제거 범위가 줄지 않게 합니다.
+    INTERVAL 파티션이 아니거나 해석할 수 없으면 None을 반환합니다.
+    """
+    text = re.sub(r'\s+', ' ', str(interval or '')).strip()
+    if not text:
+        return None
+    if text.isdigit():
+        return int(text) or None
+    match = ORACLE_INTERVAL_PATTERN.match(text)
+    if not match:
+        return None
+    count = int(match.group(1) or match.group(3))
+    unit = (match.group(2) or match.group(4)).upper()
+    if count < 1:
+        return None
+    if unit == 'YEAR' or (unit == 'MONTH' and count % 12 == 0):
+        return 'YEAR'
+    if unit == 'MONTH':
+        return 'MONTH'
+    if unit == 'DAY' or (unit == 'HOUR' and count % 24 == 0):
+        return 'DAY'
+    if unit in ('HOUR', 'MINUTE', 'SECOND'):
+        return 'HOUR'
+    return None
+
+
+def parse_stat_int(value: Any) -> Optional[int]:
+    """통계 값(NUM_ROWS, NUM_DISTINCT, 인덱스 위치 등)을 정수로 변환 (비어 있거나 숫자가 아니면 None)"""
+    try:
+        return int(Decimal(str(value).strip()))
+    except (ArithmeticError, ValueError, TypeError):
+        return None
+
+
+def parse_stat_decimal(value: Any) -> Optional[Decimal]:
+    """통계 값(샘플 최솟값/최댓값 등)을 Decimal로 변환 (비어 있거나 숫자가 아니면 None)"""
+    try:
+        number = Decimal(str(value).strip())
+    except (ArithmeticError, ValueError, TypeError):
+        return None
+    return number if number.is_finite() else None
+
+
+def recommend_cluster_columns(columns: Sequence[ColumnPlan], exclude: Optional[ColumnPlan] = None,
+                              limit: int = MAX_CLUSTER_COLUMNS) -> List[Tuple[ColumnPlan, str]]:
+    """인덱스 사용 정보와 컬럼 통계로 클러스터 컬럼을 추천 (최대 limit개, (컬럼, 선택 이유) 목록)
+    
+    인덱스에 포함된(또는 기본키) 컬럼만 후보로 하며, 선두 인덱스 컬럼이 많을수록, 인덱스 안의
+    위치가 앞일수록, 선택도(NUM_DISTINCT / NUM_ROWS)가 높을수록 앞에 둡니다.
+    값이 하나뿐인 컬럼과 클러스터를 지원하지 않는 타입, exclude(파티션 컬럼)는 제외합니다.
+    """
+    candidates = []
+    for order, column in enumerate(columns):
+        if column is exclude or column.bq_type not in CLUSTERABLE_TYPES:
+            continue
+        source = column.source
+        index_count = parse_stat_int(source.get('index_count')) or 0
+        leading_count = parse_stat_int(source.get('leading_index_count')) or 0
+        min_position = parse_stat_int(source.get('min_index_position'))
+        unique_position = parse_stat_int(source.get('unique_index_position'))
+        num_distinct = parse_stat_int(source.get('num_distinct'))
+        num_rows = parse_stat_int(source.get('num_rows'))
+        if index_count == 0 and not column.is_primary_key:
+            continue
+        if num_distinct is not None and num_distinct <= 1:
+            continue
+        selectivity = min(num_distinct / num_rows, 1.0) if num_distinct and num_rows else None
+        
+        reasons = []
+        if leading_count:
+            reasons.append(f"선두 인덱스 컬럼 {leading_count}개")
+        if index_count:
+            reasons.append(f"인덱스 {index_count}개 포함 (가장 앞 위치 {min_position or '-'})")
+        if unique_position is not None:
+            reasons.append(f"고유 인덱스 {unique_position}번째 컬럼")
+        elif column.is_primary_key:
+            reasons.append("기본키 컬럼")
+        if selectivity is not None:
+            reasons.append(f"선택도 {selectivity:.4f} (고유값 {num_distinct:,} / 행 {num_rows:,})")
+        
+        score = (-(2 * leading_count + index_count), min_position or 99, -(selectivity or 0.0), order)
+        candidates.append((score, column, ', '.join(reasons)))
+    
+    candidates.sort(key=lambda candidate: candidate[0])
+    return [(column, reason) for score, column, reason in candidates[:limit]]
+
+
+def summarize_number_values(values: Iterable[Optional[str]]) -> Optional[NumberSample]:
+    """샘플 값들의 최솟값, 최댓값, 최대 소수 자릿수 요약 (빈 값은 건너뜀, 숫자가 아닌 값이 있거나 값이 없으면 None)"""
+    low = high = None
+    max_scale = 0
+    count = 0
+    for value in values:
+        text = (value or '').strip()
+        if not text:
+            continue
+        try:
+            number = Decimal(text)
+        except ArithmeticError:
+            return None
+        if not number.is_finite():
+            return None
+        # 1.50처럼 끝에 붙은 0은 소수 자릿수로 세지 않음
+        exponent = number.normalize().as_tuple().exponent
+        max_scale = max(max_scale, -exponent)
+        low = number if low is None or number < low else low
+        high = number if high is None or number > high else high
+        count += 1
+    if count == 0:
+        return None
+    return NumberSample(low, high, max_scale, count)
+
+
+def _integer_digits(value: Decimal) -> int:
+    """정수 부분 자릿수 (1 미만이면 1)"""
+    integer = abs(int(value))
+    return len(str(integer)) if integer else 1
+
+
+def narrow_number_type(sample: NumberSample, margin_digits: int = NARROWING_MARGIN_DIGITS,
+                       integer_only: bool = False) -> Optional[Tuple[str, Optional[int], Optional[int]]]:
+    """샘플 요약으로 가장 좁은 BigQuery 숫자 타입 (타입, 정밀도, 스케일) 결정 (축소할 수 없으면 None)
+    
+    - 정수만 있고 정수 자릿수 + margin_digits가 18 이하이면 INT64
+    - 그 외에는 소수 자릿수 S와 정수 자릿수 + margin_digits로 NUMERIC(P, S), 넘치면 BIGNUMERIC(P, S)
+    integer_only이면 INT64로 바꿀 수 있을 때만 결과를 돌려줍니다 (NUMBER(P, 0)처럼 선언이 이미 정해진 경우).
+    """
+    if sample.max_scale is None:
+        return None
+    integer_digits = max(_integer_digits(sample.min_value), _integer_digits(sample.max_value)) + max(0, margin_digits)
+    scale = sample.max_scale
+    if scale == 0 and integer_digits <= INT64_SAFE_DIGITS:
+        return 'INT64', None, None
+    if integer_only:
+        return None
+    if scale <= 9 and integer_digits <= 29:
+        return 'NUMERIC', integer_digits + scale, scale
+    if scale <= 38 and integer_digits <= 38:
+        return 'BIGNUMERIC', integer_digits + scale, scale
+    return None
+
+
+def plan_export_chunks(num_rows: Optional[int], rows_per_chunk: int = EXPORT_ROWS_PER_CHUNK,
+                       max_chunks: int = EXPORT_MAX_CHUNKS) -> int:
+    """NUM_ROWS로 데이터 추출 청크 수 결정 (청크당 rows_per_chunk행 기준 1 ~ max_chunks개, 통계가 없으면 1)"""
+    if not num_rows or rows_per_chunk <= 0:
+        return 1
+    return max(1, min(max_chunks, -(-num_rows // rows_per_chunk)))
+
+
+def quote_oracle_identifier(name: str) -> str:
+    """Oracle 식별자를 큰따옴표로 감싸기 (소문자, 한글, 예약어 이름도 딕셔너리에 저장된 그대로 참조)"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def oracle_export_expression(column: ColumnPlan, alias: str = 't') -> str:
+    """컬럼을 BigQuery 타입이 그대로 읽는 문자열로 내보내는 Oracle SELECT 식 (원래 컬럼명 별칭 포함)
+    
+    - NUMBER/FLOAT 계열: TO_CHAR(값, 'TM9') - 지수 표기나 SQL*Plus NUMWIDTH 자름 없이 전체 자릿수
+      (BIGNUMERIC, 정밀도를 넘어 STRING으로 매핑된 NUMBER도 값이 바뀌지 않음)
+    - DATE: 'YYYY-MM-DD HH24:MI:SS' (BigQuery DATE로 매핑되면 'YYYY-MM-DD')
+    - TIMESTAMP: 'YYYY-MM-DD HH24:MI:SS.FF6', 시간대가 있으면 SYS_EXTRACT_UTC로 UTC 변환
+    - RAW: RAWTOHEX 16진수 문자열
+    - 문자열, LOB 등 나머지는 변환하지 않음
+    """
+    name = quote_oracle_identifier(column.name)
+    value = f"{alias}.{name}"
+    oracle_type = column.oracle_type.upper()
+    base_type = oracle_type.split('(')[0].strip()
+    
+    if base_type in EXPORT_NUMBER_TYPES:
+        expression = f"TO_CHAR({value}, {EXPORT_NUMBER_FORMAT})"
+    elif base_type == 'DATE':
+        date_format = EXPORT_DATE_FORMAT if column.bq_type == 'DATE' else EXPORT_DATETIME_FORMAT
+        expression = f"TO_CHAR({value}, '{date_format}')"
+    elif base_type.startswith('TIMESTAMP'):
+        if 'TIME ZONE' in oracle_type:
+            value = f"SYS_EXTRACT_UTC({value})"
+        expression = f"TO_CHAR({value}, '{EXPORT_TIMESTAMP_FORMAT}')"
+    elif base_type == 'RAW':
+        expression = f"RAWTOHEX({value})"
+    else:
+        return value
+    return f"{expression} AS {name}"
+
+
+# 생성된 PARTITION BY 절에서 날짜 파티션 단위와 RANGE_BUCKET 범위를 읽는 패턴
+PARTITION_UNIT_PATTERN = re.compile(r'_TRUNC\(.+, (HOUR|DAY|MONTH|YEAR)\)$')
+RANGE_BUCKET_PATTERN = re.compile(r'GENERATE_ARRAY\((-?\d+), (-?\d+), (\d+)\)')
+
+
+def estimate_column_bytes(bq_type: str, num_rows: Optional[int], num_nulls: Optional[int] = None,
+                          avg_col_len: Optional[int] = None, max_length: Optional[int] = None) -> Tuple[Optional[int], str]:
+    """컬럼의 BigQuery 논리 크기(바이트)와 근거 ('stats', 'declared', 추정할 수 없으면 (None, ''))
+    
+    - 고정 크기 타입: NULL이 아닌 행 수 x 타입 크기 (NULL은 0바이트)
+    - STRING/BYTES 등 가변 길이: NULL이 아닌 행 수 x (AVG_COL_LEN + 1)
+      (AVG_COL_LEN에 들어 있는 Oracle 길이 바이트 1개 대신 BigQuery 길이 2바이트)
+    - AVG_COL_LEN이 없으면 선언된 최대 길이(DATA_LENGTH)로 계산하며 근거는 'declared'
+    """
+    if num_rows is None:
+        return None, ''
+    non_null = max(0, num_rows - (num_nulls or 0))
+    fixed = BIGQUERY_TYPE_BYTES.get(bq_type)
+    if fixed is not None:
+        return non_null * fixed, 'stats'
+    if avg_col_len is not None:
+        return non_null * (avg_col_len + 1), 'stats'
+    if max_length is not None:
+        return non_null * (max_length + 2), 'declared'
+    return None, ''
+
+
+def _import_numpy():
+    """NumPy 모듈 반환 (설치되어 있지 않으면 None)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _parse_precision_scale(precision: Optional[str], scale: Optional[str]) -> Tuple[int, int]:
+    """정밀도/스케일을 배치 분류용 정수로 변환 (map_oracle_type과 같은 규칙, 값이 없으면 MISSING_NUMBER)"""
+    try:
+        prec = int(precision) if precision and str(precision).strip() else MISSING_NUMBER
+        sc = int(scale) if scale and str(scale).strip() else MISSING_NUMBER
+    except (ValueError, TypeError):
+        return MISSING_NUMBER, MISSING_NUMBER
+    # 비교 결과가 바뀌지 않는 범위로 제한하여 64비트 배열에 담을 수 있게 함
+    limit = 2 ** 62
+    if prec != MISSING_NUMBER:
+        prec = max(-limit + 1, min(limit, prec))
+    if sc != MISSING_NUMBER:
+        sc = max(-limit + 1, min(limit, sc))
+    return prec, sc
+
+
+def classify_number_types(precisions: Sequence[int], scales: Sequence[int], use_numpy: bool = True) -> List[str]:
+    """NUMBER 컬럼의 정밀도/스케일 배열을 한 번에 INT64/NUMERIC/BIGNUMERIC/STRING으로 분류
+    
+    NumPy가 있으면 마스크 연산으로, 없으면 같은 규칙의 순수 Python 반복문으로 처리한다.
+    """
+    numpy = _import_numpy() if use_numpy else None
+    if numpy is None:
+        result = []
+        for prec, sc in zip(precisions, scales):
+            has_prec = prec != MISSING_NUMBER
+            if sc == MISSING_NUMBER or sc < 0:
+                result.append('NUMERIC')
+            elif sc == 0:
+                if has_prec and prec <= 18:
+                    result.append('INT64')
+                elif has_prec and prec <= 29:
+                    result.append('NUMERIC')
+                else:
+                    result.append('BIGNUMERIC')
+            elif not has_prec or (prec <= 38 and sc <= 9):
+                result.append('NUMERIC')
+            elif prec <= 76 and sc <= 38:
+                result.append('BIGNUMERIC')
+            else:
+                result.append('STRING')
+        return result
+    
+    prec = numpy.asarray(precisions, dtype=numpy.int64)
+    sc = numpy.asarray(scales, dtype=numpy.int64)
+    has_prec = prec != MISSING_NUMBER
+    names = numpy.array(['NUMERIC', 'INT64', 'BIGNUMERIC', 'STRING'], dtype=object)
+    codes = numpy.zeros(len(prec), dtype=numpy.int8)
+    
+    # 스케일 0: 정밀도 18 이하 INT64, 29 이하 NUMERIC, 그 외(정밀도 없음 포함) BIGNUMERIC
+    scale_zero = sc == 0
+    codes[scale_zero & has_prec & (prec <= 18)] = 1
+    codes[scale_zero & ~(has_prec & (prec <= 29))] = 2
+    
+    # 스케일 > 0: NUMERIC 한계(38, 9) 초과는 BIGNUMERIC(76, 38), 그마저 넘으면 STRING
+    beyond_numeric = (sc > 0) & has_prec & ~((prec <= 38) & (sc <= 9))
+    fits_bignumeric = (prec <= 76) & (sc <= 38)
+    codes[beyond_numeric & fits_bignumeric] = 2
+    codes[beyond_numeric & ~fits_bignumeric] = 3
+    return names[codes].tolist()
+
+
+def map_oracle_types_batch(oracle_types: Sequence[str], precisions: Sequence[Optional[str]],
+                           scales: Sequence[Optional[str]], use_numpy: bool = True) -> List[str]:
+    """여러 컬럼의 Oracle 타입을 한 번에 변환 (결과는 컬럼별 map_oracle_type과 동일)
+    
+    NUMBER 컬럼은 정밀도/스케일을 배열에 모아 classify_number_types로 분류하고,
+    나머지 타입은 정밀도와 무관하므로 타입명별로 캐시된 map_oracle_type 결과를 사용한다.
+    """
+    result = [None] * len(oracle_types)
+    number_positions = array('q')
+    number_precisions = array('q')
+    number_scales = array('q')
+    # 넓은 테이블은 같은 타입명/정밀도 조합이 반복되므로 해석 결과를 재사용
+    other_types = {}
+    parsed = {}
+    for position, (oracle_type, precision, scale) in enumerate(zip(oracle_types, precisions, scales)):
+        bq_type = other_types.get(oracle_type)
+        if bq_type is None:
+            bq_type = 'NUMBER' if oracle_type.upper().split('(')[0] == 'NUMBER' else map_oracle_type(oracle_type)
+            other_types[oracle_type] = bq_type
+        if bq_type != 'NUMBER':
+            result[position] = bq_type
+            continue
+        
+        pair = parsed.get((precision, scale))
+        if pair is None:
+            pair = parsed[(precision, scale)] = _parse_precision_scale(precision, scale)
+        number_positions.append(position)
+        number_precisions.append(pair[0])
+        number_scales.append(pair[1])
+    
+    if number_positions:
+        number_types = classify_number_types(number_precisions, number_scales, use_numpy)
+        for position, bq_type in zip(number_positions, number_types):
+            result[position] = bq_type
+    return result
+
+
+logger = logging.getLogger('oracle_to_bq')
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """항상 현재 sys.stdout에 쓰는 핸들러 (표준 출력 모드에서 stderr로 바꾼 것을 따름)
+    
+    진행 상황 줄(ProgressReporter)이 표시 중이면 지우고 메시지를 출력하며, 진행 줄은 다음 갱신 때 다시 그려진다.
+    """
+    
+    def __init__(self):
+        super().__init__(sys.stdout)
+    
+    def emit(self, record):
+        with ProgressReporter.console_lock:
+            ProgressReporter.clear_active()
+            super().emit(record)
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """콘솔 출력 형식 (기존 출력처럼 메시지만, DEBUG는 'DEBUG:' 접두어)"""
+    
+    def format(self, record):
+        message = super().format(record)
+        return f"DEBUG: {message}" if record.levelno == logging.DEBUG else message
+
+
+def configure_logging(quiet: bool = False, debug: bool = False, log_file: Optional[str] = None):
+    """CLI 로그 출력 설정
+    
+    콘솔은 INFO(--quiet이면 WARNING, 디버그면 DEBUG) 이상을 메시지만 출력하고,
+    로그 파일은 DEBUG까지 시간/레벨과 함께 LOG_BUFFER_RECORDS개씩 모아서 기록한다 (ERROR는 즉시 기록).
+    """
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        # MemoryHandler.close()는 남은 레코드를 기록만 하고 대상 FileHandler는 닫지 않음
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+    logger.propagate = False
+    
+    console = _ConsoleHandler()
+    console.setFormatter(_ConsoleFormatter('%(message)s'))
+    console.setLevel(logging.WARNING if quiet else (logging.DEBUG if debug else logging.INFO))
+    logger.addHandler(console)
+    level = console.level
+    
+    if log_file:
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+        buffered = logging.handlers.MemoryHandler(LOG_BUFFER_RECORDS, flushLevel=logging.ERROR, target=file_handler)
+        buffered.setLevel(logging.DEBUG)
+        logger.addHandler(buffered)
+        level = logging.DEBUG
+    logger.setLevel(level)
+
+
+def enable_debug_logging():
+    """설정 파일의 debug_mode가 켜져 있으면 콘솔에도 DEBUG 출력 (--quiet이면 그대로 둠)"""
+    for handler in logger.handlers:
+        if isinstance(handler, _ConsoleHandler) and handler.level == logging.INFO:
+            handler.setLevel(logging.DEBUG)
+            logger.setLevel(logging.DEBUG)
+
+
+class WarningSummary:
+    """테이블마다 나오는 경고를 종류별로 모아 변환이 끝난 뒤 한 번에 보고"""
+    
+    def __init__(self):
+        self.tables = OrderedDict()  # 경고 종류 -> 테이블 목록 (중복 제외)
+        self.lock = threading.Lock()
+    
+    def add(self, category: str, table: str):
+        with self.lock:
+            tables = self.tables.setdefault(category, OrderedDict())
+            tables[table] = None
+    
+    def render(self, max_examples: int = 5) -> List[str]:
+        """요약 표 줄 목록 (경고가 없으면 빈 목록)"""
+        if not self.tables:
+            return []
+        lines = ["⚠️ 경고 요약 (자세한 내용은 --log-file 또는 debug_mode로 확인):"]
+        for category, tables in self.tables.items():
+            names = list(tables)
+            examples = ', '.join(names[:max_examples]) + (' ...' if len(names) > max_examples else '')
+            lines.append(f"  - {WARNING_CATEGORIES.get(category, category)}: {len(names)}개 테이블 ({examples})")
+        return lines
+    
+    def clear(self):
+        with self.lock:
+            self.tables.clear()
+
+
+def format_byte_size(size: float) -> str:
+    """바이트 수를 읽기 쉬운 단위로 표시 (예: 1.5GB)"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+
+
+def format_duration(seconds: float) -> str:
+    """초를 HH:MM:SS로 표시"""
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressReporter:
+    """변환 진행 상황(읽은 바이트/전체 크기, 초당 행 수, 처리한 테이블 수, 남은 시간) 표시
+    
+    처리 루프에서는 카운터(bytes_read, rows, tables)만 올리고, 화면 갱신은 별도 스레드가
+    interval마다 한 줄을 덮어써서 처리 속도에 거의 영향을 주지 않습니다.
+    출력 스트림이 터미널이 아니면(파이프, 파일 리다이렉트) 자동으로 꺼집니다.
+    진행 줄 출력과 콘솔 로그(_ConsoleHandler)는 console_lock으로 순서를 맞춰 한 줄에 섞이지 않습니다.
+    """
+    
+    # 진행 줄과 콘솔 로그가 함께 쓰는 잠금, 현재 진행 줄을 표시 중인 인스턴스
+    console_lock = threading.RLock()
+    active = None
+    
+    def __init__(self, stream=None, interval: float = PROGRESS_INTERVAL_SECONDS,
+                 enabled: Optional[bool] = None, clock=time.monotonic):
+        self.stream = stream
+        self.interval = interval
+        self.clock = clock
+        if enabled is None:
+            target = stream if stream is not None else sys.stdout
+            enabled = bool(getattr(target, 'isatty', lambda: False)())
+        self.enabled = enabled
+        self.phase = ''
+        self.total_bytes = None
+        self.total_tables = None
+        self.bytes_read = 0
+        self.rows = 0
+        self.tables = 0
+        self.started = clock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._width = 0
+    
+    def start(self, phase: str, total_bytes: Optional[int] = None, total_tables: Optional[int] = None):
+        """새 단계 시작 (카운터를 초기화하고, 켜져 있으면 갱신 스레드 시작)"""
+        self.phase = phase
+        self.total_bytes = total_bytes
+        self.total_tables = total_tables
+        self.bytes_read = 0
+        self.rows = 0
+        self.tables = 0
+        self.started = self.clock()
+        if self.enabled and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='progress', daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """갱신 스레드를 멈추고 진행 줄을 지움"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        with self.console_lock:
+            self.clear_line()
+            if ProgressReporter.active is self:
+                ProgressReporter.active = None
+    
+    def render(self) -> str:
+        """현재 진행 상황 한 줄"""
+        elapsed = max(self.clock() - self.started, 1e-6)
+        parts = [self.phase]
+        remaining = None
+        if self.total_bytes:
+            fraction = min(self.bytes_read / self.total_bytes, 1.0)
+            parts.append(f"{fraction:.1%} {format_byte_size(self.bytes_read)}/{format_byte_size(self.total_bytes)}")
+            if self.bytes_read:
+                remaining = elapsed * (self.total_bytes - self.bytes_read) / self.bytes_read
+        elif self.bytes_read:
+            parts.append(format_byte_size(self.bytes_read))
+        if self.rows:
+            parts.append(f"{self.rows:,}행 ({self.rows / elapsed:,.0f}행/초)")
+        if self.total_tables:
+            parts.append(f"테이블 {self.tables:,}/{self.total_tables:,}개")
+            if self.tables:
+                remaining = elapsed * (self.total_tables - self.tables) / self.tables
+        else:
+            parts.append(f"테이블 {self.tables:,}개")
+        if remaining is not None:
+            parts.append(f"남은 시간 {format_duration(max(remaining, 0))}")
+        return ' | '.join(parts)
+    
+    def _write(self, text: str):
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+    
+    def draw(self):
+        """진행 줄을 다시 그림 (이전 줄보다 짧으면 남은 부분은 공백으로 덮음)"""
+        line = self.render()
+        with self.console_lock:
+            ProgressReporter.active = self
+            self._write('\r' + line.ljust(self._width))
+            self._width = max(self._width, len(line))
+    
+    def clear_line(self):
+        """표시 중인 진행 줄을 지우고 커서를 줄 앞으로 옮김"""
+        with self.console_lock:
+            if self._width:
+                self._write('\r' + ' ' * self._width + '\r')
+                self._width = 0
+    
+    @classmethod
+    def clear_active(cls):
+        """표시 중인 진행 줄이 있으면 지움 (콘솔 로그 출력 직전에 호출)"""
+        with cls.console_lock:
+            if cls.active is not None:
+                cls.active.clear_line()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.draw()
+
+
+class _CountingRawReader(io.RawIOBase):
+    """읽은 바이트 수를 진행 상황(ProgressReporter.bytes_read)에 더하는 리더"""
+    
+    def __init__(self, stream, progress: ProgressReporter):
+        self._stream = stream
+        self._progress = progress
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        size = self._stream.readinto(buffer)
+        if size:
+            self._progress.bytes_read += size
+        return size
+    
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            super().close()
+
+
+class StreamingReportWriter:
+    """보고서 행을 CSV 또는 JSON 배열로 바로 기록 (전체 행을 메모리에 모으지 않음)"""
+    
+    def __init__(self, out, field_names: Sequence[str], report_format: str = 'csv'):
+        self.out = out
+        self.field_names = tuple(field_names)
+        self.report_format = report_format
+        self.rows = 0
+        if report_format == 'csv':
+            self.writer = csv.writer(out)
+            self.writer.writerow(self.field_names)
+        else:
+            out.write('[')
+    
+    def write(self, row: Mapping[str, Any]):
+        if self.report_format == 'csv':
+            self.writer.writerow(['' if row.get(name) is None else row.get(name) for name in self.field_names])
+        else:
+            self.out.write((',\n' if self.rows else '\n') + json.dumps(
+                OrderedDict((name, row.get(name)) for name in self.field_names), ensure_ascii=False))
+        self.rows += 1
+    
+    def close(self):
+        """JSON 배열을 닫음 (스트림 자체는 닫지 않음)"""
+        if self.report_format != 'csv':
+            self.out.write('\n]\n' if self.rows else ']\n')
+        self.out.flush()
+
 
 class SimpleMigrationTool:
     """간단한 마이그레이션 도구 (pandas 없음)"""
     
-    def __init__(self, config_file=None):
+    def __init__(self, config_file=None, options: Optional[ConversionOptions] = None):
         """
         Args:
             config_file: 설정 파일 경로
+            options: 변환 옵션 (지정하면 설정 파일을 읽지 않고 이 값만 사용)
         """
         # 기본 설정값
         self.project_id = 'your_project'
@@ -26,31 +1228,52 @@ class SimpleMigrationTool:
         self.use_schema_as_dataset = True  # Oracle 스키마명을 데이터셋명으로 사용
         self.merge_output = True  # 모든 DDL을 하나의 파일로 병합 (기본값)
         self.create_primary_keys = True  # 기본키 제약조건 생성
+        self.create_foreign_keys = True  # 외래키 제약조건 생성 (NOT ENFORCED)
         self.create_or_replace = False  # CREATE OR REPLACE TABLE 사용 여부
         self.enable_partitioning = True  # 파티셔닝 기능 활성화
         self.enable_clustering = True  # 클러스터링 기능 활성화
         self.partition_expiration_days = None  # 파티션 만료 일수
         self.debug_mode = False  # 디버그 출력 활성화
         self.drop_partition_table_before_create = False  # 파티션 테이블 생성 전 DROP 실행
+        self.max_range_partitions = RANGE_PARTITION_MAX_BUCKETS  # 정수 RANGE 파티션 최대 버킷 수
+        self.recommend_clustering = False  # CLUSTER_YN이 없는 테이블에 인덱스/통계 기반 클러스터 추천
+        self.partition_min_table_gb = PARTITION_MIN_TABLE_GB  # 통계상 이보다 작은 테이블은 파티션 생략
+        self.partition_target_gb = PARTITION_TARGET_GB  # 날짜 파티션당 목표 최소 평균 크기
+        self.require_partition_filter_gb = REQUIRE_PARTITION_FILTER_GB  # 이보다 큰 테이블은 파티션 필터 필수 (None이면 사용 안함)
+        self.oracle_block_size = ORACLE_BLOCK_SIZE  # 테이블 크기 계산용 Oracle 블록 크기
+        self.narrowing_margin_digits = NARROWING_MARGIN_DIGITS  # 샘플 기반 타입 축소 시 여유 자릿수
+        self.export_rows_per_chunk = EXPORT_ROWS_PER_CHUNK  # 데이터 추출 SELECT 청크당 행 수 (NUM_ROWS 기준)
+        self.export_max_chunks = EXPORT_MAX_CHUNKS  # 데이터 추출 SELECT 테이블당 최대 청크 수
+        self.number_samples = {}  # (테이블 키, 컬럼명) -> NumberSample (load_type_samples로 로드)
         self.output_filename = 'merged_ddl.sql'  # 병합 파일명 (기본값)
+        self.table_filter = None  # 변환할 테이블 목록 (OWNER.TABLE_NAME 또는 TABLE_NAME, None이면 전체)
+        self.parse_workers = 1  # CSV 병렬 파싱 프로세스 수 (1이면 순차 파싱)
+        self.emitters = ['ddl']  # 한 번의 파싱으로 생성할 출력 형식 (EMITTERS 참고)
+        self.profiles = {}  # 이름별 설정 덮어쓰기 (config.json의 "profiles")
+        self.max_script_bytes = None  # 병합 DDL 파일당 최대 바이트 (지정하면 여러 파일로 분할)
+        self.max_statements = None  # 병합 DDL 파일당 최대 SQL 문 수 (지정하면 여러 파일로 분할)
+        self._plan_cache = OrderedDict()  # (테이블, 컬럼 목록, 옵션) -> TablePlan
+        self.warning_summary = WarningSummary()  # 변환 중 경고 (끝날 때 report_warnings로 출력)
+        self.progress = ProgressReporter(enabled=False)  # 진행 상황 표시 (CLI에서 터미널일 때 켬)
         
-        # 설정 파일 로드
-        self.load_config(config_file)
-        
-        self.type_mappings = {
-            'VARCHAR2': 'STRING',
-            'CHAR': 'STRING', 
-            'NVARCHAR2': 'STRING',
-            'NCHAR': 'STRING',
-            'NUMBER': 'INT64',
-            'INTEGER': 'INT64',
-            'FLOAT': 'FLOAT64',
-            'DATE': 'DATE',
-            'TIMESTAMP': 'TIMESTAMP',
-            'CLOB': 'STRING',
-            'BLOB': 'BYTES',
-            'RAW': 'BYTES'
-        }
+        # 설정 파일 로드 (옵션 객체가 주어지면 설정 파일 대신 사용)
+        if options is not None:
+            self.apply_options(options)
+        else:
+            self.load_config(config_file)
+        
+        self.type_mappings = dict(ORACLE_TYPE_MAPPINGS)
+    
+    def warn(self, category: str, table: str, message: str, *args):
+        """경고를 요약에 모으고 자세한 내용은 DEBUG 로그로 남김 (message는 %-형식, 필요할 때만 포맷)"""
+        self.warning_summary.add(category, table)
+        logger.debug(message, *args)
+    
+    def report_warnings(self):
+        """모아 둔 경고를 종류별 요약 표로 출력한 뒤 비움"""
+        for line in self.warning_summary.render():
+            logger.warning("%s", line)
+        self.warning_summary.clear()
     
     def load_config(self, config_file=None):
         """설정 파일 로드 (JSON 형식)"""
@@ -94,14 +1317,45 @@ class SimpleMigrationTool:
                         self.partition_expiration_days = config.get('partition_expiration_days', self.partition_expiration_days)
                         self.debug_mode = config.get('debug_mode', self.debug_mode)
                         self.drop_partition_table_before_create = config.get('drop_partition_table_before_create', self.drop_partition_table_before_create)
+                        self.max_range_partitions = config.get('max_range_partitions', self.max_range_partitions)
+                        self.recommend_clustering = config.get('recommend_clustering', self.recommend_clustering)
+                        self.partition_min_table_gb = config.get('partition_min_table_gb', self.partition_min_table_gb)
+                        self.partition_target_gb = config.get('partition_target_gb', self.partition_target_gb)
+                        self.require_partition_filter_gb = config.get('require_partition_filter_gb', self.require_partition_filter_gb)
+                        self.oracle_block_size = config.get('oracle_block_size', self.oracle_block_size)
+                        self.narrowing_margin_digits = config.get('narrowing_margin_digits', self.narrowing_margin_digits)
+                        self.export_rows_per_chunk = config.get('export_rows_per_chunk', self.export_rows_per_chunk)
+                        self.export_max_chunks = config.get('export_max_chunks', self.export_max_chunks)
+                        self.profiles = config.get('profiles', {})
                         
-                        print(f"✓ 설정 파일 로드됨: {config_path}")
+                        logger.info("✓ 설정 파일 로드됨: %s", config_path)
                         return
                         
                 except Exception as e:
-                    print(f"⚠️ 설정 파일 로드 실패 ({config_path}): {e}")
+                    logger.warning("⚠️ 설정 파일 로드 실패 (%s): %s", config_path, e)
                     continue
     
+    def apply_options(self, options: ConversionOptions):
+        """변환 옵션 객체의 값을 도구 설정에 적용"""
+        for field in fields(ConversionOptions):
+            setattr(self, field.name, getattr(options, field.name))
+    
+    def to_options(self) -> ConversionOptions:
+        """현재 도구 설정을 불변 변환 옵션 객체로 반환"""
+        return ConversionOptions(**{field.name: getattr(self, field.name) for field in fields(ConversionOptions)})
+    
+    def profile_options(self, profile_name: str) -> ConversionOptions:
+        """현재 설정에 지정한 프로필의 값을 덮어쓴 변환 옵션 반환"""
+        if profile_name not in self.profiles:
+            raise ValueError(f"설정 파일에 없는 프로필입니다: {profile_name}")
+        
+        overrides = self.profiles[profile_name] or {}
+        option_names = {field.name for field in fields(ConversionOptions)}
+        unknown = [key for key in overrides if key not in option_names]
+        if unknown:
+            raise ValueError(f"프로필 '{profile_name}'에 알 수 없는 설정이 있습니다: {', '.join(unknown)}")
+        return replace(self.to_options(), **overrides)
+    
     def create_default_config(self, config_path='oracle_to_bq_config.json'):
         """기본 설정 파일 생성"""
         default_config = {
@@ -122,10 +1376,10 @@ class SimpleMigrationTool:
         try:
             with open(config_path, 'w', encoding='utf-8') as f:
                 json.dump(default_config, f, indent=2, ensure_ascii=False)
-            print(f"✓ 기본 설정 파일 생성됨: {config_path}")
+            logger.info("✓ 기본 설정 파일 생성됨: %s", config_path)
             return True
         except Exception as e:
-            print(f"❌ 설정 파일 생성 실패: {e}")
+            logger.error("❌ 설정 파일 생성 실패: %s", e)
             return False
     
 
@@ -146,234 +1400,802 @@ class SimpleMigrationTool:
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
                 json.dump(config_template, f, indent=2, ensure_ascii=False)
-            print(f"✓ 설정 파일 템플릿 생성됨: {output_file}")
-            print("  파일을 편집하여 프로젝트 ID와 옵션을 설정하세요.")
+            logger.info("✓ 설정 파일 템플릿 생성됨: %s", output_file)
+            logger.info("  파일을 편집하여 프로젝트 ID와 옵션을 설정하세요.")
         except Exception as e:
-            print(f"❌ 설정 파일 생성 실패: {e}")
+            logger.error("❌ 설정 파일 생성 실패: %s", e)
     
     def convert_oracle_type(self, oracle_type: str, precision: Optional[str] = None, scale: Optional[str] = None) -> str:
         """Oracle 타입을 BigQuery 타입으로 변환 (정밀도와 스케일 정보 보존)"""
-        base_type = oracle_type.upper().split('(')[0]
-        
-        # string_only 모드는 문자열 타입에만 영향을 줌 (다른 타입은 정상 변환)
-        
-        # auto 모드: Oracle 타입에 따라 최적의 BigQuery 타입으로 변환
-        if base_type == 'NUMBER':
-            # NUMBER 타입의 정밀한 변환 로직
-            if precision is None and scale is None:
-                # NUMBER without precision/scale -> NUMERIC (정밀도 보존)
-                return 'NUMERIC'
-            
-            # 정밀도와 스케일을 숫자로 변환
-            try:
-                prec = int(precision) if precision and str(precision).strip() else None
-                sc = int(scale) if scale and str(scale).strip() else None
-            except (ValueError, TypeError):
-                prec = None
-                sc = None
-            
-            # NUMBER with scale 0 (정수형)
-            if sc is not None and sc == 0:
-                if prec is not None and prec <= 18:
-                    return 'INT64'  # INT64 범위 내의 정수
-                elif prec is not None and prec <= 29:
-                    return 'NUMERIC'  # NUMERIC(P, 0)에서 P <= 29
-                else:
-                    return 'BIGNUMERIC'  # 큰 정수는 BIGNUMERIC으로 처리
-            
-            # NUMBER with scale > 0 (소수점 포함)
-            if sc is not None and sc > 0:
-                if prec is not None:
-                    # BigQuery NUMERIC 한계 확인 (38자리 정밀도, 9자리 소수점)
-                    if prec <= 38 and sc <= 9:
-                        return 'NUMERIC'
-                    # BigQuery NUMERIC 한계를 초과하는 경우 BIGNUMERIC 사용
-                    elif prec <= 76 and sc <= 38:
-                        return 'BIGNUMERIC'
-                    else:
-                        # 극한의 정밀도는 STRING으로 처리
-                        return 'STRING'
-                else:
-                    return 'NUMERIC'
-            
-            # NUMBER with negative scale (소수점 왼쪽 반올림)
-            if sc is not None and sc < 0:
-                return 'NUMERIC'
-            
-            # 기타 모든 경우 NUMERIC으로 안전하게 처리
-            return 'NUMERIC'
-        
-        # TIMESTAMP 타입들
-        if base_type.startswith('TIMESTAMP'):
-            return 'DATETIME'
-        
-        # 문자열 타입들
-        if base_type in ['VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR', 'CLOB', 'NCLOB', 'LONG']:
-            return 'STRING'
-        
-        # 바이너리 타입들
-        if base_type in ['BLOB', 'RAW']:
-            return 'BYTES'
-        
-        # DATE 타입
-        if base_type == 'DATE':
-            return 'DATETIME'
-        
-        # 기타 타입들
-        return self.type_mappings.get(base_type, 'STRING')
+        return map_oracle_type(oracle_type, precision, scale)
     
     def detect_encoding(self, file_path: Path) -> str:
-        """파일 인코딩을 자동 감지 (UTF-8, EUC-KR 지원)"""
+        """파일 인코딩을 자동 감지 (UTF-8, EUC-KR 지원, 압축 파일은 압축을 풀어서 확인)"""
+        try:
+            with open_decompressed(open(file_path, 'rb')) as f:
+                # 파일의 앞부분을 읽어서 인코딩이 올바른지 확인
+                sample = f.read(ENCODING_SAMPLE_BYTES)
+        except Exception:
+            sample = None
+        
+        return self.detect_encoding_from_bytes(sample)
+    
+    def detect_encoding_from_bytes(self, sample: Optional[bytes]) -> str:
+        """입력 앞부분 바이트로 인코딩 감지 (표준 입력 등 되감을 수 없는 스트림용)"""
         encodings = ['utf-8', 'euc-kr', 'cp949']
         
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    # 파일의 첫 몇 줄을 읽어서 인코딩이 올바른지 확인
-                    f.read(1024)
-                    print(f"✓ 파일 인코딩 감지: {encoding}")
+        if sample is not None:
+            for encoding in encodings:
+                try:
+                    # 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+                    codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+                    logger.info("✓ 파일 인코딩 감지: %s", encoding)
                     return encoding
-            except UnicodeDecodeError:
-                continue
-            except Exception:
-                continue
+                except UnicodeDecodeError:
+                    continue
         
         # 기본값으로 UTF-8 반환
-        print("⚠️ 인코딩 감지 실패, UTF-8로 시도합니다.")
+        logger.warning("⚠️ 인코딩 감지 실패, UTF-8로 시도합니다.")
         return 'utf-8'
     
+    def open_schema_input(self, input_file: Path, encoding: Optional[str] = None) -> io.TextIOBase:
+        """입력 CSV를 텍스트 스트림으로 열기
+        
+        '-'이면 표준 입력을 사용하고, gzip/bz2/xz/zstd 압축은 매직 바이트로 감지하여
+        디스크에 풀지 않고 스트리밍으로 압축을 풉니다. encoding이 없으면 앞부분으로 감지합니다.
+        """
+        raw = sys.stdin.buffer if str(input_file) == '-' else open(input_file, 'rb')
+        if self.progress.enabled:
+            # 압축 파일은 압축된 바이트 기준으로 진행률 계산 (전체 크기도 압축 파일 크기)
+            raw = io.BufferedReader(_CountingRawReader(raw, self.progress))
+        stream = open_decompressed(raw)
+        
+        if encoding is None:
+            sample, stream = peek_stream(stream, ENCODING_SAMPLE_BYTES)
+            encoding = self.detect_encoding_from_bytes(sample)
+        return io.TextIOWrapper(stream, encoding=encoding)
+    
     def process_csv_file(self, input_file: Path, output_dir: Path) -> bool:
         """CSV 파일을 처리하여 BigQuery DDL 생성"""
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # 파일 인코딩 자동 감지
-            encoding = self.detect_encoding(input_file)
+            tables, schemas = self.read_schema_tables(input_file)
+            self.progress.stop()
+            
+            # 스키마 정보 출력
+            if schemas:
+                logger.info("✓ 발견된 스키마: %s", ', '.join(sorted(schemas)))
+            
+            self.emit_outputs(tables, output_dir)
+            self.report_warnings()
+            
+            return True
+            
+        except Exception as e:
+            self.progress.stop()
+            logger.error("❌ 파일 처리 오류: %s", e)
+            return False
+    
+    def process_csv_file_profiles(self, input_file: Path, output_dir: Path, profile_names: List[str]) -> bool:
+        """CSV 파일을 한 번만 파싱하여 여러 프로필의 출력을 프로필별 디렉토리에 생성"""
+        try:
+            profile_options = [(name, self.profile_options(name)) for name in profile_names]
+            
+            tables, schemas = self.read_schema_tables(input_file)
+            self.progress.stop()
+            if schemas:
+                logger.info("✓ 발견된 스키마: %s", ', '.join(sorted(schemas)))
+            
+            # 타입 결정은 string_mode, preserve_string_length에만 의존하므로 같은 값의 프로필끼리 공유
+            type_caches = {}
+            for name, options in profile_options:
+                profile_tool = SimpleMigrationTool(options=options)
+                profile_tool.merge_output = self.merge_output
+                profile_tool.output_filename = self.output_filename
+                profile_tool.emitters = self.emitters
+                profile_tool.max_script_bytes = self.max_script_bytes
+                profile_tool.max_statements = self.max_statements
+                profile_tool.warning_summary = self.warning_summary
+                profile_tool.progress = self.progress
+                profile_tool.number_samples = self.number_samples
+                
+                profile_dir = output_dir / name
+                profile_dir.mkdir(parents=True, exist_ok=True)
+                logger.info("프로필 '%s' 출력: %s", name, profile_dir)
+                type_cache = type_caches.setdefault((options.string_mode, options.preserve_string_length), {})
+                profile_tool.emit_outputs(tables, profile_dir, type_cache)
+            self.report_warnings()
+            
+            return True
+            
+        except Exception as e:
+            self.progress.stop()
+            logger.error("❌ 파일 처리 오류: %s", e)
+            return False
+    
+    def emit_outputs(self, tables: Dict, output_dir: Path, type_cache: Optional[Dict] = None):
+        """파싱된 테이블 묶음을 선택된 출력 형식(self.emitters)으로 한 번에 생성
+        
+        테이블마다 컬럼 타입을 한 번만 결정하고 DDL, JSON 스키마, 컬럼 목록이 같은 결정을 공유한다.
+        type_cache(테이블 키 -> 결정된 타입)를 넘기면 같은 타입 설정의 다른 실행과 결정을 공유한다.
+        """
+        emit_ddl = 'ddl' in self.emitters
+        emit_json = 'json-schema' in self.emitters
+        emit_inventory = 'inventory-csv' in self.emitters
+        emit_cluster_report = 'cluster-report' in self.emitters
+        emit_export = 'export-sql' in self.emitters
+        
+        table_sections = [] if emit_ddl and self.merge_output else None
+        json_dir = output_dir / 'json_schema'
+        if emit_json:
+            json_dir.mkdir(parents=True, exist_ok=True)
+        inventory_file = output_dir / (Path(self.output_filename).stem + '_inventory.csv')
+        inventory = open(inventory_file, 'w', encoding='utf-8', newline='') if emit_inventory else None
+        cluster_report_file = output_dir / (Path(self.output_filename).stem + '_cluster_report.csv')
+        cluster_report = open(cluster_report_file, 'w', encoding='utf-8', newline='') if emit_cluster_report else None
+        export_file = output_dir / (Path(self.output_filename).stem + '_export.sql')
+        export = open(export_file, 'w', encoding='utf-8') if emit_export and self.merge_output else None
+        export_chunks = 0
+        
+        # 외래키가 있으면 참조되는 테이블이 먼저 오도록 웨이브 순서로 출력
+        foreign_keys = self.resolve_foreign_keys(tables) if emit_ddl and self.create_foreign_keys else {}
+        if foreign_keys:
+            waves, deferred = plan_table_waves(list(tables), foreign_keys)
+            deferred_ids = {id(fk) for table_key, fk in deferred}
+            table_order = sorted(tables, key=lambda key: waves[key])
+        else:
+            waves, deferred, deferred_ids = {}, [], set()
+            table_order = list(tables)
+        
+        narrowed_columns = 0
+        progress = self.progress
+        progress.start('DDL 생성', total_tables=len(table_order))
+        try:
+            if inventory is not None:
+                inventory_writer = csv.writer(inventory)
+                inventory_writer.writerow(INVENTORY_FIELDS)
+            if cluster_report is not None:
+                cluster_report_writer = csv.writer(cluster_report)
+                cluster_report_writer.writerow(CLUSTER_REPORT_FIELDS)
+            if export is not None:
+                export.write("\n".join([
+                    "-- Oracle to BigQuery Data Export",
+                    f"-- Generated on: {self.get_current_timestamp()}",
+                    f"-- Total tables: {len(table_order)}",
+                    "",
+                ]) + "\n")
             
-            with open(input_file, 'r', encoding=encoding) as f:
-                reader = csv.DictReader(f)
+            for table_key in table_order:
+                progress.tables += 1
+                table_info = tables[table_key]
+                schema_name = table_info['schema_name']
+                table_name = table_info['table_name']
+                columns = table_info['columns']
+                if type_cache is None:
+                    resolved_types = self.resolve_column_types(columns)
+                elif table_key in type_cache:
+                    resolved_types = type_cache[table_key]
+                else:
+                    resolved_types = type_cache[table_key] = self.resolve_column_types(columns)
+                plan = self.build_table_plan(schema_name, table_name, columns, resolved_types)
+                narrowed_columns += sum(1 for column in plan.columns if column.narrowed_from)
                 
-                # 테이블별로 그룹화 (스키마명 포함)
-                tables = {}
-                schemas = set()
+                # 파일명 생성 (스키마명 포함)
+                file_stem = f"{schema_name}_{table_name}" if schema_name else table_name
                 
-                for row in reader:
-                    table_name = row.get('TABLE_NAME', '')
-                    # Oracle 스키마명을 BigQuery 데이터셋명으로 사용
-                    # 우선순위: OWNER > SCHEMA_NAME > TABLE_SCHEMA
-                    schema_name = row.get('OWNER', '') or row.get('SCHEMA_NAME', '') or row.get('TABLE_SCHEMA', '')
-                    
-                    if not table_name:
+                if emit_ddl:
+                    table_fks = [fk for fk in foreign_keys.get(table_key, []) if id(fk) not in deferred_ids]
+                    table_ddl = self.render_table_ddl(plan, table_fks)
+                    # apply 명령이 웨이브 순서로 실행하도록 웨이브 주석 추가
+                    wave_lines = [f"-- Wave: {waves[table_key]}"] if foreign_keys else []
+                    if table_sections is not None:
+                        section = self.render_table_section(schema_name, table_name, table_ddl)
+                        table_sections.append((table_key, wave_lines + section))
+                    else:
+                        with open(output_dir / f"{file_stem}.sql", 'w', encoding='utf-8') as f:
+                            f.write("\n".join(wave_lines + [table_ddl]))
+                
+                if emit_json:
+                    json_schema = self.render_json_schema(plan)
+                    with open(json_dir / f"{file_stem}.json", 'w', encoding='utf-8') as f:
+                        json.dump(json_schema, f, ensure_ascii=False, indent=2)
+                        f.write("\n")
+                
+                if emit_export:
+                    chunk_count, export_sql = self.render_export_sql(plan)
+                    export_chunks += chunk_count
+                    if export is not None:
+                        export.write("\n".join(self.render_table_section(schema_name, table_name, export_sql)) + "\n")
+                    else:
+                        with open(output_dir / f"{file_stem}_export.sql", 'w', encoding='utf-8') as f:
+                            f.write(export_sql + "\n")
+                
+                if inventory is not None:
+                    for column in plan.columns:
+                        col = column.source
+                        inventory_writer.writerow([
+                            schema_name or '', table_name, column.name, column.oracle_type,
+                            col['data_precision'] or '', col['data_scale'] or '',
+                            col.get('char_length') or col.get('data_length') or '',
+                            col['nullable'], col.get('is_primary_key', 'N'),
+                            col.get('partition_yn', 'N'), col.get('cluster_yn', 'N'),
+                            column.bq_type, column.declared_type, col.get('column_comment') or ''
+                        ])
+                
+                if cluster_report is not None:
+                    if plan.cluster_reasons:
+                        for position, (column_name, reason) in enumerate(plan.cluster_reasons, 1):
+                            cluster_report_writer.writerow([schema_name or '', table_name, position, column_name,
+                                                            plan.cluster_source, reason])
+                    else:
+                        reason = ("클러스터 비활성화" if not self.enable_clustering
+                                  else "CLUSTER_YN 지정 없음, 인덱스/기본키 정보가 있는 후보 컬럼 없음" if self.recommend_clustering
+                                  else "CLUSTER_YN 지정 없음 (추천 비활성화)")
+                        cluster_report_writer.writerow([schema_name or '', table_name, '', '', '', reason])
+            
+            # 순환 참조 외래키는 모든 테이블을 만든 뒤 마지막 웨이브에서 ALTER TABLE로 추가
+            if deferred:
+                alter_ddl = self.render_deferred_foreign_keys(tables, deferred)
+                wave_lines = [f"-- Wave: {max(waves.values()) + 1}"]
+                if table_sections is not None:
+                    table_sections.append(('(deferred foreign keys)', wave_lines + [
+                        "-- ========================================",
+                        "-- Deferred foreign keys (circular references)",
+                        "-- ========================================",
+                        "",
+                        alter_ddl,
+                        "",
+                    ]))
+                else:
+                    with open(output_dir / 'deferred_foreign_keys.sql', 'w', encoding='utf-8') as f:
+                        f.write("\n".join(wave_lines + [alter_ddl]))
+        finally:
+            progress.stop()
+            if inventory is not None:
+                inventory.close()
+            if cluster_report is not None:
+                cluster_report.close()
+            if export is not None:
+                export.close()
+        
+        if emit_ddl:
+            if table_sections is not None and (self.max_script_bytes or self.max_statements):
+                # 크기/문장 수 제한에 맞춰 테이블 경계에서 여러 파일로 분할
+                manifest_file = self.write_ddl_shards(table_sections, output_dir)
+                logger.info("✓ %d개 테이블 DDL을 분할 파일로 생성 완료: %s", len(tables), manifest_file)
+            elif table_sections is not None:
+                # 모든 DDL을 하나의 파일로 병합
+                merged_file = output_dir / self.output_filename
+                ddl_sections = self.render_merged_header(len(tables))
+                for table_key, section in table_sections:
+                    ddl_sections.extend(section)
+                with open(merged_file, 'w', encoding='utf-8') as f:
+                    f.write("\n".join(ddl_sections))
+                logger.info("✓ %d개 테이블 DDL을 병합 파일로 생성 완료: %s", len(tables), merged_file)
+            else:
+                logger.info("✓ %d개 테이블 DDL 생성 완료: %s", len(tables), output_dir)
+        if narrowed_columns:
+            logger.info("✓ 샘플 기반으로 %d개 NUMBER 컬럼 타입 축소 (컬럼별 결정은 --log-file 로그에 기록)", narrowed_columns)
+        if emit_json:
+            logger.info("✓ %d개 테이블 JSON 스키마 생성 완료: %s", len(tables), json_dir)
+        if emit_inventory:
+            logger.info("✓ 컬럼 목록 생성 완료: %s", inventory_file)
+        if emit_cluster_report:
+            logger.info("✓ 클러스터 선택 이유 생성 완료: %s", cluster_report_file)
+        if emit_export:
+            logger.info("✓ %d개 테이블 데이터 추출 SELECT 생성 완료 (병렬 세션 청크 %d개): %s",
+                        len(tables), export_chunks, export_file if export is not None else output_dir)
+    
+    def resolve_foreign_keys(self, tables: Dict) -> Dict[str, List[Dict]]:
+        """FK_CONSTRAINT_NAME/REFERENCED_CONSTRAINT를 참조 테이블의 기본키/유니크 컬럼으로 해석
+        
+        반환값은 테이블 키별 외래키 목록
+        ({'name', 'columns', 'ref_table_key', 'ref_schema_name', 'ref_table_name', 'ref_columns'}).
+        참조 제약조건을 입력에서 찾을 수 없거나 컬럼 수가 맞지 않는 외래키는 건너뛴다.
+        다중 컬럼 외래키는 양쪽의 제약조건 컬럼 위치(ALL_CONS_COLUMNS.POSITION)가 같은 컬럼끼리
+        짝을 맞추고, 위치 정보가 없으면 경고 후 컬럼 순서(COLUMN_ID)대로 짝을 맞춘다.
+        """
+        # 제약조건명 -> [(테이블 키, 스키마명, [(컬럼, 위치)])] (제약조건명은 스키마별로만 유일)
+        key_constraints = {}
+        for table_key, table_info in tables.items():
+            constraint_columns = {}
+            for col in table_info['columns']:
+                for name_key, position_key in (('pk_constraint_name', 'pk_position'),
+                                               ('unique_constraint_name', 'uk_position')):
+                    constraint_name = col.get(name_key)
+                    if not constraint_name:
                         continue
-                    
-                    # Oracle 스키마명이 있으면 수집 (BigQuery 데이터셋명으로 사용됨)
+                    entries = constraint_columns.setdefault(constraint_name, [])
+                    if all(name != col['column_name'] for name, _ in entries):
+                        entries.append((col['column_name'], parse_stat_int(col.get(position_key))))
+            for constraint_name, entries in constraint_columns.items():
+                key_constraints.setdefault(constraint_name, []).append(
+                    (table_key, table_info['schema_name'], entries))
+        
+        foreign_keys = {}
+        for table_key, table_info in tables.items():
+            fk_columns = {}
+            for col in table_info['columns']:
+                fk_name = col.get('fk_constraint_name')
+                if fk_name and col.get('referenced_constraint'):
+                    entry = fk_columns.setdefault(fk_name, (col['referenced_constraint'], []))
+                    if all(name != col['column_name'] for name, _ in entry[1]):
+                        entry[1].append((col['column_name'], parse_stat_int(col.get('fk_position'))))
+            
+            for fk_name, (referenced, fk_entries) in fk_columns.items():
+                candidates = key_constraints.get(referenced, [])
+                # 같은 스키마의 제약조건을 우선 사용
+                same_schema = [c for c in candidates if c[1] == table_info['schema_name']]
+                matches = same_schema or candidates
+                if len(matches) != 1 or len(matches[0][2]) != len(fk_entries):
+                    self.warn('unresolved_foreign_key', table_key,
+                              "%s의 외래키 %s가 참조하는 %s를 해석할 수 없어 건너뜁니다.", table_key, fk_name, referenced)
+                    continue
+                ref_table_key, ref_schema, ref_entries = matches[0]
+                if len(fk_entries) > 1:
+                    if all(position is not None for _, position in fk_entries + ref_entries):
+                        fk_entries = sorted(fk_entries, key=lambda entry: entry[1])
+                        ref_entries = sorted(ref_entries, key=lambda entry: entry[1])
+                    else:
+                        self.warn('foreign_key_order', table_key,
+                                  "%s의 외래키 %s에 FK_POSITION/PK_POSITION(UK_POSITION)이 없어 컬럼 순서로 %s와 짝을 맞춥니다.",
+                                  table_key, fk_name, referenced)
+                column_names = [name for name, _ in fk_entries]
+                ref_columns = [name for name, _ in ref_entries]
+                foreign_keys.setdefault(table_key, []).append({
+                    'name': fk_name,
+                    'columns': column_names,
+                    'ref_table_key': ref_table_key,
+                    'ref_schema_name': ref_schema,
+                    'ref_table_name': tables[ref_table_key]['table_name'],
+                    'ref_columns': ref_columns,
+                })
+        return foreign_keys
+    
+    def format_foreign_key(self, foreign_key: Dict) -> str:
+        """외래키 제약조건 절 (CONSTRAINT ... FOREIGN KEY (...) REFERENCES ...(...) NOT ENFORCED)"""
+        ref_table = self.format_table_reference(foreign_key['ref_schema_name'], foreign_key['ref_table_name'])
+        columns = ', '.join(self.format_identifier(name) for name in foreign_key['columns'])
+        ref_columns = ', '.join(self.format_identifier(name) for name in foreign_key['ref_columns'])
+        return (f"CONSTRAINT {self.format_identifier(foreign_key['name'])} FOREIGN KEY ({columns}) "
+                f"REFERENCES {ref_table}({ref_columns}) NOT ENFORCED")
+    
+    def render_deferred_foreign_keys(self, tables: Dict, deferred: List[Tuple[str, Dict]]) -> str:
+        """순환 참조 때문에 CREATE 문에 넣지 못한 외래키를 ALTER TABLE 문으로 생성"""
+        statements = []
+        for table_key, foreign_key in deferred:
+            table_info = tables[table_key]
+            full_table_name = self.format_table_reference(table_info['schema_name'], table_info['table_name'])
+            statements.append(f"ALTER TABLE {full_table_name} ADD {self.format_foreign_key(foreign_key)};")
+        return "\n".join(statements)
+    
+    def shard_ddl_sections(self, table_sections: List[Tuple[str, List[str]]]) -> List[List[Tuple[str, List[str]]]]:
+        """테이블별 DDL 섹션을 max_script_bytes/max_statements 제한에 맞게 순서대로 묶음
+        
+        테이블 하나가 제한보다 크면 그 테이블만 담은 파일을 만든다 (테이블 DDL은 나누지 않음).
+        """
+        # 헤더 크기는 전체 테이블 수 기준으로 잡아 실제 파일 헤더보다 작지 않게 함
+        header = self.render_merged_header(len(table_sections)) + ["-- Shard: 000/000"]
+        header_bytes = len("\n".join(header).encode('utf-8')) + 1
+        
+        shards = []
+        current = []
+        current_bytes = header_bytes
+        current_statements = 0
+        for table_key, section in table_sections:
+            section_bytes = len("\n".join(section).encode('utf-8')) + 1
+            section_statements = count_sql_statements(section)
+            
+            over_bytes = self.max_script_bytes and current_bytes + section_bytes > self.max_script_bytes
+            over_statements = self.max_statements and current_statements + section_statements > self.max_statements
+            if current and (over_bytes or over_statements):
+                shards.append(current)
+                current = []
+                current_bytes = header_bytes
+                current_statements = 0
+            
+            if ((self.max_script_bytes and header_bytes + section_bytes > self.max_script_bytes) or
+                    (self.max_statements and section_statements > self.max_statements)):
+                self.warn('oversized_shard', table_key, "테이블 %s의 DDL이 분할 제한보다 커서 단독 파일로 생성합니다.", table_key)
+            current.append((table_key, section))
+            current_bytes += section_bytes
+            current_statements += section_statements
+        if current:
+            shards.append(current)
+        return shards
+    
+    def write_ddl_shards(self, table_sections: List[Tuple[str, List[str]]], output_dir: Path) -> Path:
+        """분할된 DDL 파일(<이름>_001.sql ...)과 파일별 테이블/크기를 담은 매니페스트 생성"""
+        stem = Path(self.output_filename).stem
+        suffix = Path(self.output_filename).suffix or '.sql'
+        shards = self.shard_ddl_sections(table_sections)
+        
+        manifest = {
+            'generated_on': self.get_current_timestamp(),
+            'max_script_bytes': self.max_script_bytes,
+            'max_statements': self.max_statements,
+            'shards': [],
+        }
+        for number, shard in enumerate(shards, 1):
+            shard_file = output_dir / f"{stem}_{number:03d}{suffix}"
+            lines = self.render_merged_header(len(shard))
+            lines.insert(-1, f"-- Shard: {number}/{len(shards)}")
+            for table_key, section in shard:
+                lines.extend(section)
+            content = "\n".join(lines).encode('utf-8')
+            with open(shard_file, 'wb') as f:
+                f.write(content)
+            
+            manifest['shards'].append({
+                'file': shard_file.name,
+                'tables': [table_key for table_key, section in shard],
+                'bytes': len(content),
+                'statements': sum(count_sql_statements(section) for table_key, section in shard),
+            })
+        
+        manifest_file = output_dir / f"{stem}_manifest.json"
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        return manifest_file
+    
+    def resolve_column_types(self, columns: List[Dict]) -> List[Tuple[str, str]]:
+        """컬럼별 (BigQuery 기본 타입, 정밀도/길이 포함 타입) 결정 - 모든 출력 형식이 공유"""
+        # 아주 넓은 테이블은 NUMBER 타입을 NumPy 배열 단위로 한 번에 분류
+        # (NumPy가 없으면 캐시된 컬럼별 변환이 순수 Python 배치 분류보다 빠르므로 그대로 사용)
+        if len(columns) >= BATCH_CLASSIFY_MIN_COLUMNS and _import_numpy() is not None:
+            bq_types = map_oracle_types_batch([col['data_type'] for col in columns],
+                                              [col['data_precision'] for col in columns],
+                                              [col['data_scale'] for col in columns])
+        else:
+            bq_types = [self.convert_oracle_type(col['data_type'], col['data_precision'], col['data_scale'])
+                        for col in columns]
+        
+        resolved = []
+        for col, bq_type in zip(columns, bq_types):
+            oracle_type = col['data_type']
+            precision = col['data_precision']
+            scale = col['data_scale']
+            char_length = col.get('char_length') or col.get('data_length')
+            
+            type_with_precision = self.format_bigquery_type_with_precision(
+                bq_type, oracle_type, precision, scale, char_length
+            )
+            resolved.append((bq_type, type_with_precision))
+        return resolved
+    
+    def read_schema_tables(self, input_file: Path) -> Tuple[Dict, set]:
+        """입력 CSV를 테이블별로 그룹화
+        
+        table_filter가 지정되어 있으면 테이블 오프셋 색인으로 해당 테이블의 바이트 범위만 읽습니다.
+        (압축 파일이나 표준 입력처럼 색인을 쓸 수 없으면 전체를 읽고 걸러냄)
+        """
+        if self.table_filter and str(input_file) != '-':
+            index = TableOffsetIndex.load_or_build(input_file, self)
+            if index is not None:
+                self.progress.start('파싱')
+                return self.group_rows(index.iter_rows(index.select(self.table_filter)))
+        
+        self.progress.start('파싱', total_bytes=None if str(input_file) == '-' else input_file.stat().st_size)
+        
+        if self.parse_workers > 1 and not self.table_filter and str(input_file) != '-':
+            result = self.parse_csv_parallel(input_file, self.parse_workers)
+            if result is not None:
+                return result
+        
+        with self.open_schema_input(input_file) as f:
+            tables, schemas = self.group_rows(csv.DictReader(f))
+        
+        if self.table_filter:
+            tables = {key: info for key, info in tables.items() if table_key_matches(key, self.table_filter)}
+            schemas = {info['schema_name'] for info in tables.values() if info['schema_name']}
+        return tables, schemas
+    
+    def parse_csv_parallel(self, input_file: Path, workers: int,
+                           min_chunk_bytes: int = PARALLEL_MIN_CHUNK_BYTES) -> Optional[Tuple[Dict, set]]:
+        """큰 CSV 한 개를 레코드 경계의 바이트 범위로 나눠 여러 프로세스에서 파싱
+        
+        청크 결과를 파일 순서대로 합치므로 청크 경계에 걸친 테이블도 순차 파싱과 결과가 같습니다.
+        압축 파일이거나 청크로 나눌 만큼 크지 않으면 None을 반환합니다 (순차 파싱 사용).
+        """
+        with open(input_file, 'rb') as f:
+            if detect_compression(f.read(6)) is not None:
+                return None
+        
+        encoding = self.detect_encoding(input_file)
+        fieldnames, chunks = plan_csv_chunks(input_file, encoding, workers, min_chunk_bytes)
+        if len(chunks) < 2:
+            return None
+        
+        logger.info("✓ %d개 청크로 병렬 파싱 (%d개 프로세스)", len(chunks), workers)
+        tables = {}
+        schemas = set()
+        jobs = [(str(input_file), encoding, fieldnames, start, end) for start, end in chunks]
+        progress = self.progress
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for (start, end), groups in zip(chunks, executor.map(_parse_csv_chunk, jobs)):
+                progress.bytes_read = end
+                for table_key, schema_name, table_name, columns in groups:
+                    progress.rows += len(columns)
                     if schema_name:
                         schemas.add(schema_name)
-                    
-                    # 테이블 키 생성 (스키마명 포함 가능)
-                    table_key = table_name
-                    if schema_name:
-                        table_key = f"{schema_name}.{table_name}"
-                    
                     if table_key not in tables:
+                        progress.tables += 1
                         tables[table_key] = {
-                            'schema_name': schema_name if schema_name else None,
+                            'schema_name': schema_name,
                             'table_name': table_name,
                             'columns': []
                         }
-                    
-                    column_info = {
-                        'column_name': row.get('COLUMN_NAME', ''),
-                        'data_type': row.get('DATA_TYPE', ''),
-                        'data_precision': row.get('DATA_PRECISION', ''),
-                        'data_scale': row.get('DATA_SCALE', ''),
-                        'char_length': row.get('CHAR_LENGTH', '') or row.get('DATA_LENGTH', ''),
-                        'data_length': row.get('DATA_LENGTH', ''),
-                        'nullable': row.get('NULLABLE', 'Y'),
-                        'is_primary_key': row.get('IS_PRIMARY_KEY', 'N'),
-                        'fk_constraint_name': row.get('FK_CONSTRAINT_NAME', ''),
-                        'unique_constraint_name': row.get('UNIQUE_CONSTRAINT_NAME', '') or row.get('UK_CONSTRAINT_NAME', ''),
-                        'default_value': row.get('DEFAULT_VALUE', '') or row.get('DATA_DEFAULT', ''),
-                        'data_default': row.get('DATA_DEFAULT', ''),
-                        'column_comment': row.get('COLUMN_COMMENT', '') or row.get('COMMENTS', ''),
-                        # 파티셔닝과 클러스터링 관련 컬럼들 추가 (간소화)
-                        'partition_yn': row.get('PARTITION_YN', 'N'),
-                        'cluster_yn': row.get('CLUSTER_YN', 'N')
-                    }
-                    tables[table_key]['columns'].append(column_info)
-            
-            # 스키마 정보 출력
-            if schemas:
-                print(f"✓ 발견된 스키마: {', '.join(sorted(schemas))}")
+                    tables[table_key]['columns'].extend(columns)
+        return tables, schemas
+    
+    def stream_csv_to_ddl(self, input_file: Path, out) -> bool:
+        """CSV를 읽으면서 테이블이 끝날 때마다 DDL을 스트림(표준 출력 등)에 바로 기록
+        
+        입력은 추출 쿼리처럼 OWNER, TABLE_NAME 순으로 정렬되어 있어야 합니다.
+        """
+        try:
+            out.write("\n".join(self.render_merged_header(None)) + "\n")
             
-            # DDL 생성 방식 결정 (개별 파일 vs 병합 파일)
-            if self.merge_output:
-                # 모든 DDL을 하나의 파일로 병합
-                merged_file = output_dir / self.output_filename
-                self.generate_merged_ddl(tables, merged_file)
-                print(f"✓ {len(tables)}개 테이블 DDL을 병합 파일로 생성 완료: {merged_file}")
-            else:
-                # 각 테이블에 대해 개별 DDL 파일 생성
-                for table_key, table_info in tables.items():
+            table_count = 0
+            with self.open_schema_input(input_file) as f:
+                for table_key, table_info in self.iter_table_groups(csv.DictReader(f)):
+                    if self.table_filter and not table_key_matches(table_key, self.table_filter):
+                        continue
                     schema_name = table_info['schema_name']
                     table_name = table_info['table_name']
-                    columns = table_info['columns']
-                    
-                    # 파일명 생성 (스키마명 포함)
-                    if schema_name:
-                        ddl_file = output_dir / f"{schema_name}_{table_name}.sql"
-                    else:
-                        ddl_file = output_dir / f"{table_name}.sql"
-                    
-                    self.generate_ddl(schema_name, table_name, columns, ddl_file)
-                
-                print(f"✓ {len(tables)}개 테이블 DDL 생성 완료: {output_dir}")
+                    table_ddl = self.create_table_ddl(schema_name, table_name, table_info['columns'])
+                    out.write("\n".join(self.render_table_section(schema_name, table_name, table_ddl)) + "\n")
+                    out.flush()
+                    table_count += 1
             
+            logger.info("✓ %d개 테이블 DDL을 표준 출력으로 생성 완료", table_count)
+            self.report_warnings()
             return True
             
         except Exception as e:
-            print(f"❌ 파일 처리 오류: {e}")
+            logger.error("❌ 파일 처리 오류: %s", e)
             return False
     
-    def needs_backticks(self, name: str) -> bool:
-        """이름에 백틱이 필요한지 확인 (한글, 특수문자, 예약어 등)"""
-        import re
+    def write_estimate_report(self, input_file: Path, out, report_format: str = 'csv', column_out=None) -> int:
+        """CSV를 읽으면서 테이블마다 저장/스캔 크기 추정을 보고서 스트림에 바로 기록 (기록한 테이블 수 반환)
         
-        # 한글이 포함되어 있는지 확인
-        if re.search(r'[가-힣]', name):
-            return True
+        column_out을 주면 컬럼별 추정도 같은 형식으로 기록합니다.
+        입력은 추출 쿼리처럼 OWNER, TABLE_NAME 순으로 정렬되어 있어야 합니다.
+        """
+        table_writer = StreamingReportWriter(out, ESTIMATE_FIELDS, report_format)
+        column_writer = StreamingReportWriter(column_out, ESTIMATE_COLUMN_FIELDS, report_format) if column_out else None
         
-        # 숫자로 시작하는지 확인
-        if name and name[0].isdigit():
-            return True
+        table_count = 0
+        self.progress.start('추정', total_bytes=None if str(input_file) == '-' else input_file.stat().st_size)
+        try:
+            with self.open_schema_input(input_file) as f:
+                for table_key, table_info in self.iter_table_groups(csv.DictReader(f)):
+                    if self.table_filter and not table_key_matches(table_key, self.table_filter):
+                        continue
+                    table_row, column_rows = self.estimate_table(table_info['schema_name'], table_info['table_name'],
+                                                                 table_info['columns'])
+                    table_writer.write(table_row)
+                    if column_writer is not None:
+                        for column_row in column_rows:
+                            column_writer.write(column_row)
+                    table_count += 1
+                    self.progress.tables += 1
+        finally:
+            self.progress.stop()
         
-        # 특수문자가 포함되어 있는지 확인 (언더스코어 제외)
-        if re.search(r'[^a-zA-Z0-9_]', name):
-            return True
+        table_writer.close()
+        if column_writer is not None:
+            column_writer.close()
+        return table_count
+    
+    def estimate_table(self, schema_name: Optional[str], table_name: str,
+                       columns: List[Dict]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """테이블의 BigQuery 논리 크기와 스캔 크기 추정 (테이블 보고서 행, 컬럼 보고서 행 목록)
+        
+        FULL_SCAN_BYTES는 파티션 없이 전체를 읽을 때, PARTITION_SCAN_BYTES는 생성된 파티션 하나만 읽을 때의
+        스캔 크기이며 둘 다 테이블당 최소 과금 크기(10MB)를 적용합니다.
+        근거(BASIS)는 모든 컬럼이 통계로 계산되면 'stats', 일부가 선언 길이이거나 빠지면 'partial',
+        NUM_ROWS가 없으면 'missing'입니다.
+        """
+        plan = self.build_table_plan(schema_name, table_name, columns)
+        num_rows = parse_stat_int(columns[0].get('num_rows')) if columns else None
         
-        # BigQuery 예약어 확인 (일부만)
-        reserved_words = {
-            'ALL', 'AND', 'ANY', 'ARRAY', 'AS', 'ASC', 'ASSERT_ROWS_MODIFIED',
-            'AT', 'BETWEEN', 'BY', 'CASE', 'CAST', 'COLLATE', 'CONTAINS',
-            'CREATE', 'CROSS', 'CUBE', 'CURRENT', 'DEFAULT', 'DEFINE',
-            'DESC', 'DISTINCT', 'ELSE', 'END', 'ENUM', 'ESCAPE', 'EXCEPT',
-            'EXCLUDE', 'EXISTS', 'EXTRACT', 'FALSE', 'FETCH', 'FOLLOWING',
-            'FOR', 'FROM', 'FULL', 'GROUP', 'GROUPING', 'GROUPS', 'HASH',
-            'HAVING', 'IF', 'IGNORE', 'IN', 'INNER', 'INTERSECT', 'INTERVAL',
-            'INTO', 'IS', 'JOIN', 'LATERAL', 'LEFT', 'LIKE', 'LIMIT',
-            'LOOKUP', 'MERGE', 'NATURAL', 'NEW', 'NO', 'NOT', 'NULL',
-            'NULLS', 'OF', 'ON', 'OR', 'ORDER', 'OUTER', 'OVER',
-            'PARTITION', 'PRECEDING', 'PROTO', 'RANGE', 'RECURSIVE',
-            'RESPECT', 'RIGHT', 'ROLLUP', 'ROWS', 'SELECT', 'SET',
-            'SOME', 'STRUCT', 'TABLESAMPLE', 'THEN', 'TO', 'TREAT',
-            'TRUE', 'UNBOUNDED', 'UNION', 'UNNEST', 'USING', 'WHEN',
-            'WHERE', 'WINDOW', 'WITH', 'WITHIN'
+        logical_bytes = 0
+        bases = set()
+        column_rows = []
+        for column in plan.columns:
+            source = column.source
+            num_nulls = parse_stat_int(source.get('num_nulls'))
+            avg_col_len = parse_stat_int(source.get('avg_col_len'))
+            size, basis = estimate_column_bytes(column.bq_type, num_rows, num_nulls, avg_col_len,
+                                                parse_stat_int(source.get('data_length')))
+            bases.add(basis)
+            logical_bytes += size or 0
+            column_rows.append({
+                'OWNER': schema_name or '', 'TABLE_NAME': table_name, 'COLUMN_NAME': column.name,
+                'BQ_TYPE': column.declared_type, 'NUM_ROWS': num_rows, 'NUM_NULLS': num_nulls,
+                'AVG_COL_LEN': avg_col_len, 'LOGICAL_BYTES': size, 'BASIS': basis,
+            })
+        
+        if num_rows is None:
+            table_basis = 'missing'
+            logical_bytes = None
+        else:
+            table_basis = 'stats' if bases == {'stats'} else 'partial'
+        partition_unit, partition_count = self.partition_count_for(plan)
+        table_row = {
+            'OWNER': schema_name or '', 'TABLE_NAME': table_name, 'NUM_ROWS': num_rows,
+            'COLUMN_COUNT': len(plan.columns),
+            'ORACLE_BYTES': self.table_storage_bytes(plan.columns[0]) if plan.columns else None,
+            'LOGICAL_BYTES': logical_bytes,
+            'PARTITION_COLUMN': plan.partition_column.name if plan.partition_clause else '',
+            'PARTITION_UNIT': partition_unit, 'PARTITION_COUNT': partition_count,
+            'FULL_SCAN_BYTES': max(logical_bytes, BIGQUERY_MIN_SCAN_BYTES) if logical_bytes is not None else None,
+            'PARTITION_SCAN_BYTES': (max(-(-logical_bytes // partition_count), BIGQUERY_MIN_SCAN_BYTES)
+                                     if logical_bytes is not None and partition_count else None),
+            'BASIS': table_basis,
         }
+        return table_row, column_rows
+    
+    def partition_count_for(self, plan: TablePlan) -> Tuple[str, Optional[int]]:
+        """생성된 파티션 절의 단위('RANGE' 또는 날짜 단위)와 파티션 컬럼 통계로 추정한 데이터가 있는 파티션 수
         
-        if name.upper() in reserved_words:
-            return True
+        파티션이 없으면 ('', None), 컬럼 최솟값/최댓값 통계가 없으면 파티션 수는 None입니다.
+        """
+        column = plan.partition_column
+        if not plan.partition_clause or column is None:
+            return '', None
+        source = column.source
+        bucket_range = RANGE_BUCKET_PATTERN.search(plan.partition_clause)
+        if bucket_range:
+            unit = 'RANGE'
+            start, end, step = (int(value) for value in bucket_range.groups())
+            low = decode_oracle_number(source.get('low_value'))
+            high = decode_oracle_number(source.get('high_value'))
+            if low is None or high is None:
+                return unit, None
+            count = min((int(high) - int(low)) // step + 1, (end - start) // step)
+        else:
+            unit_match = PARTITION_UNIT_PATTERN.search(plan.partition_clause)
+            unit = unit_match.group(1) if unit_match else 'DAY'
+            low = decode_oracle_date(source.get('low_value'))
+            high = decode_oracle_date(source.get('high_value'))
+            if not (low and high and high >= low):
+                return unit, None
+            count = int((high - low).total_seconds() / 86400 / PARTITION_GRANULARITY_DAYS[unit]) + 1
+        # 고유값 수보다 많은 파티션에 데이터가 들어갈 수는 없음
+        num_distinct = parse_stat_int(source.get('num_distinct'))
+        if num_distinct:
+            count = min(count, num_distinct)
+        return unit, max(1, count)
+    
+    def parse_schema_row(self, row: Mapping[str, str]) -> Optional[Tuple[str, Optional[str], str, Dict]]:
+        """CSV 한 행을 (테이블 키, 스키마명, 테이블명, 컬럼 정보)로 변환 (TABLE_NAME이 없으면 None)"""
+        table_name = row.get('TABLE_NAME', '')
+        # Oracle 스키마명을 BigQuery 데이터셋명으로 사용
+        # 우선순위: OWNER > SCHEMA_NAME > TABLE_SCHEMA
+        schema_name = row.get('OWNER', '') or row.get('SCHEMA_NAME', '') or row.get('TABLE_SCHEMA', '')
+        
+        if not table_name:
+            return None
         
-        return False
+        # 테이블 키 생성 (스키마명 포함 가능)
+        table_key = table_name
+        if schema_name:
+            table_key = f"{schema_name}.{table_name}"
+        
+        column_info = {
+            'column_name': row.get('COLUMN_NAME', ''),
+            'data_type': row.get('DATA_TYPE', ''),
+            'data_precision': row.get('DATA_PRECISION', ''),
+            'data_scale': row.get('DATA_SCALE', ''),
+            'char_length': row.get('CHAR_LENGTH', '') or row.get('DATA_LENGTH', ''),
+            'data_length': row.get('DATA_LENGTH', ''),
+            'nullable': row.get('NULLABLE', 'Y'),
+            'is_primary_key': row.get('IS_PRIMARY_KEY', 'N'),
+            'pk_constraint_name': row.get('PK_CONSTRAINT_NAME', ''),
+            'fk_constraint_name': row.get('FK_CONSTRAINT_NAME', ''),
+            'referenced_constraint': row.get('REFERENCED_CONSTRAINT', ''),
+            'unique_constraint_name': row.get('UNIQUE_CONSTRAINT_NAME', '') or row.get('UK_CONSTRAINT_NAME', ''),
+            # 제약조건 안에서의 컬럼 위치 (ALL_CONS_COLUMNS.POSITION, 다중 컬럼 외래키 짝 맞춤용)
+            'pk_position': row.get('PK_POSITION', ''),
+            'fk_position': row.get('FK_POSITION', ''),
+            'uk_position': row.get('UK_POSITION', ''),
+            'default_value': row.get('DEFAULT_VALUE', '') or row.get('DATA_DEFAULT', ''),
+            'data_default': row.get('DATA_DEFAULT', ''),
+            'column_comment': row.get('COLUMN_COMMENT', '') or row.get('COMMENTS', ''),
+            # 파티셔닝과 클러스터링 관련 컬럼들 추가 (간소화)
+            'partition_yn': row.get('PARTITION_YN', 'N'),
+            'cluster_yn': row.get('CLUSTER_YN', 'N'),
+            # 컬럼 통계 (추출 쿼리 옵션 5, LOW_VALUE/HIGH_VALUE는 RAWTOHEX 값)
+            'low_value': row.get('LOW_VALUE', ''),
+            'high_value': row.get('HIGH_VALUE', ''),
+            'num_distinct': row.get('NUM_DISTINCT', ''),
+            'num_rows': row.get('NUM_ROWS', ''),
+            'blocks': row.get('BLOCKS', ''),
+            # 인덱스 사용 정보 (추출 쿼리 옵션 5, 클러스터 추천용)
+            'index_count': row.get('INDEX_COUNT', ''),
+            'leading_index_count': row.get('LEADING_INDEX_COUNT', ''),
+            'min_index_position': row.get('MIN_INDEX_POSITION', ''),
+            'unique_index_position': row.get('UNIQUE_INDEX_POSITION', ''),
+            # 저장 크기 추정용 컬럼 통계 (추출 쿼리 옵션 5, estimate 명령)
+            'num_nulls': row.get('NUM_NULLS', ''),
+            'avg_col_len': row.get('AVG_COL_LEN', ''),
+            # Oracle 파티션 방식 (추출 쿼리 옵션 5, ALL_PART_TABLES와 파티션/서브파티션 키 위치)
+            'partitioning_type': row.get('PARTITIONING_TYPE', ''),
+            'subpartitioning_type': row.get('SUBPARTITIONING_TYPE', ''),
+            'partition_interval': row.get('PARTITION_INTERVAL', '') or row.get('INTERVAL', ''),
+            'partition_key_position': row.get('PARTITION_KEY_POSITION', ''),
+            'subpartition_key_position': row.get('SUBPARTITION_KEY_POSITION', '')
+        }
+        return table_key, (schema_name if schema_name else None), table_name, column_info
+    
+    def group_rows(self, rows: Iterable[Mapping[str, str]]) -> Tuple[Dict, set]:
+        """행들을 테이블별로 그룹화 (스키마명 포함)"""
+        tables = {}
+        schemas = set()
+        progress = self.progress
+        
+        for row in rows:
+            progress.rows += 1
+            parsed = self.parse_schema_row(row)
+            if parsed is None:
+                continue
+            table_key, schema_name, table_name, column_info = parsed
+            
+            # Oracle 스키마명이 있으면 수집 (BigQuery 데이터셋명으로 사용됨)
+            if schema_name:
+                schemas.add(schema_name)
+            
+            if table_key not in tables:
+                progress.tables += 1
+                tables[table_key] = {
+                    'schema_name': schema_name,
+                    'table_name': table_name,
+                    'columns': []
+                }
+            tables[table_key]['columns'].append(column_info)
+        
+        return tables, schemas
+    
+    def iter_table_groups(self, rows: Iterable[Mapping[str, str]]) -> Iterator[Tuple[str, Dict]]:
+        """테이블별로 정렬된 행들을 읽으면서 테이블이 끝날 때마다 (테이블 키, 테이블 정보)를 반환
+        
+        추출 쿼리처럼 OWNER, TABLE_NAME 순으로 정렬된 입력을 전제로 하며,
+        이미 반환한 테이블의 행이 다시 나오면 ValueError를 발생시킵니다.
+        """
+        current_key = None
+        current_info = None
+        finished = set()
+        
+        for row in rows:
+            parsed = self.parse_schema_row(row)
+            if parsed is None:
+                continue
+            table_key, schema_name, table_name, column_info = parsed
+            
+            if table_key != current_key:
+                if current_info is not None:
+                    finished.add(current_key)
+                    yield current_key, current_info
+                if table_key in finished:
+                    raise ValueError(f"입력이 테이블별로 정렬되어 있지 않습니다: {table_key}")
+                current_key = table_key
+                current_info = {
+                    'schema_name': schema_name,
+                    'table_name': table_name,
+                    'columns': []
+                }
+            current_info['columns'].append(column_info)
+        
+        if current_info is not None:
+            yield current_key, current_info
+    
+    def needs_backticks(self, name: str) -> bool:
+        """이름에 백틱이 필요한지 확인 (한글, 특수문자, 예약어 등)"""
+        return identifier_needs_backticks(name)
     
     def format_identifier(self, name: str) -> str:
         """식별자를 적절히 포맷팅 (필요시 백틱 추가)"""
@@ -390,37 +2212,47 @@ class SimpleMigrationTool:
     
     def generate_merged_ddl(self, tables: Dict, output_file: Path):
         """모든 테이블의 DDL을 하나의 파일로 병합 생성"""
-        ddl_sections = []
-        
         # 파일 헤더
-        ddl_sections.append("-- Oracle to BigQuery DDL Migration")
-        ddl_sections.append(f"-- Generated on: {self.get_current_timestamp()}")
-        ddl_sections.append(f"-- Total tables: {len(tables)}")
-        ddl_sections.append("")
+        ddl_sections = self.render_merged_header(len(tables))
         
         for table_key, table_info in tables.items():
             schema_name = table_info['schema_name']
             table_name = table_info['table_name']
             columns = table_info['columns']
             
-            # 테이블별 섹션 구분
-            ddl_sections.append(f"-- ========================================")
-            ddl_sections.append(f"-- Table: {table_name}")
-            if schema_name:
-                ddl_sections.append(f"-- Schema: {schema_name}")
-            ddl_sections.append(f"-- ========================================")
-            ddl_sections.append("")
-            
             # 테이블 DDL 생성
             table_ddl = self.create_table_ddl(schema_name, table_name, columns)
-            ddl_sections.append(table_ddl)
-            ddl_sections.append("")
+            ddl_sections.extend(self.render_table_section(schema_name, table_name, table_ddl))
         
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write("\n".join(ddl_sections))
     
-    def create_table_ddl(self, schema_name: Optional[str], table_name: str, columns: List[Dict]) -> str:
-        """개별 테이블의 DDL 문자열 생성"""
+    def render_merged_header(self, total_tables: Optional[int]) -> List[str]:
+        """병합 DDL 파일 헤더 줄 목록 생성 (스트리밍 출력처럼 테이블 수를 미리 모르면 None)"""
+        header = [
+            "-- Oracle to BigQuery DDL Migration",
+            f"-- Generated on: {self.get_current_timestamp()}",
+        ]
+        if total_tables is not None:
+            header.append(f"-- Total tables: {total_tables}")
+        header.append("")
+        return header
+    
+    def render_table_section(self, schema_name: Optional[str], table_name: str, table_ddl: str) -> List[str]:
+        """병합 DDL 파일의 테이블별 섹션 줄 목록 생성 (구분 주석 + DDL)"""
+        section = []
+        section.append(f"-- ========================================")
+        section.append(f"-- Table: {table_name}")
+        if schema_name:
+            section.append(f"-- Schema: {schema_name}")
+        section.append(f"-- ========================================")
+        section.append("")
+        section.append(table_ddl)
+        section.append("")
+        return section
+    
+    def format_table_reference(self, schema_name: Optional[str], table_name: str) -> str:
+        """DDL에서 사용할 전체 테이블명 (`프로젝트.데이터셋.테이블` 또는 `데이터셋.테이블`)"""
         # BigQuery 데이터셋명 결정 (Oracle OWNER/스키마명의 원본 대소문자 유지)
         dataset_name = schema_name if schema_name else 'your_dataset'
         
@@ -429,316 +2261,2308 @@ class SimpleMigrationTool:
         
         # 전체 테이블명 생성 - project_id가 없으면 데이터셋.테이블명 형태로
         if self.project_id and self.project_id.strip():
-            full_table_name = f"`{self.project_id}.{dataset_name}.{clean_table_name}`"
-        else:
-            full_table_name = f"`{dataset_name}.{clean_table_name}`"
-        
-        # 파티션 테이블 여부 확인 (나중에 사용)
-        has_partition = any(col.get('partition_yn', 'N').upper() == 'Y' for col in columns)
+            return f"`{self.project_id}.{dataset_name}.{clean_table_name}`"
+        return f"`{dataset_name}.{clean_table_name}`"
+    
+    def create_table_ddl(self, schema_name: Optional[str], table_name: str, columns: List[Dict],
+                         resolved_types: Optional[List[Tuple[str, str]]] = None,
+                         foreign_keys: Optional[List[Dict]] = None) -> str:
+        """개별 테이블의 DDL 문자열 생성 (resolved_types가 없으면 resolve_column_types로 결정)
         
-        # DROP 문 추가 (파티션 테이블이고 옵션이 활성화된 경우)
-        ddl_lines = []
-        if self.create_or_replace and has_partition and self.drop_partition_table_before_create:
-            ddl_lines.append(f"DROP TABLE IF EXISTS {full_table_name};")
-            ddl_lines.append("")  # 빈 줄 추가
+        foreign_keys는 resolve_foreign_keys 결과 중 CREATE 문에 함께 넣을 외래키 목록
+        """
+        plan = self.build_table_plan(schema_name, table_name, columns, resolved_types)
+        return self.render_table_ddl(plan, foreign_keys)
+    
+    def build_table_plan(self, schema_name: Optional[str], table_name: str, columns: List[Dict],
+                         resolved_types: Optional[List[Tuple[str, str]]] = None) -> TablePlan:
+        """컬럼을 한 번만 훑어 타입, 식별자, 기본키, 파티션/클러스터 결정을 담은 TablePlan 생성
         
-        # CREATE 또는 CREATE OR REPLACE 선택
-        create_statement = "CREATE OR REPLACE TABLE" if self.create_or_replace else "CREATE TABLE"
-        ddl_lines.append(f"{create_statement} {full_table_name} (")
+        같은 컬럼 목록과 옵션에 대한 계획은 캐시하여 여러 출력 형식이 다시 계산하지 않게 한다.
+        """
+        cache_key = (schema_name, table_name, id(columns), len(columns), self.to_options())
+        cached = self._plan_cache.get(cache_key)
+        if cached is not None and cached[0] is columns:
+            self._plan_cache.move_to_end(cache_key)
+            return cached[1]
         
-        column_definitions = []
-        primary_key_columns = []
+        if resolved_types is None:
+            resolved_types = self.resolve_column_types(columns)
         
-        for col in columns:
+        table_label = f"{schema_name}.{table_name}" if schema_name else table_name
+        column_plans = []
+        primary_key = []
+        has_partition = False
+        partition_keys = []
+        subpartition_keys = []
+        cluster_columns = []
+        cluster_reasons = []
+        for col, (bq_type, type_with_precision) in zip(columns, resolved_types):
             col_name = col['column_name']
-            oracle_type = col['data_type']
-            precision = col['data_precision']
-            scale = col['data_scale']
-            char_length = col.get('char_length') or col.get('data_length')
-            nullable = col['nullable']
-            is_primary_key = col.get('is_primary_key', 'N').upper()
-            
-            bq_type = self.convert_oracle_type(oracle_type, precision, scale)
-            
-            # 컬럼명 포맷팅 (백틱 처리)
-            formatted_col_name = self.format_identifier(col_name)
-            
-            # BigQuery 타입에 정밀도/스케일 정보 추가
-            type_with_precision = self.format_bigquery_type_with_precision(
-                bq_type, oracle_type, precision, scale, char_length
+            narrowed_from = ''
+            if self.number_samples:
+                bq_type, type_with_precision, narrowed_from = self.narrow_column_type(
+                    schema_name, table_name, col, bq_type, type_with_precision)
+            column = ColumnPlan(
+                name=col_name,
+                identifier=self.format_identifier(col_name),
+                oracle_type=col['data_type'],
+                bq_type=bq_type,
+                declared_type=type_with_precision,
+                nullable=col['nullable'] != 'N',
+                is_primary_key=col.get('is_primary_key', 'N').upper() == 'Y',
+                description=self.create_column_description(col),
+                source=col,
+                narrowed_from=narrowed_from,
             )
+            column_plans.append(column)
             
-            # 컬럼 정의
-            col_def = f"  {formatted_col_name} {type_with_precision}"
-            if nullable == 'N':
-                col_def += " NOT NULL"
-            
-            # 설명 추가 (Oracle 타입 정보 포함)
-            description = self.create_column_description(col)
-            if description:
-                # BigQuery에서는 OPTIONS로 description 추가
-                col_def += f" OPTIONS(description=\"{self.escape_description(description)}\")"
+            # 기본키 컬럼 수집
+            if self.create_primary_keys and column.is_primary_key:
+                primary_key.append(column.identifier)
             
-            column_definitions.append(col_def)
+            # 파티션 키 컬럼 (PARTITION_YN = 'Y', 파티션 방식에 따라 아래에서 파티션/클러스터 컬럼 결정)
+            if str(col.get('partition_yn') or 'N').upper() == 'Y':
+                has_partition = True
+                if col_name:
+                    partition_keys.append(column)
+            if col_name and parse_stat_int(col.get('subpartition_key_position')) is not None:
+                subpartition_keys.append(column)
             
-            # 기본키 컬럼 수집
-            if self.create_primary_keys and is_primary_key == 'Y':
-                primary_key_columns.append(formatted_col_name)
-        
-        ddl_lines.append(",\n".join(column_definitions))
+            # 클러스터 컬럼 (CLUSTER_YN = 'Y')
+            if self.enable_clustering and col_name and str(col.get('cluster_yn') or 'N').upper() == 'Y':
+                cluster_columns.append(column.identifier)
+                cluster_reasons.append((col_name, "CLUSTER_YN = 'Y' (수동 지정)"))
         
-        # 기본키 제약조건 추가 (BigQuery는 PRIMARY KEY를 지원하지만 enforced되지 않음)
-        # BigQuery는 최대 16개의 기본키 컬럼만 지원
-        if primary_key_columns:
-            if len(primary_key_columns) > 16:
-                if self.debug_mode:
-                    print(f"WARNING: 기본키 컬럼이 {len(primary_key_columns)}개입니다. BigQuery는 최대 16개만 지원하므로 처음 16개만 사용합니다.")
-                primary_key_columns = primary_key_columns[:16]
-            
-            ddl_lines.append(",")
-            pk_constraint = f"  PRIMARY KEY ({', '.join(primary_key_columns)}) NOT ENFORCED"
-            ddl_lines.append(pk_constraint)
+        partition_column, scheme_clusters = self.select_partition_keys(partition_keys, subpartition_keys, table_label)
         
-        ddl_lines.append(")")
+        # Oracle 파티션 방식에서 클러스터로 옮긴 키 (CLUSTER_YN 지정 뒤에 추가)
+        cluster_source = 'manual' if cluster_columns else ''
+        if self.enable_clustering:
+            for column, reason in scheme_clusters:
+                if column.identifier in cluster_columns or len(cluster_columns) >= MAX_CLUSTER_COLUMNS:
+                    continue
+                cluster_columns.append(column.identifier)
+                cluster_reasons.append((column.name, reason))
+                cluster_source = cluster_source or 'partitioning'
         
-        # 파티셔닝과 클러스터링 추가
-        partition_clause, cluster_clause = self.generate_partition_cluster_clauses(columns)
+        # 클러스터 컬럼이 없으면 인덱스/통계 정보로 클러스터 컬럼 추천
+        if self.enable_clustering and self.recommend_clustering and not cluster_columns:
+            recommended = recommend_cluster_columns(column_plans, exclude=partition_column)
+            cluster_columns = [column.identifier for column, reason in recommended]
+            cluster_reasons = [(column.name, reason) for column, reason in recommended]
+            cluster_source = 'recommended' if recommended else ''
         
-        if partition_clause:
-            ddl_lines.append(partition_clause)
+        # BigQuery는 최대 16개의 기본키 컬럼만 지원
+        if len(primary_key) > 16:
+            self.warn('primary_key_limit', table_label,
+                      "%s: 기본키 컬럼이 %d개입니다. BigQuery는 최대 16개만 지원하므로 처음 16개만 사용합니다.",
+                      table_label, len(primary_key))
+            primary_key = primary_key[:16]
         
-        if cluster_clause:
-            ddl_lines.append(cluster_clause)
+        if partition_column or cluster_columns:
+            logger.debug("%s 파티션 컬럼: %s, 클러스터 컬럼: %s", table_label,
+                         partition_column.name if partition_column else '-', ', '.join(cluster_columns) or '-')
         
-        # 파티션 만료 설정 추가
-        if self.enable_partitioning and self.partition_expiration_days:
-            expiration_clause = f"OPTIONS(partition_expiration_days={self.partition_expiration_days})"
-            ddl_lines.append(expiration_clause)
+        partition_clause = self.partition_clause_for(partition_column, table_label) if partition_column else None
+        table_bytes = self.table_storage_bytes(column_plans[0]) if column_plans else None
+        require_partition_filter = (partition_clause is not None and table_bytes is not None
+                                    and self.require_partition_filter_gb is not None
+                                    and table_bytes >= float(self.require_partition_filter_gb) * 1024 ** 3)
         
-        ddl_lines.append(";")
+        plan = TablePlan(
+            schema_name=schema_name,
+            table_name=table_name,
+            full_name=self.format_table_reference(schema_name, table_name),
+            columns=tuple(column_plans),
+            primary_key=tuple(primary_key),
+            has_partition=has_partition,
+            partition_column=partition_column,
+            partition_clause=partition_clause,
+            cluster_columns=tuple(cluster_columns),
+            cluster_clause=f"CLUSTER BY {', '.join(cluster_columns)}" if cluster_columns else None,
+            cluster_source=cluster_source,
+            cluster_reasons=tuple(cluster_reasons),
+            require_partition_filter=require_partition_filter,
+        )
         
-        return "\n".join(ddl_lines)
+        self._plan_cache[cache_key] = (columns, plan)
+        if len(self._plan_cache) > PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+        return plan
     
-    def get_current_timestamp(self) -> str:
-        """현재 타임스탬프 반환"""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def load_type_samples(self, path: Path) -> int:
+        """NUMBER 타입 축소용 샘플을 읽어 self.number_samples에 저장 (읽은 컬럼 수 반환)
+        
+        - 파일: 미리 계산한 통계 CSV (OWNER, TABLE_NAME, COLUMN_NAME, MIN_VALUE, MAX_VALUE, HAS_FRACTION, MAX_SCALE)
+        - 디렉토리: 테이블별 데이터 샘플 CSV (파일명은 OWNER.TABLE_NAME.csv 또는 TABLE_NAME.csv, 첫 행은 컬럼명)
+        압축 파일과 인코딩은 스키마 CSV와 같은 방식으로 처리합니다.
+        """
+        samples = {}
+        if path.is_dir():
+            csv_suffixes = ('.csv',) + tuple('.csv' + suffix for suffix in COMPRESSION_SUFFIXES)
+            sample_files = sorted(file for file in path.iterdir()
+                                  if file.is_file() and file.name.lower().endswith(csv_suffixes))
+            for sample_file in sample_files:
+                table_key = schema_output_stem(sample_file).upper()
+                with self.open_schema_input(sample_file) as f:
+                    reader = csv.reader(f)
+                    header = next(reader, None) or []
+                    values = [[] for _ in header]
+                    for row in reader:
+                        for index, value in enumerate(row[:len(header)]):
+                            values[index].append(value)
+                for column_name, column_values in zip(header, values):
+                    sample = summarize_number_values(column_values)
+                    if sample is not None:
+                        samples[(table_key, column_name.strip().upper())] = sample
+        else:
+            with self.open_schema_input(path) as f:
+                for row in csv.DictReader(f):
+                    table_name = (row.get('TABLE_NAME') or '').strip()
+                    column_name = (row.get('COLUMN_NAME') or '').strip()
+                    low = parse_stat_decimal(row.get('MIN_VALUE'))
+                    high = parse_stat_decimal(row.get('MAX_VALUE'))
+                    if not table_name or not column_name or low is None or high is None:
+                        continue
+                    owner = (row.get('OWNER') or '').strip()
+                    has_fraction = (row.get('HAS_FRACTION') or 'N').strip().upper() == 'Y'
+                    max_scale = parse_stat_int(row.get('MAX_SCALE')) if has_fraction else 0
+                    table_key = f"{owner}.{table_name}" if owner else table_name
+                    samples[(table_key.upper(), column_name.upper())] = NumberSample(low, high, max_scale)
+        
+        self.number_samples = samples
+        self._plan_cache.clear()
+        return len(samples)
     
-    def generate_partition_cluster_clauses(self, columns: List[Dict]) -> tuple:
-        """파티셔닝과 클러스터링 절 생성"""
-        partition_clause = None
-        cluster_clause = None
+    def narrow_column_type(self, schema_name: Optional[str], table_name: str, col: Dict,
+                           bq_type: str, type_with_precision: str) -> Tuple[str, str, str]:
+        """샘플이 있는 NUMBER 컬럼의 타입을 축소하여 (BigQuery 타입, 정밀도 포함 타입, 축소 전 타입) 반환
         
-        if not self.enable_partitioning and not self.enable_clustering:
-            return partition_clause, cluster_clause
+        정밀도가 없는 NUMBER는 INT64 또는 가장 좁은 NUMERIC(P, S)로, NUMBER(P, 0)은 INT64로만 축소하며
+        소수 자릿수가 선언된 NUMBER(P, S)는 그대로 둡니다. 축소하지 않으면 축소 전 타입은 빈 문자열입니다.
+        """
+        unchanged = bq_type, type_with_precision, ''
+        if bq_type not in ('NUMERIC', 'BIGNUMERIC') or col['data_type'].upper().split('(')[0] != 'NUMBER':
+            return unchanged
+        column_name = col['column_name'].upper()
+        sample = None
+        if schema_name:
+            sample = self.number_samples.get((f"{schema_name}.{table_name}".upper(), column_name))
+        if sample is None:
+            sample = self.number_samples.get((table_name.upper(), column_name))
+        if sample is None:
+            return unchanged
         
-        # 파티셔닝 설정 확인
-        partition_columns = []
-        partition_type = None
+        scale = parse_stat_int(col['data_scale'])
+        if (scale is not None and scale != 0) or (scale is None and parse_stat_int(col['data_precision']) is not None):
+            return unchanged
+        table_label = f"{schema_name}.{table_name}" if schema_name else table_name
+        narrowed = narrow_number_type(sample, int(self.narrowing_margin_digits), integer_only=scale == 0)
+        if narrowed is None:
+            logger.debug("%s.%s: %s 유지 (샘플 범위 %s ~ %s, 소수 자릿수 %s)", table_label, col['column_name'],
+                         type_with_precision, sample.min_value, sample.max_value,
+                         sample.max_scale if sample.max_scale is not None else '알 수 없음')
+            return unchanged
         
-        # 클러스터링 설정 확인
-        cluster_columns = []
+        narrowed_type, precision, narrowed_scale = narrowed
+        declared = format_type_with_precision(narrowed_type, None if precision is None else str(precision),
+                                              None if narrowed_scale is None else str(narrowed_scale), None)
+        logger.debug("%s.%s: %s → %s (%s, 범위 %s ~ %s, 소수 자릿수 %d, 여유 %d자리)", table_label,
+                     col['column_name'], type_with_precision, declared,
+                     f"샘플 {sample.count}개" if sample.count else '샘플 통계', sample.min_value,
+                     sample.max_value, sample.max_scale, int(self.narrowing_margin_digits))
+        return narrowed_type, declared, type_with_precision
+    
+    def select_partition_keys(self, partition_keys: List[ColumnPlan], subpartition_keys: List[ColumnPlan],
+                              table_label: str = '') -> Tuple[Optional[ColumnPlan], List[Tuple[ColumnPlan, str]]]:
+        """Oracle 파티션 방식(PARTITIONING_TYPE)에 따라 BigQuery 파티션 컬럼과 클러스터로 옮길 키 컬럼 결정
         
-        for col in columns:
-            column_name = col.get('column_name', '')
-            if self.debug_mode:
-                print(f"DEBUG: 컬럼 {column_name} - partition_yn: {col.get('partition_yn', 'N')}, cluster_yn: {col.get('cluster_yn', 'N')}")
-            
-            # 파티셔닝 확인 (PARTITION_YN = 'Y')
-            partition_yn = col.get('partition_yn', 'N')
-            if (self.enable_partitioning and 
-                partition_yn and str(partition_yn).upper() == 'Y'):
-                data_type = col.get('data_type', '').upper()
-                if column_name:
-                    if self.debug_mode:
-                        print(f"DEBUG: 파티션 컬럼 추가: {column_name} ({data_type})")
-                    partition_columns.append((column_name, data_type))
-            
-            # 클러스터링 확인 (CLUSTER_YN = 'Y')
-            cluster_yn = col.get('cluster_yn', 'N')
-            if (self.enable_clustering and 
-                cluster_yn and str(cluster_yn).upper() == 'Y'):
-                if column_name:
-                    if self.debug_mode:
-                        print(f"DEBUG: 클러스터 컬럼 추가: {column_name}")
-                    cluster_columns.append(column_name)
-        
-        # 파티션 절 생성 (첫 번째 파티션 컬럼만 사용)
-        if partition_columns:
-            partition_col, oracle_data_type = partition_columns[0]
-            
-            # Oracle 타입을 BigQuery 타입으로 변환
-            precision = None
-            scale = None
-            for col in columns:
-                if col.get('column_name') == partition_col:
-                    precision = col.get('data_precision')
-                    scale = col.get('data_scale')
-                    break
-            
-            bq_type = self.convert_oracle_type(oracle_data_type, precision, scale)
-            
-            # BigQuery에서 파티션을 지원하는 타입만 처리
-            # 지원 타입: DATE, TIMESTAMP, DATETIME, INT64 (RANGE 파티션용)
-            formatted_col = self.format_identifier(partition_col)
-            
-            if bq_type == 'DATE':
-                partition_clause = f"PARTITION BY DATE({formatted_col})"
-            elif bq_type == 'TIMESTAMP':
-                partition_clause = f"PARTITION BY DATE({formatted_col})"
-            elif bq_type == 'DATETIME':
-                partition_clause = f"PARTITION BY DATETIME_TRUNC({formatted_col}, DAY)"
-            elif bq_type in ['INT64', 'NUMERIC', 'BIGNUMERIC']:
-                # INTEGER RANGE 파티션 (선택적)
-                # 기본적으로는 생성하지 않음 (범위 설정이 필요하므로)
-                if self.debug_mode:
-                    print(f"WARNING: 숫자 타입({bq_type}) 파티션은 RANGE 파티션 설정이 필요하여 생성하지 않습니다.")
-                partition_clause = None
+        - 파티션 방식 정보가 없으면 기존과 같이 첫 번째 PARTITION_YN 컬럼만 파티션
+        - RANGE(INTERVAL 포함): 키 순서상 첫 날짜 키, 없으면 첫 INT64 키를 파티션하고 나머지 키는 클러스터
+        - LIST: 날짜 키 하나면 날짜 파티션, 그 외에는 키를 클러스터 (BigQuery에 LIST 파티션 없음)
+        - HASH: 파티션하지 않고 키를 클러스터 (등치 조건의 블록 제거로 파티션 제거를 대신함)
+        - 서브파티션 키는 방식과 관계없이 클러스터
+        - 클러스터로 옮길 키 중 클러스터를 지원하지 않는 타입(FLOAT64, BYTES 등)은 경고 후 생략
+        파티션 생성(enable_partitioning)이 꺼져 있으면 파티션 컬럼도 클러스터로 옮길 키도 없습니다.
+        """
+        if not self.enable_partitioning:
+            return None, []
+        partitioning_type = ''
+        if partition_keys:
+            partitioning_type = str(partition_keys[0].source.get('partitioning_type') or '').strip().upper()
+        subpartitioning_type = ''
+        if subpartition_keys:
+            subpartitioning_type = str(subpartition_keys[0].source.get('subpartitioning_type') or '').strip().upper()
+        
+        def key_position(column: ColumnPlan) -> Tuple[bool, int]:
+            position = parse_stat_int(column.source.get('partition_key_position'))
+            return position is None, position or 0
+        
+        partition_column = partition_keys[0] if partition_keys else None
+        moved = []
+        if partitioning_type:
+            ordered = sorted(partition_keys, key=key_position)
+            if partitioning_type == 'HASH':
+                partition_column = None
+            elif partitioning_type == 'LIST':
+                single_date = len(ordered) == 1 and ordered[0].bq_type in TIME_PARTITION_TYPES
+                partition_column = ordered[0] if single_date else None
             else:
-                # 지원하지 않는 타입 (STRING, BYTES 등)
-                if self.debug_mode:
-                    print(f"WARNING: {bq_type} 타입은 BigQuery 파티션을 지원하지 않습니다. 파티션 절을 생성하지 않습니다.")
-                partition_clause = None
+                partition_column = next((column for column in ordered if column.bq_type in TIME_PARTITION_TYPES),
+                                        next((column for column in ordered if column.bq_type == 'INT64'), None))
+            moved = [column for column in ordered if column is not partition_column]
+            clusterable = [column for column in moved if column.bq_type in CLUSTERABLE_TYPES]
+            if clusterable:
+                self.warn('partition_scheme', table_label,
+                          "%s: Oracle %s 파티션 키 %s는 BigQuery 파티션으로 옮길 수 없어 %s (파티션 컬럼: %s).",
+                          table_label, partitioning_type, ', '.join(column.name for column in clusterable),
+                          '클러스터 컬럼으로 사용합니다' if self.enable_clustering else '생략합니다',
+                          partition_column.name if partition_column else '-')
         
-        # 클러스터 절 생성
-        if cluster_columns:
-            formatted_clusters = [self.format_identifier(col) for col in cluster_columns]
-            cluster_clause = f"CLUSTER BY {', '.join(formatted_clusters)}"
+        clusters = [(column, f"Oracle {partitioning_type} 파티션 키 (BigQuery 파티션으로 옮길 수 없어 클러스터)")
+                    for column in moved]
+        for column in sorted(subpartition_keys, key=lambda c: parse_stat_int(c.source.get('subpartition_key_position'))):
+            if column is not partition_column:
+                clusters.append((column, f"Oracle {subpartitioning_type or '복합'} 서브파티션 키"))
         
-        return partition_clause, cluster_clause
+        # 클러스터를 지원하지 않는 타입은 BigQuery가 CLUSTER BY를 거부하므로 제외 (recommend_cluster_columns와 같은 기준)
+        unclusterable = [column for column, _ in clusters if column.bq_type not in CLUSTERABLE_TYPES]
+        if unclusterable:
+            self.warn('partition_scheme', table_label,
+                      "%s: 파티션/서브파티션 키 %s는 클러스터를 지원하지 않는 타입이라 생략합니다.",
+                      table_label, ', '.join(f"{column.name}({column.bq_type})" for column in unclusterable))
+        return partition_column, [(column, reason) for column, reason in clusters if column.bq_type in CLUSTERABLE_TYPES]
     
-    def format_bigquery_type_with_precision(self, bq_type: str, oracle_type: str, 
-                                          precision: Optional[str], scale: Optional[str], 
-                                          char_length: Optional[str]) -> str:
-        """BigQuery 타입에 정밀도/스케일 정보 추가"""
+    def partition_clause_for(self, column: ColumnPlan, table_label: str = '') -> Optional[str]:
+        """파티션 컬럼의 BigQuery 타입에 맞는 PARTITION BY 절 (지원하지 않는 타입이면 None)"""
+        # BigQuery에서 파티션을 지원하는 타입만 처리
+        # 지원 타입: DATE, TIMESTAMP, DATETIME, INT64 (RANGE 파티션용)
+        bq_type = column.bq_type
+        if bq_type in ('DATE', 'TIMESTAMP', 'DATETIME'):
+            granularity = self.partition_granularity_for(column, table_label)
+            if granularity is None:
+                return None
+            if granularity == 'DAY':
+                if bq_type == 'DATETIME':
+                    return f"PARTITION BY DATETIME_TRUNC({column.identifier}, DAY)"
+                return f"PARTITION BY DATE({column.identifier})"
+            return f"PARTITION BY {bq_type}_TRUNC({column.identifier}, {granularity})"
+        elif bq_type == 'INT64':
+            # 정수 RANGE 파티션 (컬럼 통계의 최솟값/최댓값으로 범위 결정)
+            bucket_range = self.integer_range_for(column)
+            if bucket_range is None:
+                self.warn('numeric_partition', table_label,
+                          "%s: %s 컬럼의 범위 통계(LOW_VALUE/HIGH_VALUE)가 없어 RANGE 파티션을 생성하지 않습니다.",
+                          table_label, column.name)
+                return None
+            start, end, step = bucket_range
+            logger.debug("%s: %s RANGE 파티션 %d ~ %d, 간격 %d (%d개 버킷)",
+                         table_label, column.name, start, end, step, (end - start) // step)
+            return f"PARTITION BY RANGE_BUCKET({column.identifier}, GENERATE_ARRAY({start}, {end}, {step}))"
+        elif bq_type in ['NUMERIC', 'BIGNUMERIC']:
+            # BigQuery RANGE 파티션은 INT64 컬럼만 지원
+            self.warn('numeric_partition', table_label,
+                      "%s: 숫자 타입(%s) 파티션은 INT64 컬럼만 RANGE 파티션이 가능하여 생성하지 않습니다.", table_label, bq_type)
+            return None
+        else:
+            # 지원하지 않는 타입 (STRING, BYTES 등)
+            self.warn('unsupported_partition', table_label,
+                      "%s: %s 타입은 BigQuery 파티션을 지원하지 않습니다. 파티션 절을 생성하지 않습니다.", table_label, bq_type)
+            return None
+    
+    def table_storage_bytes(self, column: ColumnPlan) -> Optional[int]:
+        """테이블 통계(BLOCKS x 블록 크기)로 추정한 Oracle 테이블 크기 (통계가 없으면 None)"""
+        blocks = parse_stat_int(column.source.get('blocks'))
+        return blocks * int(self.oracle_block_size) if blocks is not None else None
+    
+    def partition_granularity_for(self, column: ColumnPlan, table_label: str = '') -> Optional[str]:
+        """날짜 파티션 컬럼의 파티션 단위 (파티션하지 않으면 None)
+        
+        Oracle INTERVAL 파티션이면 그 간격을, 아니면 테이블 통계와 컬럼 최솟값/최댓값으로 단위를 정합니다.
+        """
+        table_bytes = self.table_storage_bytes(column)
+        low = decode_oracle_date(column.source.get('low_value'))
+        high = decode_oracle_date(column.source.get('high_value'))
+        span_days = (high - low).total_seconds() / 86400 if low and high and high >= low else None
+        interval = parse_oracle_interval(column.source.get('partition_interval'))
+        oracle_unit = interval if isinstance(interval, str) else None
+        if oracle_unit == 'HOUR' and column.bq_type == 'DATE':
+            oracle_unit = 'DAY'
+        
+        granularity = choose_partition_granularity(
+            table_bytes, span_days, float(self.partition_min_table_gb) * 1024 ** 3,
+            float(self.partition_target_gb) * 1024 ** 3, granularity=oracle_unit)
+        if granularity is None:
+            self.warn('small_table_partition', table_label,
+                      "%s: 테이블 크기 %s, 날짜 범위 %s일로 파티션을 생성하지 않습니다.", table_label,
+                      format_byte_size(table_bytes) if table_bytes is not None else '-',
+                      f"{span_days:.0f}" if span_days is not None else '-')
+        elif table_bytes is not None or span_days is not None or oracle_unit:
+            logger.debug("%s: %s 파티션 단위 %s (Oracle INTERVAL %s, 테이블 크기 %s, 날짜 범위 %s일)",
+                         table_label, column.name, granularity, oracle_unit or '-',
+                         format_byte_size(table_bytes) if table_bytes is not None else '-',
+                         f"{span_days:.0f}" if span_days is not None else '-')
+        return granularity
+    
+    def integer_range_for(self, column: ColumnPlan) -> Optional[Tuple[int, int, int]]:
+        """컬럼 통계로 정수 RANGE 파티션의 (start, end, interval) 결정 (통계가 없으면 None)"""
+        source = column.source
+        low = decode_oracle_number(source.get('low_value'))
+        high = decode_oracle_number(source.get('high_value'))
         try:
-            prec = int(precision) if precision and str(precision).strip() else None
-            sc = int(scale) if scale and str(scale).strip() else None
-            length = int(char_length) if char_length and str(char_length).strip() else None
-        except (ValueError, TypeError):
-            prec = None
-            sc = None
-            length = None
-        
-        # NUMERIC/BIGNUMERIC 타입에 정밀도와 스케일 추가
-        if bq_type in ['NUMERIC', 'BIGNUMERIC']:
-            if prec is not None and sc is not None:
-                # BigQuery NUMERIC 제한사항 확인
-                if bq_type == 'NUMERIC':
-                    # NUMERIC(P, 0)에서 P > 29인 경우 BIGNUMERIC으로 변경
-                    if sc == 0 and prec > 29:
-                        return f"BIGNUMERIC({prec}, {sc})"
-                    # NUMERIC(P, S)에서 P > 38 또는 S > 9인 경우 BIGNUMERIC으로 변경
-                    elif prec > 38 or sc > 9:
-                        return f"BIGNUMERIC({prec}, {sc})"
-                return f"{bq_type}({prec}, {sc})"
-            elif prec is not None:
-                # 정밀도만 있는 경우도 동일한 제한사항 적용
-                if bq_type == 'NUMERIC' and prec > 29:
-                    return f"BIGNUMERIC({prec})"
-                return f"{bq_type}({prec})"
-        
-        # STRING 타입에 길이 정보 추가 (선택적)
-        if bq_type == 'STRING' and length is not None:
-            if self.string_mode == 'string_only':
-                # string_only 모드: 길이 정보 무시하고 단순 STRING
-                return 'STRING'
-            elif self.preserve_string_length:
-                # auto 모드 + preserve_string_length: 길이 정보 포함
-                return f"STRING({length})"
+            num_distinct = int(source.get('num_distinct') or 0)
+        except ValueError:
+            num_distinct = 0
+        max_buckets = min(int(self.max_range_partitions), BIGQUERY_MAX_PARTITIONS)
+        # Oracle INTERVAL 파티션(숫자 간격)이면 같은 간격으로 버킷을 나눔
+        interval = parse_oracle_interval(source.get('partition_interval'))
+        step = interval if isinstance(interval, int) else None
+        return plan_integer_range(low, high, num_distinct or None, max_buckets, step=step)
+    
+    def render_table_ddl(self, plan: TablePlan, foreign_keys: Optional[List[Dict]] = None) -> str:
+        """TablePlan으로 CREATE TABLE 문 생성"""
+        # DROP 문 추가 (파티션 테이블이고 옵션이 활성화된 경우)
+        ddl_lines = []
+        if self.create_or_replace and plan.has_partition and self.drop_partition_table_before_create:
+            ddl_lines.append(f"DROP TABLE IF EXISTS {plan.full_name};")
+            ddl_lines.append("")  # 빈 줄 추가
+        
+        # CREATE 또는 CREATE OR REPLACE 선택
+        create_statement = "CREATE OR REPLACE TABLE" if self.create_or_replace else "CREATE TABLE"
+        ddl_lines.append(f"{create_statement} {plan.full_name} (")
+        
+        column_definitions = []
+        for column in plan.columns:
+            # 컬럼 정의
+            col_def = f"  {column.identifier} {column.declared_type}"
+            if not column.nullable:
+                col_def += " NOT NULL"
+            
+            # 설명 추가 (BigQuery에서는 OPTIONS로 description 추가)
+            if column.description:
+                col_def += f" OPTIONS(description=\"{self.escape_description(column.description)}\")"
+            
+            column_definitions.append(col_def)
+        
+        ddl_lines.append(",\n".join(column_definitions))
+        
+        # 기본키 제약조건 추가 (BigQuery는 PRIMARY KEY를 지원하지만 enforced되지 않음)
+        if plan.primary_key:
+            ddl_lines.append(",")
+            ddl_lines.append(f"  PRIMARY KEY ({', '.join(plan.primary_key)}) NOT ENFORCED")
+        
+        # 외래키 제약조건 추가 (NOT ENFORCED - 조인 최적화에 사용됨)
+        for foreign_key in foreign_keys or []:
+            ddl_lines.append(",")
+            ddl_lines.append(f"  {self.format_foreign_key(foreign_key)}")
+        
+        ddl_lines.append(")")
+        
+        # 파티셔닝과 클러스터링 추가
+        if plan.partition_clause:
+            ddl_lines.append(plan.partition_clause)
+        
+        if plan.cluster_clause:
+            ddl_lines.append(plan.cluster_clause)
+        
+        # 파티션 만료(정수 RANGE 파티션은 미지원)와 파티션 필터 필수 설정 추가
+        table_options = []
+        if (self.enable_partitioning and self.partition_expiration_days
+                and 'RANGE_BUCKET(' not in (plan.partition_clause or '')):
+            table_options.append(f"partition_expiration_days={self.partition_expiration_days}")
+        if plan.require_partition_filter:
+            table_options.append("require_partition_filter=true")
+        if table_options:
+            ddl_lines.append(f"OPTIONS({', '.join(table_options)})")
+        
+        ddl_lines.append(";")
+        
+        return "\n".join(ddl_lines)
+    
+    def get_current_timestamp(self) -> str:
+        """현재 타임스탬프 반환"""
+        from datetime import datetime
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    def generate_partition_cluster_clauses(self, columns: List[Dict]) -> tuple:
+        """파티셔닝과 클러스터링 절 생성"""
+        plan = self.build_table_plan(None, '', columns)
+        return plan.partition_clause, plan.cluster_clause
+    
+    def format_bigquery_type_with_precision(self, bq_type: str, oracle_type: str, 
+                                          precision: Optional[str], scale: Optional[str], 
+                                          char_length: Optional[str]) -> str:
+        """BigQuery 타입에 정밀도/스케일 정보 추가"""
+        return format_type_with_precision(bq_type, precision, scale, char_length,
+                                          self.string_mode, self.preserve_string_length)
+    
+    def create_column_description(self, col: Dict) -> Optional[str]:
+        """컬럼 설명 생성 (Oracle 코멘트만 또는 공란)"""
+        # Oracle 코멘트가 있으면 그것만 사용, 없으면 None 반환
+        column_comment = col.get('column_comment', '').strip()
+        if column_comment:
+            return column_comment
+        
+        # 코멘트가 없으면 None 반환 (description 없음)
+        return None
+    
+    def create_table_json_schema(self, columns: List[Dict],
+                                 resolved_types: Optional[List[Tuple[str, str]]] = None) -> List[Dict]:
+        """bq mk --schema 에 사용할 수 있는 JSON 스키마 생성 (DDL과 동일한 타입 결정 사용)"""
+        return self.render_json_schema(self.build_table_plan(None, '', columns, resolved_types))
+    
+    def render_json_schema(self, plan: TablePlan) -> List[Dict]:
+        """TablePlan으로 bq JSON 스키마 필드 목록 생성"""
+        schema = []
+        for column in plan.columns:
+            # 'NUMERIC(10, 2)', 'STRING(100)' 형태를 타입명과 파라미터로 분리
+            field = {'name': column.name}
+            match = re.match(r'^(\w+)\((\d+)(?:, (\d+))?\)$', column.declared_type)
+            if match:
+                field['type'] = match.group(1)
+                if match.group(1) == 'STRING':
+                    field['maxLength'] = match.group(2)
+                else:
+                    field['precision'] = match.group(2)
+                    if match.group(3) is not None:
+                        field['scale'] = match.group(3)
             else:
-                # auto 모드: 길이 정보 없이 STRING
-                return 'STRING'
+                field['type'] = column.declared_type
+            field['mode'] = 'NULLABLE' if column.nullable else 'REQUIRED'
+            
+            if column.description:
+                field['description'] = column.description
+            schema.append(field)
+        return schema
+    
+    def transcode_tables(self, input_file: Path, data_path: Path, output_dir: Path, output_format: str = 'parquet',
+                         workers: int = 1, row_group_rows: int = TRANSCODE_ROW_GROUP_ROWS) -> Tuple[int, int]:
+        """테이블별 데이터 CSV를 생성된 스키마 타입의 Parquet/Avro 파일로 변환 ((변환한 테이블 수, 실패한 테이블 수))
+        
+        data_path가 디렉토리면 OWNER.TABLE_NAME.csv 또는 TABLE_NAME.csv(압축 가능) 파일을 테이블과 짝짓고,
+        파일이면 --table 등으로 하나만 남긴 테이블의 데이터로 봅니다. 데이터 CSV의 첫 행은 컬럼명이어야 합니다.
+        출력은 output_dir/<스키마>_<테이블>.<형식>이며 workers가 2 이상이면 여러 테이블을 프로세스 풀에서 동시에 변환합니다.
+        """
+        tables, schemas = self.read_schema_tables(input_file)
+        self.progress.stop()
+        matched = self.match_data_files(tables, data_path)
+        
+        jobs = []
+        for table_key, data_file in matched.items():
+            table_info = tables[table_key]
+            schema_name = table_info['schema_name']
+            table_name = table_info['table_name']
+            plan = self.build_table_plan(schema_name, table_name, table_info['columns'])
+            file_stem = f"{schema_name}_{table_name}" if schema_name else table_name
+            jobs.append((table_key, str(data_file), [transcode_column_spec(column) for column in plan.columns],
+                         str(output_dir / f"{file_stem}.{output_format}"), output_format, row_group_rows))
+        
+        output_dir.mkdir(parents=True, exist_ok=True)
+        converted = failed = 0
+        progress = self.progress
+        progress.start('데이터 변환', total_tables=len(jobs))
+        try:
+            if workers > 1 and len(jobs) > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = {executor.submit(_transcode_table, job): job[0] for job in jobs}
+                    for future in as_completed(futures):
+                        if self.report_transcode(futures[future], future.result):
+                            converted += 1
+                        else:
+                            failed += 1
+            else:
+                for job in jobs:
+                    if self.report_transcode(job[0], partial(_transcode_table, job)):
+                        converted += 1
+                    else:
+                        failed += 1
+        finally:
+            progress.stop()
+        return converted, failed
+    
+    def match_data_files(self, tables: Dict, data_path: Path) -> Dict[str, Path]:
+        """테이블 키별 데이터 CSV 찾기 (transcode, validate-data 공용)
+        
+        data_path가 디렉토리면 OWNER.TABLE_NAME.csv 또는 TABLE_NAME.csv(압축 가능) 파일을 테이블과 짝짓고
+        (없는 테이블은 경고), 파일이면 테이블이 하나일 때만 그 테이블의 데이터로 봅니다.
+        """
+        if not data_path.is_dir():
+            if len(tables) != 1:
+                raise ValueError(f"데이터 파일이 하나이면 --table로 테이블 하나를 지정하세요 (스키마 CSV의 테이블 {len(tables)}개)")
+            return {next(iter(tables)): data_path}
+        
+        csv_suffixes = ('.csv',) + tuple('.csv' + suffix for suffix in COMPRESSION_SUFFIXES)
+        data_files = {schema_output_stem(file).upper(): file for file in sorted(data_path.iterdir())
+                      if file.is_file() and file.name.lower().endswith(csv_suffixes)}
+        matched = {}
+        for table_key, table_info in tables.items():
+            data_file = data_files.get(table_key.upper()) or data_files.get(table_info['table_name'].upper())
+            if data_file is None:
+                self.warn('missing_data_file', table_key, "%s에 데이터 파일 없음", data_path)
+            else:
+                matched[table_key] = data_file
+        return matched
+    
+    def validate_data(self, input_file: Path, data_path: Path, out, report_format: str = 'csv',
+                      max_errors: int = VALIDATION_MAX_ERRORS, batch_rows: int = VALIDATION_BATCH_ROWS) -> Tuple[int, int]:
+        """테이블별 데이터 CSV의 모든 값을 생성된 타입/NULL 허용 여부로 검사하여 오류를 보고서 스트림에 기록
+        
+        데이터 파일은 match_data_files와 같은 방식으로 찾으며 ((검사한 테이블 수, 전체 오류 수))를 반환합니다.
+        """
+        tables, schemas = self.read_schema_tables(input_file)
+        self.progress.stop()
+        matched = self.match_data_files(tables, data_path)
+        
+        writer = StreamingReportWriter(out, VALIDATION_FIELDS, report_format)
+        total_errors = 0
+        self.progress.start('데이터 검사', total_tables=len(matched))
+        try:
+            for table_key, data_file in matched.items():
+                table_info = tables[table_key]
+                plan = self.build_table_plan(table_info['schema_name'], table_info['table_name'], table_info['columns'])
+                total_errors += self.validate_table_data(plan, data_file, writer, max_errors, batch_rows)
+                self.progress.tables += 1
+        finally:
+            self.progress.stop()
+        writer.close()
+        return len(matched), total_errors
+    
+    def validate_table_data(self, plan: TablePlan, data_file: Path, writer: StreamingReportWriter,
+                            max_errors: int = VALIDATION_MAX_ERRORS, batch_rows: int = VALIDATION_BATCH_ROWS) -> int:
+        """테이블 하나의 데이터 CSV를 batch_rows행씩 컬럼별로 검사 (오류 수 반환)
+        
+        오류가 max_errors개에 이르면 나머지 행은 읽지 않습니다 (0이면 끝까지 검사).
+        데이터 파일에 없는 컬럼이나 스키마에 없는 컬럼은 행 번호 없이 보고합니다.
+        """
+        table_label = f"{plan.schema_name}.{plan.table_name}" if plan.schema_name else plan.table_name
+        columns = [transcode_column_spec(column) for column in plan.columns]
+        base_row = {'OWNER': plan.schema_name or '', 'TABLE_NAME': plan.table_name}
+        
+        with self.open_schema_input(data_file) as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            header_names = {field.strip().upper() for field in header}
+            known_names = {column[0].upper() for column in columns}
+            missing = [column[0] for column in columns if column[0].upper() not in header_names]
+            unknown = [field.strip() for field in header if field.strip().upper() not in known_names]
+            for name in missing:
+                writer.write(dict(base_row, COLUMN_NAME=name, ERROR="데이터 파일에 없는 컬럼"))
+            for name in unknown:
+                writer.write(dict(base_row, COLUMN_NAME=name, ERROR="스키마에 없는 컬럼"))
+            if missing:
+                logger.error("❌ %s: 데이터 파일에 없는 컬럼 %d개, 값 검사 생략 (%s)", table_label, len(missing), data_file)
+                return len(missing) + len(unknown)
+            positions = data_column_positions(header, columns)
+            
+            error_count = len(unknown)
+            column_errors = OrderedDict()
+            row_count = 0
+            stopped = False
+            while not stopped:
+                batch = list(islice(reader, batch_rows))
+                if not batch:
+                    break
+                failures = []
+                for position, (name, bq_type, precision, scale, nullable) in zip(positions, columns):
+                    values = [row[position] if position < len(row) else '' for row in batch]
+                    for offset, message in check_value_batch(values, bq_type, precision, scale, nullable):
+                        failures.append((offset, name, bq_type, values[offset], message))
+                
+                # 행 순서대로 보고하고 최대 오류 수에 이르면 그 행에서 중단
+                for offset, name, bq_type, value, message in sorted(failures, key=lambda failure: failure[0]):
+                    writer.write(dict(base_row, ROW_NUMBER=row_count + offset + 1, COLUMN_NAME=name, BQ_TYPE=bq_type,
+                                      VALUE=value[:VALIDATION_VALUE_PREVIEW], ERROR=message))
+                    column_errors[name] = column_errors.get(name, 0) + 1
+                    error_count += 1
+                    if max_errors and error_count >= max_errors:
+                        stopped = True
+                        row_count += offset + 1
+                        break
+                else:
+                    row_count += len(batch)
+        
+        if not error_count:
+            logger.info("✓ %s: %d행 검사, 오류 없음", table_label, row_count)
+            return 0
+        summary = ', '.join(f"{name} {count}건" for name, count in column_errors.items()) or '헤더'
+        if stopped:
+            logger.error("❌ %s: 오류 %d건에 도달하여 %d행에서 검사 중단 (%s)", table_label, error_count, row_count, summary)
+        else:
+            logger.error("❌ %s: %d행 검사, 오류 %d건 (%s)", table_label, row_count, error_count, summary)
+        return error_count
+    
+    def report_transcode(self, table_key: str, result) -> bool:
+        """테이블 하나의 변환 결과(result 호출)를 로그로 남기고 성공 여부 반환"""
+        self.progress.tables += 1
+        try:
+            table_key, row_count, output_path = result()
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.error("❌ %s 데이터 변환 실패: %s", table_key, e)
+            return False
+        logger.info("✓ %s: %d행 변환 -> %s", table_key, row_count, output_path)
+        return True
+    
+    def render_export_sql(self, plan: TablePlan) -> Tuple[int, str]:
+        """TablePlan으로 테이블 데이터 추출 SELECT 생성 ((청크 수, SQL))
+        
+        값은 oracle_export_expression으로 BigQuery 타입에 맞는 문자열로 바꾸고, NUM_ROWS에 비례한
+        청크 수 N만큼 ORA_HASH(ROWID, N - 1) = k 조건의 SELECT를 만들어 세션별로 병렬 실행할 수 있게 합니다.
+        """
+        source = plan.columns[0].source if plan.columns else {}
+        num_rows = parse_stat_int(source.get('num_rows'))
+        chunk_count = plan_export_chunks(num_rows, int(self.export_rows_per_chunk), int(self.export_max_chunks))
+        table_reference = ".".join(quote_oracle_identifier(name) for name in (plan.schema_name, plan.table_name) if name)
+        select_list = ",\n".join(f"  {oracle_export_expression(column)}" for column in plan.columns)
+        
+        if num_rows is None:
+            lines = [f"-- NUM_ROWS 통계 없음: 청크 {chunk_count}개"]
+        else:
+            lines = [f"-- NUM_ROWS {num_rows:,}: 청크 {chunk_count}개 (청크당 약 {-(-num_rows // chunk_count):,}행)"]
+        for chunk in range(chunk_count):
+            lines.append("")
+            lines.append(f"-- Chunk: {chunk + 1}/{chunk_count}")
+            lines.append("SELECT")
+            lines.append(select_list)
+            if chunk_count == 1:
+                lines.append(f"FROM {table_reference} t;")
+            else:
+                lines.append(f"FROM {table_reference} t")
+                lines.append(f"WHERE ORA_HASH(t.ROWID, {chunk_count - 1}) = {chunk};")
+        return chunk_count, "\n".join(lines)
+    
+    def diff_tables(self, base_tables: Dict, tables: Dict) -> Dict[str, Any]:
+        """두 테이블 묶음의 DDL을 비교하여 추가/삭제/변경 테이블과 unified diff 반환"""
+        def render(table_info):
+            return self.create_table_ddl(table_info['schema_name'], table_info['table_name'], table_info['columns'])
+        
+        added = [key for key in tables if key not in base_tables]
+        removed = [key for key in base_tables if key not in tables]
+        changed = []
+        diff_lines = []
+        
+        for table_key in list(base_tables) + added:
+            old_ddl = render(base_tables[table_key]) if table_key in base_tables else ''
+            new_ddl = render(tables[table_key]) if table_key in tables else ''
+            if old_ddl == new_ddl:
+                continue
+            if table_key in base_tables and table_key in tables:
+                changed.append(table_key)
+            diff_lines.extend(difflib.unified_diff(
+                old_ddl.splitlines(), new_ddl.splitlines(),
+                fromfile=f"a/{table_key}", tofile=f"b/{table_key}", lineterm=''
+            ))
+        
+        return {'added': added, 'removed': removed, 'changed': changed, 'diff': "\n".join(diff_lines)}
+    
+    def escape_description(self, description: str) -> str:
+        """설명 텍스트를 SQL에서 안전하게 사용할 수 있도록 이스케이프"""
+        if not description:
+            return ""
+        
+        # 따옴표 이스케이프
+        escaped = description.replace('"', '\\"')
+        
+        # 줄바꿈 문자 제거
+        escaped = escaped.replace('\n', ' ').replace('\r', ' ')
+        
+        # 연속된 공백을 하나로 줄임
+        import re
+        escaped = re.sub(r'\s+', ' ', escaped)
+        
+        return escaped.strip()
+    
+    def show_version(self):
+        """버전 정보 표시"""
+        print("Oracle to BigQuery Migration Tool - Portable Version")
+        print("Version: 1.0.0")
+        print("Python:", sys.version.split()[0])
+        print("Platform: Portable (No pandas)")
+    
+    def show_help(self):
+        """도움말 표시"""
+        help_text = """
+Oracle to BigQuery Migration Tool - Portable Version
+
+사용법:
+  oracle-to-bq convert <input_file> [--output-dir <output_dir>] [옵션]
+  oracle-to-bq index <input_file>
+  oracle-to-bq estimate <input_file> [--output <file|->] [--format csv|json] [--columns <file>]
+  oracle-to-bq transcode <input_file> <data_file|data_dir> [--output-dir <dir>] [--format parquet|avro]
+                         [--workers N] [--row-group-rows N]
+  oracle-to-bq validate-data <input_file> <data_file|data_dir> [--output <file|->] [--format csv|json]
+                             [--max-errors N] [--batch-rows N]
+  oracle-to-bq watch <watch_dir> [--output-dir <output_dir>] [--interval <초>] [--once]
+  oracle-to-bq serve [--host 127.0.0.1] [--port 8765] [--workers 8]
+  oracle-to-bq apply <ddl_file|manifest.json|dir> [--client bigquery|fake] [--workers 8]
+                     [--rate-per-dataset <초당 문장 수>] [--retries 3] [--state <state_file>]
+  oracle-to-bq init-config [config_file]
+  oracle-to-bq --version
+  oracle-to-bq --help
+  oracle-to-bq --test
+
+명령어:
+  convert     Oracle 스키마 CSV 파일을 BigQuery DDL로 변환
+  index       테이블별 바이트 범위 색인 생성 (--table 선택 변환용)
+  estimate    테이블/컬럼별 BigQuery 저장 크기와 스캔 크기 추정 (NUM_ROWS, AVG_COL_LEN 통계)
+  transcode   테이블별 데이터 CSV를 생성된 타입의 Parquet/Avro 파일로 변환 (bq load용)
+  validate-data 적재 전에 데이터 CSV 값을 생성된 타입/NOT NULL로 검사하여 오류 행 보고
+  watch       디렉토리의 스키마 CSV 변경을 감시하여 변경된 테이블만 다시 변환
+  serve       로컬 HTTP 변환 서비스 실행 (DDL, JSON 스키마, 비교)
+  apply       생성된 DDL을 BigQuery에 동시 실행 (속도 제한, 재시도, 중단 후 재개)
+  init-config 설정 파일 템플릿 생성
+  --version   버전 정보 표시
+  --help      이 도움말 표시
+  --test      포터블 패키지 테스트
+
+옵션:
+  --output-dir <output_dir>         출력 디렉토리 (기본: 입력 파일과 동일한 위치)
+  --project-id <project_id>         BigQuery 프로젝트 ID
+  --config <config_file>            설정 파일 경로
+  --string-mode auto|string_only    문자열 변환 모드
+  --preserve-string-length          STRING 타입에 길이 정보 포함
+  --files                           개별 파일로 DDL 생성 (기본: 병합 파일)
+  --no-primary-keys                 기본키 제약조건 생성 안함
+  --no-foreign-keys                 외래키 제약조건 생성 안함
+  --recommend-clusters              CLUSTER_YN이 없는 테이블에 인덱스/통계 기반 클러스터 컬럼 추천
+  --type-samples <파일|디렉토리>    샘플 통계 CSV 또는 테이블별 데이터 샘플로 NUMBER 타입 축소
+  --create-or-replace               CREATE OR REPLACE TABLE 사용
+  --table <OWNER.TABLE,...>         지정한 테이블만 변환 (색인이 있으면 해당 범위만 읽음)
+  --workers <N>                     큰 CSV를 N개 프로세스로 병렬 파싱
+  --emit <형식,...>                 출력 형식 (ddl, json-schema, inventory-csv, cluster-report, export-sql, 기본값 ddl)
+  --profiles <이름,...|all>         설정 파일의 프로필별로 출력 (출력 디렉토리 아래 프로필 이름)
+  --max-script-bytes <N>            병합 DDL을 N바이트 이하 파일로 분할 (매니페스트 생성)
+  --max-statements <N>              병합 DDL을 N개 문장 이하 파일로 분할
+  --no-progress                     진행 상황 표시 안함 (터미널이 아니면 자동으로 꺼짐)
+  --quiet                           경고와 오류만 출력 (경고는 변환 후 요약으로 출력)
+  --log-file <path>                 DEBUG 로그까지 파일에 기록 (버퍼링)
+
+예시:
+  # 설정 파일 생성
+  oracle-to-bq init-config my_config.json
+  
+  # 기본 변환 (병합 파일로 생성)
+  oracle-to-bq convert schema.csv --output-dir bigquery_ddl --project-id my-project
+  
+  # 설정 파일 사용
+  oracle-to-bq convert schema.csv --output-dir output --config my_config.json
+  
+  # 옵션 사용
+  oracle-to-bq convert schema.csv --output-dir output --project-id my-project --preserve-string-length
+  
+  # 개별 파일로 생성
+  oracle-to-bq convert schema.csv --output-dir output --project-id my-project --files
+
+지원하는 입력 형식:
+  필수: TABLE_NAME, COLUMN_NAME, DATA_TYPE, NULLABLE
+  선택: OWNER (Oracle 스키마명, BigQuery 데이터셋명으로 사용)
+        DATA_PRECISION, DATA_SCALE, DATA_LENGTH
+        IS_PRIMARY_KEY, DATA_DEFAULT, COLUMN_COMMENT
+
+"""
+        print(help_text)
+
+class _PrefixedRawReader(io.RawIOBase):
+    """미리 읽어 둔 앞부분을 먼저 돌려준 뒤 원래 스트림을 이어서 읽는 리더
+    
+    닫을 때 원래 스트림과 owned에 지정한 스트림(압축 해제 전 원본 등)도 함께 닫습니다.
+    """
+    
+    def __init__(self, prefix: bytes, stream, owned: Sequence[Any] = ()):
+        self._prefix = prefix
+        self._stream = stream
+        self._owned = tuple(owned)
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        if self._prefix:
+            size = min(len(buffer), len(self._prefix))
+            buffer[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        data = self._stream.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        return size
+    
+    def close(self):
+        try:
+            self._stream.close()
+            for stream in self._owned:
+                stream.close()
+        finally:
+            super().close()
+
+
+def peek_stream(stream, size: int) -> Tuple[bytes, io.BufferedReader]:
+    """되감을 수 없는 바이너리 스트림의 앞부분을 읽고, 앞부분부터 다시 읽을 수 있는 스트림과 함께 반환"""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    prefix = b''.join(chunks)
+    return prefix, io.BufferedReader(_PrefixedRawReader(prefix, stream))
+
+
+def detect_compression(prefix: bytes) -> Optional[str]:
+    """매직 바이트로 압축 형식 감지 (압축이 아니면 None)"""
+    for magic, name in COMPRESSION_MAGIC:
+        if prefix.startswith(magic):
+            return name
+    return None
+
+
+def open_decompressed(stream) -> io.BufferedReader:
+    """바이너리 스트림의 압축 형식을 감지하여 압축이 풀린 스트림을 반환 (압축이 아니면 그대로)
+    
+    압축 해제는 청크 단위 스트리밍으로 이루어지므로 입력 크기와 무관하게 메모리 사용량이 일정합니다.
+    """
+    prefix, buffered = peek_stream(stream, 6)
+    compression = detect_compression(prefix)
+    
+    if compression is None:
+        return buffered
+    if compression == 'gzip':
+        decompressed = gzip.GzipFile(fileobj=buffered, mode='rb')
+    elif compression == 'bz2':
+        decompressed = bz2.BZ2File(buffered, mode='rb')
+    elif compression == 'xz':
+        decompressed = lzma.LZMAFile(buffered, mode='rb')
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            buffered.close()
+            raise RuntimeError("zstd 압축 입력을 읽으려면 zstandard 패키지가 필요합니다 (pip install zstandard)")
+        decompressed = zstandard.ZstdDecompressor().stream_reader(buffered)
+    
+    # 압축 해제 객체는 원본 스트림을 닫지 않으므로 함께 닫도록 감쌈
+    return io.BufferedReader(_PrefixedRawReader(b'', decompressed, owned=(buffered,)))
+
+
+def schema_output_stem(input_file: Path) -> str:
+    """입력 파일명에서 압축 확장자와 마지막 확장자를 뗀 이름 (schema.csv.gz -> schema)"""
+    name = input_file.name
+    for suffix in COMPRESSION_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return Path(name).stem
+
+
+def _normalize_row(row: Union[Mapping[str, Any], Sequence[Any]], fieldnames: Sequence[str]) -> Dict[str, str]:
+    """매핑 또는 튜플 행을 대문자 키와 문자열 값을 가진 딕셔너리로 정규화 (None은 빈 문자열)"""
+    if isinstance(row, Mapping):
+        items = row.items()
+    else:
+        items = zip(fieldnames, row)
+    return {str(key).upper(): ('' if value is None else str(value)) for key, value in items}
+
+
+def convert_rows(rows: Iterable[Union[Mapping[str, Any], Sequence[Any]]],
+                 options: Optional[ConversionOptions] = None,
+                 fieldnames: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, str]]:
+    """스키마 행들을 BigQuery DDL로 변환하여 (테이블 키, DDL)을 테이블 단위로 지연 반환
+    
+    Args:
+        rows: 매핑(DictReader, 딕셔너리 커서 등) 또는 튜플 행의 이터러블.
+              OWNER, TABLE_NAME 순으로 정렬되어 있어야 합니다.
+        options: 변환 옵션 (기본: ConversionOptions())
+        fieldnames: 튜플 행의 필드명 (기본: 추출 쿼리 컬럼 순서)
+    
+    호출마다 독립된 도구 인스턴스를 사용하므로 여러 스레드에서 동시에 호출할 수 있습니다.
+    """
+    tool = SimpleMigrationTool(options=options if options is not None else ConversionOptions())
+    names = tuple(fieldnames) if fieldnames is not None else DEFAULT_ROW_FIELDS
+    normalized = (_normalize_row(row, names) for row in rows)
+    
+    for table_key, table_info in tool.iter_table_groups(normalized):
+        yield table_key, tool.create_table_ddl(table_info['schema_name'], table_info['table_name'], table_info['columns'])
+
+
+def iter_record_spans(buf, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """CSV 레코드별 (시작, 끝) 바이트 오프셋 반환 (따옴표 안의 줄바꿈은 레코드 경계로 보지 않음)
+    
+    UTF-8/EUC-KR/CP949의 멀티바이트 문자에는 '"'와 '\\n' 바이트가 나오지 않으므로
+    디코딩 없이 바이트 단위로 경계를 찾을 수 있습니다.
+    """
+    end = len(buf) if end is None else end
+    pos = start
+    while pos < end:
+        record_start = pos
+        search = pos
+        quotes = 0
+        while True:
+            newline = buf.find(b'\n', search, end)
+            if newline == -1:
+                record_end = end
+                break
+            quotes += buf[search:newline].count(b'"')
+            if quotes % 2 == 0:
+                record_end = newline + 1
+                break
+            search = newline + 1
+        yield record_start, record_end
+        pos = record_end
+
+
+def count_sql_statements(lines: List[str]) -> int:
+    """DDL 줄 목록에서 SQL 문 수 계산 (';'로 끝나는 줄 기준, 주석 줄 제외)"""
+    count = 0
+    for chunk in lines:
+        for line in chunk.split("\n"):
+            stripped = line.rstrip()
+            if stripped.endswith(';') and not stripped.lstrip().startswith('--'):
+                count += 1
+    return count
+
+
+def plan_table_waves(table_keys: Sequence[str],
+                     foreign_keys: Mapping[str, List[Dict]]) -> Tuple[Dict[str, int], List[Tuple[str, Dict]]]:
+    """외래키 의존성으로 테이블별 실행 단계(웨이브)를 정하고 순환 참조 외래키를 분리
+    
+    참조하는 테이블은 참조되는 테이블보다 뒤 웨이브에 놓이며, 같은 웨이브의 테이블은 동시에 만들 수 있다.
+    강한 연결 요소(순환 및 자기 참조) 안의 외래키는 CREATE 문에 넣지 않고 (테이블 키, 외래키) 목록으로
+    반환하여 모든 테이블 생성 뒤 ALTER TABLE ADD CONSTRAINT로 추가하게 한다.
+    
+    Returns:
+        (테이블 키 -> 웨이브 번호(1부터), 뒤로 미룬 외래키 목록)
+    """
+    known = set(table_keys)
+    edges = {key: [] for key in table_keys}
+    for table_key, fks in foreign_keys.items():
+        if table_key in known:
+            for fk in fks:
+                if fk['ref_table_key'] in known and fk['ref_table_key'] not in edges[table_key]:
+                    edges[table_key].append(fk['ref_table_key'])
+    
+    # Tarjan 강한 연결 요소 (재귀 깊이 제한을 피하기 위해 반복문으로 구현)
+    index_of, lowlink, on_stack, stack, component = {}, {}, set(), [], {}
+    counter = 0
+    for root in table_keys:
+        if root in index_of:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, child_pos = work.pop()
+            if child_pos == 0:
+                index_of[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+            children = edges[node]
+            if child_pos < len(children):
+                work.append((node, child_pos + 1))
+                child = children[child_pos]
+                if child not in index_of:
+                    work.append((child, 0))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[child])
+                continue
+            if lowlink[node] == index_of[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component[member] = node
+                    if member == node:
+                        break
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+    
+    # 같은 요소 안의 외래키는 뒤로 미루고, 나머지 의존성으로 웨이브 결정
+    deferred = []
+    for table_key in table_keys:
+        for fk in foreign_keys.get(table_key, []):
+            if fk['ref_table_key'] in known and component[fk['ref_table_key']] == component[table_key]:
+                deferred.append((table_key, fk))
+    
+    # 요소 단위 그래프(DAG)에서 가장 긴 의존 경로로 웨이브 결정 (같은 요소의 테이블은 같은 웨이브)
+    component_deps = {}
+    for table_key in table_keys:
+        deps = component_deps.setdefault(component[table_key], set())
+        deps.update(component[dep] for dep in edges[table_key] if component[dep] != component[table_key])
+    
+    component_wave = {}
+    for root in component_deps:
+        work = [root]
+        while work:
+            node = work[-1]
+            if node in component_wave:
+                work.pop()
+                continue
+            pending = [dep for dep in component_deps[node] if dep not in component_wave]
+            if pending:
+                work.extend(pending)
+                continue
+            work.pop()
+            component_wave[node] = 1 + max((component_wave[dep] for dep in component_deps[node]), default=0)
+    
+    waves = {table_key: component_wave[component[table_key]] for table_key in table_keys}
+    return waves, deferred
+
+
+def table_key_matches(table_key: str, filters: Sequence[str]) -> bool:
+    """테이블 키가 필터(OWNER.TABLE_NAME 또는 TABLE_NAME) 중 하나와 일치하는지 확인"""
+    table_name = table_key.split('.', 1)[-1]
+    return any(name == table_key or name == table_name for name in filters)
+
+
+def _next_record_start(buf, pos: int, end: int, in_quotes: bool) -> int:
+    """pos 이후 첫 레코드 시작 위치 (in_quotes: pos가 따옴표 필드 안에 있는지)"""
+    search = pos
+    quotes = 1 if in_quotes else 0
+    while True:
+        newline = buf.find(b'\n', search, end)
+        if newline == -1:
+            return end
+        quotes += buf[search:newline].count(b'"')
+        if quotes % 2 == 0:
+            return newline + 1
+        search = newline + 1
+
+
+def _quote_parity(buf, start: int, end: int, step: int = 1 << 24) -> bool:
+    """[start, end) 범위의 따옴표 개수가 홀수인지 (큰 범위는 나눠서 셈)"""
+    total = 0
+    for pos in range(start, end, step):
+        total += buf[pos:min(pos + step, end)].count(b'"')
+    return total % 2 == 1
+
+
+def _record_table_key(buf, start: int, end: int, encoding: str, positions: Dict[str, int]) -> Optional[str]:
+    """레코드 한 개의 테이블 키 (parse_schema_row와 같은 규칙)"""
+    row = next(csv.reader([buf[start:end].decode(encoding)]), [])
+    
+    def value(name):
+        i = positions.get(name)
+        return row[i] if i is not None and i < len(row) else ''
+    
+    table_name = value('TABLE_NAME')
+    if not table_name:
+        return None
+    schema_name = value('OWNER') or value('SCHEMA_NAME') or value('TABLE_SCHEMA')
+    return f"{schema_name}.{table_name}" if schema_name else table_name
+
+
+def plan_csv_chunks(input_file: Path, encoding: str, chunk_count: int,
+                    min_chunk_bytes: int = PARALLEL_MIN_CHUNK_BYTES) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """CSV를 레코드 경계에 맞춘 바이트 범위로 분할하고 (헤더 필드명, 청크 목록) 반환
+    
+    정렬된 추출 파일이면 경계를 가까운 테이블 경계로 옮겨 테이블이 청크에 걸치지 않도록 합니다.
+    (앞으로 CHUNK_TABLE_LOOKAHEAD 레코드 안에 테이블 경계가 없으면 그대로 둠)
+    """
+    size = input_file.stat().st_size
+    if size == 0:
+        return [], []
+    
+    with open(input_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            header_end = next(iter_record_spans(buf))[1]
+            # DictReader와 같은 방식(텍스트 모드 줄바꿈 처리)으로 헤더 해석
+            header_text = io.TextIOWrapper(io.BytesIO(buf[0:header_end]), encoding=encoding)
+            fieldnames = next(csv.reader(header_text), [])
+            positions = {name: i for i, name in enumerate(fieldnames)}
+            
+            body_size = size - header_end
+            chunk_count = max(1, min(chunk_count, body_size // max(1, min_chunk_bytes)))
+            target_size = body_size // chunk_count if chunk_count else body_size
+            
+            boundaries = [header_end]
+            for i in range(1, chunk_count):
+                previous = boundaries[-1]
+                target = max(header_end + target_size * i, previous)
+                if target >= size:
+                    break
+                # 직전 경계(레코드 시작)부터의 따옴표 개수로 target이 따옴표 안인지 판단
+                boundary = _next_record_start(buf, target, size, _quote_parity(buf, previous, target))
+                
+                # 가까운 테이블 경계로 이동
+                spans = iter_record_spans(buf, boundary, size)
+                first = next(spans, None)
+                if first is not None:
+                    first_key = _record_table_key(buf, first[0], first[1], encoding, positions)
+                    for lookahead, (start, end) in enumerate(spans):
+                        if lookahead >= CHUNK_TABLE_LOOKAHEAD:
+                            break
+                        if _record_table_key(buf, start, end, encoding, positions) != first_key:
+                            boundary = start
+                            break
+                
+                if previous < boundary < size:
+                    boundaries.append(boundary)
+            boundaries.append(size)
+    
+    chunks = [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+    return fieldnames, chunks
+
+
+def _parse_csv_chunk(job: Tuple[str, str, List[str], int, int]) -> List[Tuple[str, Optional[str], str, List[Dict]]]:
+    """워커 프로세스에서 CSV 바이트 범위 하나를 파싱하여 연속된 테이블 그룹 목록 반환"""
+    path, encoding, fieldnames, start, end = job
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    
+    tool = SimpleMigrationTool(options=ConversionOptions())
+    text = io.TextIOWrapper(io.BytesIO(data), encoding=encoding)
+    groups = []
+    for row in csv.DictReader(text, fieldnames=fieldnames):
+        parsed = tool.parse_schema_row(row)
+        if parsed is None:
+            continue
+        table_key, schema_name, table_name, column_info = parsed
+        if groups and groups[-1][0] == table_key:
+            groups[-1][3].append(column_info)
+        else:
+            groups.append((table_key, schema_name, table_name, [column_info]))
+    return groups
+
+
+def parse_data_value(value: str, bq_type: str, precision: Optional[int] = None, scale: Optional[int] = None) -> Any:
+    """추출 CSV의 문자열 값을 BigQuery 타입의 Python 값으로 변환 (빈 문자열은 NULL로 None)
+    
+    숫자는 'TM9' 형식, 날짜는 'YYYY-MM-DD HH24:MI:SS[.FF6]', BYTES는 16진수 문자열(export-sql 추출 식)을 읽습니다.
+    타입 범위나 선언된 정밀도/스케일, STRING(L)/BYTES(L)의 최대 길이(precision)를 넘거나 형식이 맞지 않으면
+    ValueError가 발생합니다.
+    """
+    if value == '':
+        return None
+    try:
+        if bq_type in ('INT64', 'NUMERIC', 'BIGNUMERIC'):
+            number = Decimal(value.strip())
+            if not number.is_finite():
+                raise ValueError(f"숫자가 아닌 값: {value}")
+            if bq_type == 'INT64':
+                if number != number.to_integral_value() or not INT64_MIN <= number <= INT64_MAX:
+                    raise ValueError(f"INT64 범위를 넘거나 정수가 아닌 값: {value}")
+                return int(number)
+            if precision is None or scale is None:
+                precision, scale = DEFAULT_DECIMAL_PRECISION[bq_type]
+            quantized = number.quantize(Decimal(1).scaleb(-scale), context=DECIMAL_CONTEXT)
+            if quantized != number:
+                raise ValueError(f"소수 자릿수 {scale}자리를 넘는 값: {value}")
+            if _integer_digits(quantized) > precision - scale:
+                raise ValueError(f"{bq_type}({precision}, {scale}) 정수 자릿수를 넘는 값: {value}")
+            return quantized
+        if bq_type == 'FLOAT64':
+            try:
+                return float(value)
+            except ValueError:
+                raise ValueError(f"숫자가 아닌 값: {value}")
+        if bq_type in ('DATETIME', 'TIMESTAMP', 'DATE'):
+            return parse_moment_value(value, bq_type)
+        if bq_type == 'BYTES':
+            try:
+                data = bytes.fromhex(value)
+            except ValueError:
+                raise ValueError(f"16진수 문자열이 아닌 값: {value}")
+            if precision is not None and len(data) > precision:
+                raise ValueError(f"BYTES({precision}) 최대 길이를 넘는 값 ({len(data)}바이트)")
+            return data
+        if bq_type == 'BOOL':
+            flag = value.strip().upper()
+            if flag not in ('TRUE', 'FALSE', '1', '0', 'Y', 'N'):
+                raise ValueError(f"BOOL이 아닌 값: {value}")
+            return flag in ('TRUE', '1', 'Y')
+    except ArithmeticError:
+        raise ValueError(f"숫자가 아닌 값: {value}")
+    if bq_type == 'STRING' and precision is not None and len(value) > precision:
+        raise ValueError(f"STRING({precision}) 최대 길이를 넘는 값 ({len(value)}자)")
+    return value
+
+
+def parse_moment_value(value: str, bq_type: str) -> Any:
+    """DATE/DATETIME/TIMESTAMP 값 해석 (BigQuery CSV 적재가 읽는 형식만 허용, MOMENT_VALUE_PATTERN)
+    
+    datetime.fromisoformat은 Python 버전에 따라 '20240101' 같은 압축 형식까지 받아들이므로
+    정규식으로 형식을 먼저 확인합니다. 시간대(Z, UTC, +09, +09:00)는 TIMESTAMP에만 허용하며, 없으면 UTC로 봅니다.
+    """
+    match = MOMENT_VALUE_PATTERN.match(value.strip())
+    if not match:
+        raise ValueError(f"{bq_type} 형식(YYYY-MM-DD[ HH:MI[:SS[.ffffff]]])이 아닌 값: {value}")
+    parts = match.groupdict()
+    if bq_type == 'DATE' and parts['hour'] is not None:
+        raise ValueError(f"DATE 형식(YYYY-MM-DD)이 아닌 값: {value}")
+    if bq_type == 'DATETIME' and parts['zone'] is not None:
+        raise ValueError(f"DATETIME에는 시간대 오프셋을 쓸 수 없는 값: {value}")
+    try:
+        moment = datetime(int(parts['year']), int(parts['month']), int(parts['day']),
+                          int(parts['hour'] or 0), int(parts['minute'] or 0), int(parts['second'] or 0),
+                          int((parts['fraction'] or '').ljust(6, '0')))
+        if parts['sign'] is None:
+            zone = timezone.utc
+        else:
+            offset = timedelta(hours=int(parts['zone_hour']), minutes=int(parts['zone_minute'] or 0))
+            zone = timezone(-offset if parts['sign'] == '-' else offset)
+    except ValueError:
+        raise ValueError(f"없는 날짜나 시각: {value}")
+    if bq_type == 'DATE':
+        return moment.date()
+    if bq_type == 'TIMESTAMP':
+        return moment.replace(tzinfo=zone)
+    return moment
+
+
+def screen_valid_values(values: Sequence[str], bq_type: str, precision: Optional[int] = None,
+                        scale: Optional[int] = None, use_numpy: bool = True) -> Optional[Any]:
+    """값 묶음 중 해석 없이 통과가 확실한 값을 NumPy 마스크 연산으로 골라 불리언 배열로 반환
+    
+    STRING(L)은 길이 비교만으로, 숫자 타입은 '-123.45' 형태의 자릿수(정수부/소수부)가 선언된
+    정밀도/스케일 안에 드는지로 판정합니다. 앞자리 0이나 공백처럼 확실하지 않은 값은 False로 남겨
+    parse_data_value가 다시 검사합니다. NumPy가 없거나 거를 수 없는 타입이면 None을 반환합니다.
+    """
+    numpy = _import_numpy() if use_numpy else None
+    if numpy is None or not values:
+        return None
+    lengths = numpy.fromiter(map(len, values), dtype=numpy.int64, count=len(values))
+    if bq_type == 'STRING' and precision is not None:
+        return (lengths > 0) & (lengths <= precision)
+    if bq_type not in ('INT64', 'NUMERIC', 'BIGNUMERIC') or lengths.max() > VECTOR_SCREEN_MAX_WIDTH:
+        return None
+    
+    # 값마다 한 행인 UTF-32 코드 포인트 행렬 (짧은 값 뒤는 0으로 채워짐)
+    text = numpy.array(values, dtype=str)
+    codes = text.view(numpy.uint32).reshape(len(values), -1)
+    inside = numpy.arange(codes.shape[1]) < lengths[:, None]
+    digit = (codes >= 48) & (codes <= 57)
+    dot = codes == 46
+    minus = codes == 45
+    minus[:, 1:] = False  # 부호는 맨 앞에만
+    # 배열로 바꾸며 잘린 끝의 NUL 문자가 있으면 코드 포인트 수가 길이와 달라짐
+    plain = ((digit | dot | minus) | ~inside).all(axis=1) & (lengths > 0) & ((codes != 0).sum(axis=1) == lengths)
+    
+    dot_count = dot.sum(axis=1)
+    has_dot = dot_count == 1
+    sign = minus[:, 0].astype(numpy.int64)
+    dot_position = numpy.where(has_dot, dot.argmax(axis=1), lengths)
+    integer_digits = dot_position - sign
+    fraction_digits = numpy.where(has_dot, lengths - dot_position - 1, 0)
+    plain &= (dot_count <= 1) & (integer_digits >= 1) & (~has_dot | (fraction_digits >= 1))
+    
+    if bq_type == 'INT64':
+        # 18자리 이하 정수는 항상 INT64 범위 안
+        return plain & ~has_dot & (integer_digits <= 18)
+    if precision is None or scale is None:
+        precision, scale = DEFAULT_DECIMAL_PRECISION[bq_type]
+    return plain & (integer_digits <= precision - scale) & (fraction_digits <= scale)
+
+
+def check_value_batch(values: Sequence[str], bq_type: str, precision: Optional[int] = None,
+                      scale: Optional[int] = None, nullable: bool = True,
+                      use_numpy: bool = True) -> List[Tuple[int, str]]:
+    """한 컬럼의 값 묶음을 한 번에 검사하여 실패한 값의 (묶음 안 위치, 오류) 목록 반환
+    
+    parse_data_value와 같은 규칙입니다. NumPy가 있으면 STRING(L) 길이와 숫자 자릿수를 screen_valid_values로
+    한 번에 걸러 통과가 확실한 값은 건너뛰고, 나머지(날짜, BYTES 포함)는 값마다 해석하되 코드나 날짜처럼
+    묶음 안에서 반복되는 값은 한 번만 해석합니다. 길이 제한이 없는 STRING은 NULL 검사만 합니다.
+    """
+    if bq_type == 'STRING' and precision is None:
+        return [] if nullable else [(offset, "NOT NULL 컬럼에 빈 값") for offset, value in enumerate(values) if value == '']
+    
+    passed = screen_valid_values(values, bq_type, precision, scale, use_numpy)
+    offsets = range(len(values)) if passed is None else (~passed).nonzero()[0].tolist()
+    errors = []
+    verdicts = {}
+    for offset in offsets:
+        value = values[offset]
+        if value == '':
+            if not nullable:
+                errors.append((offset, "NOT NULL 컬럼에 빈 값"))
+            continue
+        if value not in verdicts:
+            try:
+                parse_data_value(value, bq_type, precision, scale)
+                verdicts[value] = None
+            except ValueError as e:
+                verdicts[value] = str(e)
+        if verdicts[value] is not None:
+            errors.append((offset, verdicts[value]))
+    return errors
+
+
+def transcode_column_spec(column: ColumnPlan) -> Tuple[str, str, Optional[int], Optional[int], bool]:
+    """ColumnPlan을 워커 프로세스에 넘길 변환 정보 (컬럼명, BigQuery 타입, 정밀도 또는 최대 길이, 스케일, NULL 허용)
+    
+    숫자 타입은 선언된 타입을 따릅니다 (NUMBER(45)는 bq_type이 NUMERIC이어도 BIGNUMERIC(45)로 선언됨).
+    """
+    bq_type = column.bq_type
+    precision = scale = None
+    match = re.match(r'^((?:BIG)?NUMERIC)\((\d+)(?:, (\d+))?\)$', column.declared_type)
+    if match:
+        bq_type, precision, scale = match.group(1), int(match.group(2)), int(match.group(3) or 0)
+    match = re.match(r'^(?:STRING|BYTES)\((\d+)\)$', column.declared_type)
+    if match:
+        precision = int(match.group(1))
+    return column.name, bq_type, precision, scale, column.nullable
+
+
+def data_column_positions(header: Sequence[str], columns: Sequence[Tuple]) -> List[int]:
+    """데이터 CSV 헤더에서 변환 정보 순서대로 컬럼 위치 찾기 (대소문자 무시, 없는 컬럼이 있으면 ValueError)"""
+    names = [name.strip().upper() for name in header]
+    missing = [column[0] for column in columns if column[0].upper() not in names]
+    if missing:
+        raise ValueError(f"데이터 파일에 없는 컬럼: {', '.join(missing)}")
+    return [names.index(column[0].upper()) for column in columns]
+
+
+def _import_pyarrow():
+    """pyarrow 모듈 반환 (Parquet 변환용, 설치되어 있지 않으면 RuntimeError)"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("Parquet으로 변환하려면 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+    return pyarrow
+
+
+def _import_fastavro():
+    """fastavro 모듈 반환 (Avro 변환용, 설치되어 있지 않으면 RuntimeError)"""
+    try:
+        import fastavro
+        import fastavro.write
+    except ImportError:
+        raise RuntimeError("Avro로 변환하려면 fastavro 패키지가 필요합니다 (pip install fastavro)")
+    return fastavro
+
+
+class ParquetTableWriter:
+    """변환된 값 묶음을 Parquet 행 그룹으로 하나씩 기록 (DATETIME은 UTC 조정 없는 TIMESTAMP)"""
+    
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, str, Optional[int], Optional[int], bool]]):
+        pa = _import_pyarrow()
+        self.pa = pa
+        arrow_fields = []
+        for name, bq_type, precision, scale, nullable in columns:
+            if bq_type in DEFAULT_DECIMAL_PRECISION:
+                if precision is None or scale is None:
+                    precision, scale = DEFAULT_DECIMAL_PRECISION[bq_type]
+                # decimal128은 정밀도 38까지만 담을 수 있음
+                if bq_type == 'BIGNUMERIC' or precision > 38:
+                    arrow_type = pa.decimal256(precision, scale)
+                else:
+                    arrow_type = pa.decimal128(precision, scale)
+            else:
+                arrow_type = {
+                    'INT64': pa.int64(), 'FLOAT64': pa.float64(), 'BOOL': pa.bool_(), 'DATE': pa.date32(),
+                    'DATETIME': pa.timestamp('us'), 'TIMESTAMP': pa.timestamp('us', tz='UTC'), 'BYTES': pa.binary(),
+                }.get(bq_type, pa.string())
+            arrow_fields.append(pa.field(name, arrow_type, nullable=nullable))
+        self.schema = pa.schema(arrow_fields)
+        self.writer = pa.parquet.ParquetWriter(str(path), self.schema, compression='snappy')
+    
+    def write(self, values: List[List[Any]]):
+        arrays = [self.pa.array(column_values, type=field.type) for column_values, field in zip(values, self.schema)]
+        table = self.pa.Table.from_arrays(arrays, schema=self.schema)
+        self.writer.write_table(table, row_group_size=max(1, table.num_rows))
+    
+    def close(self):
+        self.writer.close()
+
+
+class AvroTableWriter:
+    """변환된 값 묶음을 Avro 블록으로 하나씩 기록 (DATE/TIMESTAMP는 bq load --use_avro_logical_types 필요)"""
+    
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, str, Optional[int], Optional[int], bool]]):
+        fastavro = _import_fastavro()
+        invalid = [column[0] for column in columns if not AVRO_NAME_PATTERN.match(column[0])]
+        if invalid:
+            raise ValueError(f"Avro 필드명으로 쓸 수 없는 컬럼: {', '.join(invalid)} (--format parquet 사용)")
+        
+        avro_fields = []
+        for name, bq_type, precision, scale, nullable in columns:
+            if bq_type in DEFAULT_DECIMAL_PRECISION:
+                if precision is None or scale is None:
+                    precision, scale = DEFAULT_DECIMAL_PRECISION[bq_type]
+                avro_type = {'type': 'bytes', 'logicalType': 'decimal', 'precision': precision, 'scale': scale}
+            else:
+                avro_type = {
+                    'INT64': 'long', 'FLOAT64': 'double', 'BOOL': 'boolean', 'BYTES': 'bytes',
+                    'DATE': {'type': 'int', 'logicalType': 'date'},
+                    'DATETIME': {'type': 'string', 'sqlType': 'DATETIME'},
+                    'TIMESTAMP': {'type': 'long', 'logicalType': 'timestamp-micros'},
+                }.get(bq_type, 'string')
+            avro_fields.append({'name': name, 'type': ['null', avro_type] if nullable else avro_type})
+        schema = fastavro.parse_schema({'type': 'record', 'name': 'Row', 'fields': avro_fields})
+        
+        self.names = [column[0] for column in columns]
+        self.datetime_indexes = [index for index, column in enumerate(columns) if column[1] == 'DATETIME']
+        self.file = open(path, 'wb')
+        self.writer = fastavro.write.Writer(self.file, schema, codec='deflate')
+    
+    def write(self, values: List[List[Any]]):
+        # DATETIME은 sqlType이 DATETIME인 문자열 필드 ('YYYY-MM-DD HH:MM:SS[.ffffff]')
+        for index in self.datetime_indexes:
+            values[index] = [None if moment is None else moment.isoformat(' ') for moment in values[index]]
+        for record in zip(*values):
+            self.writer.write(dict(zip(self.names, record)))
+        self.writer.flush()
+    
+    def close(self):
+        self.writer.flush()
+        self.file.close()
+
+
+def _transcode_table(job: Tuple[str, str, List[Tuple], str, str, int]) -> Tuple[str, int, str]:
+    """워커 프로세스에서 테이블 데이터 CSV 하나를 Parquet/Avro로 변환 ((테이블 키, 행 수, 출력 파일))
+    
+    CSV는 row_group_rows행씩만 읽어 변환한 뒤 행 그룹(Avro 블록) 하나로 기록합니다.
+    변환할 수 없는 값이 있으면 만들던 출력 파일을 지우고 행 번호와 컬럼명이 담긴 ValueError를 발생시킵니다.
+    """
+    table_key, data_path, columns, output_path, output_format, row_group_rows = job
+    tool = SimpleMigrationTool(options=ConversionOptions())
+    row_count = 0
+    with tool.open_schema_input(Path(data_path)) as f:
+        reader = csv.reader(f)
+        positions = data_column_positions(next(reader, []), columns)
+        
+        writer = (ParquetTableWriter if output_format == 'parquet' else AvroTableWriter)(Path(output_path), columns)
+        try:
+            while True:
+                batch = list(islice(reader, row_group_rows))
+                if not batch:
+                    break
+                values = [[] for _ in columns]
+                for row_number, row in enumerate(batch, row_count + 1):
+                    for column_values, position, (name, bq_type, precision, scale, nullable) in zip(values, positions, columns):
+                        try:
+                            value = parse_data_value(row[position] if position < len(row) else '', bq_type, precision, scale)
+                        except ValueError as e:
+                            raise ValueError(f"{row_number}행 {name} 컬럼: {e}")
+                        if value is None and not nullable:
+                            raise ValueError(f"{row_number}행 {name} 컬럼: NOT NULL 컬럼에 빈 값")
+                        column_values.append(value)
+                writer.write(values)
+                row_count += len(batch)
+        except Exception:
+            writer.close()
+            Path(output_path).unlink()
+            raise
+        writer.close()
+    return table_key, row_count, output_path
+
+
+class TableOffsetIndex:
+    """스키마 CSV의 OWNER.TABLE_NAME별 바이트 범위 색인 (사이드카 파일: <입력 파일>.idx.json)
+    
+    원본 파일의 크기나 수정 시각이 바뀌면 색인은 무효가 되어 다시 생성됩니다.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, source: Path, encoding: str, size: int, mtime_ns: int,
+                 header: Tuple[int, int], tables: Dict[str, List[List[int]]]):
+        self.source = source
+        self.encoding = encoding
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.header = header
+        self.tables = tables  # 테이블 키 -> [[시작, 끝], ...] (파일에 나온 순서)
+    
+    @staticmethod
+    def sidecar_path(source: Path) -> Path:
+        return source.with_name(source.name + '.idx.json')
+    
+    @classmethod
+    def build(cls, source: Path, encoding: str) -> 'TableOffsetIndex':
+        """파일을 메모리 매핑하여 한 번 훑으면서 테이블별 바이트 범위 기록"""
+        stat = source.stat()
+        tables = {}
+        header = (0, 0)
+        
+        with open(source, 'rb') as f:
+            if stat.st_size == 0:
+                return cls(source, encoding, stat.st_size, stat.st_mtime_ns, header, tables)
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                spans = iter_record_spans(buf)
+                header = next(spans)
+                fieldnames = next(csv.reader([buf[header[0]:header[1]].decode(encoding)]), [])
+                positions = {name: i for i, name in enumerate(fieldnames)}
+                
+                def value(row, name):
+                    i = positions.get(name)
+                    return row[i] if i is not None and i < len(row) else ''
+                
+                for start, end in spans:
+                    row = next(csv.reader([buf[start:end].decode(encoding)]), [])
+                    table_name = value(row, 'TABLE_NAME')
+                    if not table_name:
+                        continue
+                    # parse_schema_row와 같은 규칙으로 테이블 키 생성
+                    schema_name = value(row, 'OWNER') or value(row, 'SCHEMA_NAME') or value(row, 'TABLE_SCHEMA')
+                    table_key = f"{schema_name}.{table_name}" if schema_name else table_name
+                    
+                    ranges = tables.setdefault(table_key, [])
+                    if ranges and ranges[-1][1] == start:
+                        ranges[-1][1] = end  # 연속된 레코드는 한 범위로 합침
+                    else:
+                        ranges.append([start, end])
+        
+        return cls(source, encoding, stat.st_size, stat.st_mtime_ns, header, tables)
+    
+    def save(self):
+        payload = {
+            'version': self.VERSION,
+            'source': {'size': self.size, 'mtime_ns': self.mtime_ns},
+            'encoding': self.encoding,
+            'header': list(self.header),
+            'tables': self.tables,
+        }
+        with open(self.sidecar_path(self.source), 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+    
+    @classmethod
+    def load(cls, source: Path) -> Optional['TableOffsetIndex']:
+        """사이드카 색인 로드 (없거나, 손상되었거나, 원본이 바뀌었으면 None)"""
+        try:
+            with open(cls.sidecar_path(source), 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            index = cls(source, payload['encoding'], payload['source']['size'], payload['source']['mtime_ns'],
+                        tuple(payload['header']), payload['tables'])
+            if payload.get('version') != cls.VERSION:
+                return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return index if index.is_fresh() else None
+    
+    @classmethod
+    def load_or_build(cls, source: Path, tool: 'SimpleMigrationTool') -> Optional['TableOffsetIndex']:
+        """유효한 색인을 로드하거나 새로 생성하여 저장 (압축 파일은 색인 불가로 None)"""
+        with open(source, 'rb') as f:
+            if detect_compression(f.read(6)) is not None:
+                logger.warning("⚠️ 압축 파일은 색인을 사용할 수 없어 전체를 읽습니다.")
+                return None
+        
+        index = cls.load(source)
+        if index is not None:
+            return index
+        
+        logger.info("✓ 테이블 색인 생성 중: %s", cls.sidecar_path(source))
+        index = cls.build(source, tool.detect_encoding(source))
+        try:
+            index.save()
+        except OSError as e:
+            logger.warning("⚠️ 색인 파일 저장 실패 (%s), 이번 실행에만 사용합니다.", e)
+        return index
+    
+    def is_fresh(self) -> bool:
+        try:
+            stat = self.source.stat()
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+    
+    def select(self, filters: Sequence[str]) -> List[str]:
+        """필터와 일치하는 테이블 키 목록 (파일에 나온 순서)"""
+        return [key for key in self.tables if table_key_matches(key, filters)]
+    
+    def iter_rows(self, table_keys: Sequence[str]) -> Iterator[Dict[str, str]]:
+        """지정한 테이블의 바이트 범위만 읽어서 CSV 행으로 반환"""
+        ranges = sorted(tuple(span) for key in table_keys for span in self.tables.get(key, []))
+        with open(self.source, 'rb') as f:
+            chunks = []
+            for start, end in [self.header] + ranges:
+                f.seek(start)
+                chunks.append(f.read(end - start))
+        
+        # 파일을 텍스트 모드로 열었을 때와 같은 줄바꿈 처리를 위해 TextIOWrapper 사용
+        text = io.TextIOWrapper(io.BytesIO(b''.join(chunks)), encoding=self.encoding)
+        yield from csv.DictReader(text)
+
+
+class SchemaWatcher:
+    """드롭 디렉토리의 스키마 CSV를 감시하여 변경된 테이블만 다시 변환
+    
+    프로세스를 유지하면서 파일별 인코딩, 테이블별 지문(fingerprint)과 렌더링된 DDL을
+    캐시하므로, 새 CSV가 들어와도 실제로 바뀐 테이블만 DDL을 다시 생성합니다.
+    """
+    
+    # 압축된 CSV도 감시 대상 (압축 형식은 매직 바이트로 판단)
+    DEFAULT_PATTERNS = ('*.csv',) + tuple(f'*.csv{suffix}' for suffix in COMPRESSION_SUFFIXES)
+    
+    def __init__(self, tool: SimpleMigrationTool, watch_dir: Path, output_dir: Optional[Path] = None,
+                 patterns: Sequence[str] = DEFAULT_PATTERNS):
+        self.tool = tool
+        self.watch_dir = watch_dir
+        self.output_dir = output_dir if output_dir is not None else watch_dir
+        self.patterns = tuple(patterns)
+        self.file_states = {}   # 파일 경로 -> (mtime_ns, size)
+        self.encodings = {}     # 파일 경로 -> 감지된 인코딩
+        self.table_cache = {}   # 파일 경로 -> {테이블 키: (지문, 스키마명, 테이블명, DDL)}
+    
+    @staticmethod
+    def fingerprint(columns: List[Dict]) -> str:
+        """테이블 컬럼 정보의 지문 생성"""
+        payload = json.dumps(columns, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    
+    def read_tables(self, csv_file: Path) -> Dict:
+        """CSV 파일을 테이블별로 그룹화 (인코딩은 캐시된 값 우선 사용)"""
+        encoding = self.encodings.get(csv_file)
+        if encoding is not None:
+            try:
+                with self.tool.open_schema_input(csv_file, encoding=encoding) as f:
+                    tables, _ = self.tool.group_rows(csv.DictReader(f))
+                return tables
+            except UnicodeDecodeError:
+                pass
+        
+        encoding = self.tool.detect_encoding(csv_file)
+        self.encodings[csv_file] = encoding
+        with self.tool.open_schema_input(csv_file, encoding=encoding) as f:
+            tables, _ = self.tool.group_rows(csv.DictReader(f))
+        return tables
+    
+    def scan_once(self) -> Dict[Path, List[str]]:
+        """디렉토리를 한 번 확인하여 변경된 파일을 처리하고 {파일: 다시 변환한 테이블 키 목록} 반환"""
+        changed = {}
+        current_files = set()
+        
+        candidates = {path for pattern in self.patterns for path in self.watch_dir.glob(pattern)}
+        for csv_file in sorted(candidates):
+            if not csv_file.is_file():
+                continue
+            current_files.add(csv_file)
+            
+            stat = csv_file.stat()
+            state = (stat.st_mtime_ns, stat.st_size)
+            if self.file_states.get(csv_file) == state:
+                continue
+            
+            try:
+                tables = self.read_tables(csv_file)
+            except Exception as e:
+                # 아직 쓰는 중인 파일 등은 다음 확인 때 다시 시도
+                logger.warning("⚠️ 파일 처리 실패 (%s): %s", csv_file, e)
+                continue
+            
+            changed[csv_file] = self.update_outputs(csv_file, tables)
+            self.file_states[csv_file] = state
+        
+        # 삭제된 파일의 캐시 정리
+        for removed in set(self.file_states) - current_files:
+            self.file_states.pop(removed, None)
+            self.encodings.pop(removed, None)
+            self.table_cache.pop(removed, None)
+        
+        return changed
+    
+    def update_outputs(self, csv_file: Path, tables: Dict) -> List[str]:
+        """변경된 테이블만 DDL을 다시 렌더링하고 출력 파일 갱신"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        cached = self.table_cache.get(csv_file, {})
+        new_cache = {}
+        rerendered = []
+        
+        for table_key, table_info in tables.items():
+            schema_name = table_info['schema_name']
+            table_name = table_info['table_name']
+            columns = table_info['columns']
+            digest = self.fingerprint(columns)
+            
+            entry = cached.get(table_key)
+            if entry is None or entry[0] != digest:
+                table_ddl = self.tool.create_table_ddl(schema_name, table_name, columns)
+                entry = (digest, schema_name, table_name, table_ddl)
+                rerendered.append(table_key)
+                if not self.tool.merge_output:
+                    self._write_atomic(self._table_file(schema_name, table_name), table_ddl)
+            new_cache[table_key] = entry
+        
+        # 사라진 테이블의 개별 파일 정리
+        if not self.tool.merge_output:
+            for table_key in set(cached) - set(new_cache):
+                _, schema_name, table_name, _ = cached[table_key]
+                table_file = self._table_file(schema_name, table_name)
+                if table_file.exists():
+                    table_file.unlink()
+        
+        if self.tool.merge_output and (rerendered or set(cached) != set(new_cache)):
+            lines = self.tool.render_merged_header(len(new_cache))
+            for _, schema_name, table_name, table_ddl in new_cache.values():
+                lines.extend(self.tool.render_table_section(schema_name, table_name, table_ddl))
+            self._write_atomic(self.output_dir / (schema_output_stem(csv_file) + '.sql'), "\n".join(lines))
+        
+        self.table_cache[csv_file] = new_cache
+        return rerendered
+    
+    def _table_file(self, schema_name: Optional[str], table_name: str) -> Path:
+        """개별 DDL 파일 경로 (process_csv_file과 동일한 규칙)"""
+        if schema_name:
+            return self.output_dir / f"{schema_name}_{table_name}.sql"
+        return self.output_dir / f"{table_name}.sql"
+    
+    @staticmethod
+    def _write_atomic(output_file: Path, content: str):
+        """임시 파일에 쓴 뒤 교체하여 읽는 쪽에서 반쯤 쓰인 파일을 보지 않도록 함"""
+        temp_file = output_file.with_name(output_file.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_file, output_file)
+    
+    def run(self, interval: float = 5.0):
+        """Ctrl+C로 중단할 때까지 주기적으로 디렉토리 확인"""
+        logger.info("👀 감시 시작: %s (간격 %s초, 출력: %s)", self.watch_dir, interval, self.output_dir)
+        try:
+            while True:
+                for csv_file, table_keys in self.scan_once().items():
+                    logger.info("✓ %s: %d개 테이블 다시 변환", csv_file.name, len(table_keys))
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logger.info("감시 종료")
+
+
+class LatencyHistogram:
+    """엔드포인트별 요청 지연 시간 히스토그램 (Prometheus 텍스트 형식으로 출력)"""
+    
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}  # (엔드포인트, 상태 코드) -> [버킷별 누적 개수..., 합계, 개수]
+    
+    def observe(self, endpoint: str, status: int, seconds: float):
+        """요청 한 건의 지연 시간 기록"""
+        with self._lock:
+            series = self._series.setdefault((endpoint, status), [0] * len(self.BUCKETS) + [0.0, 0])
+            for i, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    series[i] += 1
+            series[-2] += seconds
+            series[-1] += 1
+    
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력"""
+        lines = [
+            "# HELP oracle_to_bq_request_seconds 요청 처리 시간 (초)",
+            "# TYPE oracle_to_bq_request_seconds histogram",
+        ]
+        with self._lock:
+            snapshot = {key: list(values) for key, values in self._series.items()}
+        
+        for (endpoint, status), series in sorted(snapshot.items()):
+            labels = f'endpoint="{endpoint}",status="{status}"'
+            for bound, count in zip(self.BUCKETS, series):
+                lines.append(f'oracle_to_bq_request_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'oracle_to_bq_request_seconds_bucket{{{labels},le="+Inf"}} {series[-1]}')
+            lines.append(f'oracle_to_bq_request_seconds_sum{{{labels}}} {series[-2]:.6f}')
+            lines.append(f'oracle_to_bq_request_seconds_count{{{labels}}} {series[-1]}')
+        
+        # 요청 간에 유지되는 타입 매핑/식별자 캐시 상태
+        lines.append("# TYPE oracle_to_bq_cache_hits counter")
+        lines.append("# TYPE oracle_to_bq_cache_misses counter")
+        lines.append("# TYPE oracle_to_bq_cache_hit_ratio gauge")
+        lines.append("# TYPE oracle_to_bq_cache_entries gauge")
+        lines.append("# TYPE oracle_to_bq_cache_max_entries gauge")
+        for name, cached in (('type_mapping', map_oracle_type),
+                             ('type_format', format_type_with_precision),
+                             ('identifier', identifier_needs_backticks)):
+            info = cached.cache_info()
+            lookups = info.hits + info.misses
+            hit_ratio = info.hits / lookups if lookups else 0.0
+            lines.append(f'oracle_to_bq_cache_hits{{cache="{name}"}} {info.hits}')
+            lines.append(f'oracle_to_bq_cache_misses{{cache="{name}"}} {info.misses}')
+            lines.append(f'oracle_to_bq_cache_hit_ratio{{cache="{name}"}} {hit_ratio:.4f}')
+            lines.append(f'oracle_to_bq_cache_entries{{cache="{name}"}} {info.currsize}')
+            lines.append(f'oracle_to_bq_cache_max_entries{{cache="{name}"}} {info.maxsize}')
+        return "\n".join(lines) + "\n"
+
+
+class ConversionService:
+    """HTTP 변환 서비스 요청 처리 (DDL, JSON 스키마, DDL 비교)"""
+    
+    FORMATS = ('ddl', 'json-schema', 'diff')
+    
+    def __init__(self, base_options: ConversionOptions):
+        self.base_options = base_options
+        self.metrics = LatencyHistogram()
+    
+    def build_tool(self, overrides: Optional[Mapping[str, Any]]) -> SimpleMigrationTool:
+        """기본 옵션에 요청별 옵션을 덮어쓴 도구 생성"""
+        options = self.base_options
+        if overrides:
+            known = {field.name for field in fields(ConversionOptions)}
+            unknown = sorted(set(overrides) - known)
+            if unknown:
+                raise ValueError(f"알 수 없는 옵션: {', '.join(unknown)}")
+            options = replace(options, **overrides)
+        return SimpleMigrationTool(options=options)
+    
+    @staticmethod
+    def read_tables(tool: SimpleMigrationTool, rows: Any, fieldnames: Optional[Sequence[str]]) -> Dict:
+        """요청 본문의 행 목록을 테이블별로 그룹화"""
+        if not isinstance(rows, list):
+            raise ValueError("rows는 배열이어야 합니다.")
+        names = tuple(fieldnames) if fieldnames else DEFAULT_ROW_FIELDS
+        tables, _ = tool.group_rows(_normalize_row(row, names) for row in rows)
+        return tables
+    
+    def convert(self, payload: Mapping[str, Any]) -> Dict[str, Any]:
+        """변환 요청 처리"""
+        output_format = payload.get('format', 'ddl')
+        if output_format not in self.FORMATS:
+            raise ValueError(f"format은 {', '.join(self.FORMATS)} 중 하나여야 합니다.")
+        
+        tool = self.build_tool(payload.get('options'))
+        fieldnames = payload.get('fieldnames')
+        tables = self.read_tables(tool, payload.get('rows', []), fieldnames)
+        
+        if output_format == 'diff':
+            base_tables = self.read_tables(tool, payload.get('base_rows', []), fieldnames)
+            return tool.diff_tables(base_tables, tables)
         
-        return bq_type
+        results = []
+        for table_key, table_info in tables.items():
+            if output_format == 'json-schema':
+                results.append({'table': table_key, 'schema': tool.create_table_json_schema(table_info['columns'])})
+            else:
+                ddl = tool.create_table_ddl(table_info['schema_name'], table_info['table_name'], table_info['columns'])
+                results.append({'table': table_key, 'ddl': ddl})
+        return {'tables': results}
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """변환 서비스 HTTP 핸들러 (POST /convert, GET /metrics, GET /health)"""
     
-    def create_column_description(self, col: Dict) -> Optional[str]:
-        """컬럼 설명 생성 (Oracle 코멘트만 또는 공란)"""
-        # Oracle 코멘트가 있으면 그것만 사용, 없으면 None 반환
-        column_comment = col.get('column_comment', '').strip()
-        if column_comment:
-            return column_comment
-        
-        # 코멘트가 없으면 None 반환 (description 없음)
-        return None
+    def do_GET(self):
+        started = time.perf_counter()
+        if self.path == '/metrics':
+            self._send(started, 200, self.server.service.metrics.render().encode('utf-8'),
+                       'text/plain; version=0.0.4; charset=utf-8')
+        elif self.path == '/health':
+            self._send_json(started, 200, {'status': 'ok'})
+        else:
+            self._send_json(started, 404, {'error': f"알 수 없는 경로: {self.path}"})
     
-    def escape_description(self, description: str) -> str:
-        """설명 텍스트를 SQL에서 안전하게 사용할 수 있도록 이스케이프"""
-        if not description:
-            return ""
-        
-        # 따옴표 이스케이프
-        escaped = description.replace('"', '\\"')
+    def do_POST(self):
+        started = time.perf_counter()
+        if self.path != '/convert':
+            self._send_json(started, 404, {'error': f"알 수 없는 경로: {self.path}"})
+            return
         
-        # 줄바꿈 문자 제거
-        escaped = escaped.replace('\n', ' ').replace('\r', ' ')
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length).decode('utf-8') or '{}')
+            if not isinstance(payload, dict):
+                raise ValueError("요청 본문은 JSON 객체여야 합니다.")
+            self._send_json(started, 200, self.server.service.convert(payload))
+        except (ValueError, TypeError) as e:
+            self._send_json(started, 400, {'error': str(e)})
+        except Exception as e:
+            self._send_json(started, 500, {'error': str(e)})
+    
+    def _send_json(self, started: float, status: int, body: Any):
+        self._send(started, status, json.dumps(body, ensure_ascii=False).encode('utf-8'),
+                   'application/json; charset=utf-8')
+    
+    def _send(self, started: float, status: int, body: bytes, content_type: str):
+        # 응답을 보내기 전에 기록하여 클라이언트가 응답을 받은 시점에는 메트릭에 반영되어 있도록 함
+        endpoint = self.path if status != 404 else 'unknown'
+        self.server.service.metrics.observe(endpoint, status, time.perf_counter() - started)
         
-        # 연속된 공백을 하나로 줄임
-        import re
-        escaped = re.sub(r'\s+', ' ', escaped)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        # 요청별 접근 로그는 디버그 모드에서만 출력
+        if self.server.service.base_options.debug_mode:
+            super().log_message(format, *args)
+
+
+class ConversionHTTPServer(HTTPServer):
+    """고정 크기 스레드 풀로 요청을 처리하는 HTTP 서버"""
+    
+    def __init__(self, server_address, service: ConversionService, max_workers: int = 8):
+        super().__init__(server_address, ConversionRequestHandler)
+        self.service = service
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process_request_in_pool, request, client_address)
+    
+    def _process_request_in_pool(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+    
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+# DDL 문 대상 테이블 추출 (CREATE [OR REPLACE] TABLE, DROP TABLE, ALTER TABLE)
+DDL_TARGET_PATTERN = re.compile(
+    r'^\s*(?:CREATE(?:\s+OR\s+REPLACE)?\s+TABLE(?:\s+IF\s+NOT\s+EXISTS)?|DROP\s+TABLE(?:\s+IF\s+EXISTS)?|'
+    r'ALTER\s+TABLE(?:\s+IF\s+EXISTS)?)\s+(`[^`]+`|[\w.\-]+)',
+    re.IGNORECASE
+)
+
+# 병합 DDL에서 실행 단계(웨이브)를 나타내는 주석 ('-- Wave: 2')
+DDL_WAVE_PATTERN = re.compile(r'^--\s*Wave:\s*(\d+)', re.IGNORECASE)
+
+
+class TransientApplyError(Exception):
+    """재시도하면 성공할 수 있는 DDL 실행 오류 (할당량 초과, 일시적 서버 오류 등)"""
+
+
+@dataclass(frozen=True)
+class DDLStatement:
+    """apply 명령으로 실행할 DDL 문 하나"""
+    statement_id: str
+    table: str
+    dataset: str
+    sql: str
+    wave: int = 0
+
+
+def parse_ddl_statements(text: str) -> List[DDLStatement]:
+    """DDL 스크립트를 ';'로 끝나는 줄 기준으로 문장 단위로 분리
+    
+    문장 밖의 주석과 빈 줄은 건너뛰고, '-- Wave: N' 주석 뒤의 문장은 N단계로 표시한다.
+    문장 ID는 대상 테이블, 테이블 내 순번, SQL 해시로 만들어 다시 생성한 스크립트에서도 유지된다.
+    """
+    statements = []
+    ordinals = {}
+    current = []
+    wave = 0
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not current:
+            wave_match = DDL_WAVE_PATTERN.match(stripped)
+            if wave_match:
+                wave = int(wave_match.group(1))
+                continue
+            if not stripped or stripped.startswith('--'):
+                continue
+        current.append(line)
+        if stripped.endswith(';') and not stripped.startswith('--'):
+            sql = "\n".join(current)
+            current = []
+            target = DDL_TARGET_PATTERN.match(sql)
+            table = target.group(1).strip('`') if target else ''
+            parts = table.split('.')
+            dataset = parts[-2] if len(parts) >= 2 else ''
+            ordinal = ordinals.get(table, 0)
+            ordinals[table] = ordinal + 1
+            digest = hashlib.sha1(sql.encode('utf-8')).hexdigest()[:12]
+            statements.append(DDLStatement(f"{table}#{ordinal}:{digest}", table, dataset, sql, wave))
+    if current and "\n".join(current).strip():
+        raise ValueError(f"';'로 끝나지 않는 문장이 있습니다: {current[0].strip()[:60]}")
+    return statements
+
+
+def load_ddl_statements(path: Path) -> List[DDLStatement]:
+    """DDL 파일, 분할 매니페스트(*_manifest.json) 또는 .sql 파일 디렉토리에서 실행할 문장 읽기"""
+    if path.is_dir():
+        sql_files = sorted(path.glob('*.sql'))
+    elif path.suffix.lower() == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        sql_files = [path.parent / shard['file'] for shard in manifest['shards']]
+    else:
+        sql_files = [path]
+    
+    statements = []
+    for sql_file in sql_files:
+        with open(sql_file, 'r', encoding='utf-8') as f:
+            statements.extend(parse_ddl_statements(f.read()))
+    return statements
+
+
+class TokenBucket:
+    """초당 rate개 요청을 허용하는 토큰 버킷 (여러 스레드에서 공유)"""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        while True:
+            with self.lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+class BigQueryClientBase(ABC):
+    """apply 명령이 DDL을 실행할 때 사용하는 클라이언트 인터페이스
+    
+    execute는 성공하면 반환하고, 재시도할 오류는 TransientApplyError, 그 외 오류는 다른 예외를 발생시킨다.
+    execute를 구현하지 않은 클라이언트는 생성할 때 TypeError가 발생한다.
+    """
+    
+    @abstractmethod
+    def execute(self, sql: str):
+        """DDL 문장 하나 실행"""
+    
+    def close(self):
+        pass
+
+
+class FakeBigQueryClient(BigQueryClientBase):
+    """프로세스 안에서 테이블 생성/삭제만 흉내 내는 가짜 BigQuery (오프라인 시험 및 --client fake)
+    
+    failures에 {테이블명: [예외, ...]}를 주면 해당 테이블 문장 실행 시 순서대로 예외를 발생시킨다.
+    """
+    
+    def __init__(self, latency: float = 0.0, failures: Optional[Dict[str, List[Exception]]] = None):
+        self.latency = latency
+        self.failures = {table: list(errors) for table, errors in (failures or {}).items()}
+        self.tables = set()
+        self.executed = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+    
+    def execute(self, sql: str):
+        target = DDL_TARGET_PATTERN.match(sql)
+        table = target.group(1).strip('`') if target else ''
+        keyword = sql.lstrip().split(None, 1)[0].upper()
         
-        return escaped.strip()
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            errors = self.failures.get(table)
+            error = errors.pop(0) if errors else None
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if error is not None:
+                raise error
+            with self.lock:
+                if keyword == 'DROP':
+                    self.tables.discard(table)
+                elif keyword == 'ALTER':
+                    if table not in self.tables:
+                        raise RuntimeError(f"Not found: Table {table}")
+                elif keyword == 'CREATE':
+                    if table in self.tables and not re.match(r'\s*CREATE\s+OR\s+REPLACE', sql, re.IGNORECASE):
+                        raise RuntimeError(f"Already Exists: Table {table}")
+                    self.tables.add(table)
+                self.executed.append(sql)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class GoogleBigQueryClient(BigQueryClientBase):
+    """google-cloud-bigquery 패키지로 DDL을 실행하는 클라이언트"""
     
-    def show_version(self):
-        """버전 정보 표시"""
-        print("Oracle to BigQuery Migration Tool - Portable Version")
-        print("Version: 1.0.0")
-        print("Python:", sys.version.split()[0])
-        print("Platform: Portable (No pandas)")
+    def __init__(self, project_id: Optional[str] = None, location: Optional[str] = None):
+        try:
+            from google.cloud import bigquery
+            from google.api_core import exceptions
+        except ImportError:
+            raise RuntimeError("BigQuery에 DDL을 실행하려면 google-cloud-bigquery 패키지가 필요합니다 (pip install google-cloud-bigquery)")
+        self.client = bigquery.Client(project=project_id or None, location=location)
+        self.exceptions = exceptions
+        self.transient_errors = (
+            exceptions.TooManyRequests, exceptions.InternalServerError, exceptions.BadGateway,
+            exceptions.ServiceUnavailable, exceptions.GatewayTimeout
+        )
     
-    def show_help(self):
-        """도움말 표시"""
-        help_text = """
-Oracle to BigQuery Migration Tool - Portable Version
+    def execute(self, sql: str):
+        try:
+            self.client.query(sql).result()
+        except self.transient_errors as e:
+            raise TransientApplyError(str(e)) from e
+        except self.exceptions.Forbidden as e:
+            # 할당량 초과는 403 rateLimitExceeded로 반환됨
+            if 'rateLimitExceeded' in str(e) or 'Exceeded rate limits' in str(e):
+                raise TransientApplyError(str(e)) from e
+            raise
+    
+    def close(self):
+        self.client.close()
 
-사용법:
-  oracle-to-bq convert <input_file> [--output-dir <output_dir>] [옵션]
-  oracle-to-bq init-config [config_file]
-  oracle-to-bq --version
-  oracle-to-bq --help
-  oracle-to-bq --test
 
-명령어:
-  convert     Oracle 스키마 CSV 파일을 BigQuery DDL로 변환
-  init-config 설정 파일 템플릿 생성
-  --version   버전 정보 표시
-  --help      이 도움말 표시
-  --test      포터블 패키지 테스트
+class DDLApplier:
+    """DDL 문을 제한된 스레드 풀로 동시에 실행 (데이터셋별 속도 제한, 재시도, 재개 가능한 상태 파일)
+    
+    같은 테이블의 문장(DROP 후 CREATE 등)은 순서대로 실행하고, 웨이브는 앞 웨이브가 끝난 뒤 시작한다.
+    실행 중에는 문장마다 저널(<상태 파일>.journal)에 한 줄씩 덧붙이고, 실행이 끝나면 상태 파일 하나로 합친다.
+    """
+    
+    def __init__(self, client: BigQueryClientBase, max_workers: int = 8, rate_per_dataset: Optional[float] = None,
+                 max_retries: int = 3, backoff_seconds: float = 1.0, max_backoff_seconds: float = 60.0,
+                 state_file: Optional[Path] = None, sleep=time.sleep):
+        self.client = client
+        self.max_workers = max_workers
+        self.rate_per_dataset = rate_per_dataset
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.state_file = state_file
+        self.sleep = sleep
+        self.buckets = {}
+        self.lock = threading.Lock()
+        self.journal_file = state_file.with_name(state_file.name + '.journal') if state_file is not None else None
+        self.journal = None
+        self.state = self.load_state()
+    
+    def load_state(self) -> Dict[str, Dict]:
+        """이전 실행의 문장별 상태 읽기 (상태 파일 + 합치기 전에 중단된 실행의 저널, 없으면 빈 상태)"""
+        if self.state_file is None:
+            return {}
+        state = {}
+        if self.state_file.exists():
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f).get('statements', {})
+        if self.journal_file.exists():
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # 중단되면서 마지막 줄이 잘렸을 수 있음
+                    state[record.pop('id')] = record
+        return state
+    
+    def save_state(self):
+        """문장별 상태를 임시 파일에 쓴 뒤 교체하고 저널 삭제 (중단되어도 상태 파일이 깨지지 않음)"""
+        if self.state_file is None:
+            return
+        with self.lock:
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+            temp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'statements': self.state}, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.state_file)
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+    
+    def record(self, statement: DDLStatement, status: str, attempts: int, error: Optional[str] = None):
+        """문장 하나의 상태를 메모리에 반영하고 저널에 한 줄 덧붙임 (문장 수와 무관하게 일정한 쓰기량)"""
+        entry = {'table': statement.table, 'status': status, 'attempts': attempts}
+        if error:
+            entry['error'] = error
+        with self.lock:
+            self.state[statement.statement_id] = entry
+            if self.journal_file is None:
+                return
+            if self.journal is None:
+                self.journal = open(self.journal_file, 'a', encoding='utf-8')
+            self.journal.write(json.dumps(dict(entry, id=statement.statement_id), ensure_ascii=False) + "\n")
+            self.journal.flush()
+    
+    def bucket_for(self, dataset: str) -> Optional[TokenBucket]:
+        if not self.rate_per_dataset:
+            return None
+        with self.lock:
+            if dataset not in self.buckets:
+                self.buckets[dataset] = TokenBucket(self.rate_per_dataset, sleep=self.sleep)
+            return self.buckets[dataset]
+    
+    def execute_statement(self, statement: DDLStatement) -> bool:
+        """문장 하나 실행 (일시적 오류는 지수 백오프로 재시도)"""
+        bucket = self.bucket_for(statement.dataset)
+        attempts = self.state.get(statement.statement_id, {}).get('attempts', 0)
+        retries = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+            attempts += 1
+            try:
+                self.client.execute(statement.sql)
+            except TransientApplyError as e:
+                if retries >= self.max_retries:
+                    self.record(statement, 'failed', attempts, str(e))
+                    logger.error("❌ %s: 재시도 %d회 후 실패 - %s", statement.table, retries, e)
+                    return False
+                delay = min(self.max_backoff_seconds, self.backoff_seconds * (2 ** retries))
+                retries += 1
+                self.sleep(delay)
+            except Exception as e:
+                self.record(statement, 'failed', attempts, str(e))
+                logger.error("❌ %s: %s", statement.table, e)
+                return False
+            else:
+                self.record(statement, 'done', attempts)
+                return True
+    
+    def execute_table(self, statements: List[DDLStatement]) -> Dict[str, int]:
+        """한 테이블의 문장을 순서대로 실행 (실패하면 나머지 문장은 실행하지 않음)"""
+        counts = {'done': 0, 'skipped': 0, 'failed': 0, 'pending': 0}
+        for position, statement in enumerate(statements):
+            if self.state.get(statement.statement_id, {}).get('status') == 'done':
+                counts['skipped'] += 1
+                continue
+            if self.execute_statement(statement):
+                counts['done'] += 1
+            else:
+                counts['failed'] += 1
+                counts['pending'] += len(statements) - position - 1
+                break
+        return counts
+    
+    def run(self, statements: List[DDLStatement]) -> Dict[str, int]:
+        """모든 문장 실행 후 상태별 문장 수 반환 (done, skipped, failed, pending)"""
+        waves = {}
+        for statement in statements:
+            waves.setdefault(statement.wave, {}).setdefault(statement.table, []).append(statement)
+        
+        totals = {'done': 0, 'skipped': 0, 'failed': 0, 'pending': 0}
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for wave in sorted(waves):
+                    for counts in executor.map(self.execute_table, waves[wave].values()):
+                        for key, value in counts.items():
+                            totals[key] += value
+        finally:
+            # 저널을 상태 파일 하나로 합침 (여기까지 오지 못하면 다음 실행이 저널을 읽어 이어서 처리)
+            self.save_state()
+        return totals
 
-옵션:
-  --output-dir <output_dir>         출력 디렉토리 (기본: 입력 파일과 동일한 위치)
-  --project-id <project_id>         BigQuery 프로젝트 ID
-  --config <config_file>            설정 파일 경로
-  --string-mode auto|string_only    문자열 변환 모드
-  --preserve-string-length          STRING 타입에 길이 정보 포함
-  --files                           개별 파일로 DDL 생성 (기본: 병합 파일)
-  --no-primary-keys                 기본키 제약조건 생성 안함
-  --create-or-replace               CREATE OR REPLACE TABLE 사용
 
-예시:
-  # 설정 파일 생성
-  oracle-to-bq init-config my_config.json
-  
-  # 기본 변환 (병합 파일로 생성)
-  oracle-to-bq convert schema.csv --output-dir bigquery_ddl --project-id my-project
-  
-  # 설정 파일 사용
-  oracle-to-bq convert schema.csv --output-dir output --config my_config.json
-  
-  # 옵션 사용
-  oracle-to-bq convert schema.csv --output-dir output --project-id my-project --preserve-string-length
-  
-  # 개별 파일로 생성
-  oracle-to-bq convert schema.csv --output-dir output --project-id my-project --files
+def get_option_value(argv: Sequence[str], name: str, default: Optional[str] = None) -> Optional[str]:
+    """명령행 인자에서 '--옵션 값' 형태의 옵션 값 찾기"""
+    try:
+        idx = list(argv).index(name)
+        if idx + 1 < len(argv):
+            return argv[idx + 1]
+    except ValueError:
+        pass
+    return default
 
-지원하는 입력 형식:
-  필수: TABLE_NAME, COLUMN_NAME, DATA_TYPE, NULLABLE
-  선택: OWNER (Oracle 스키마명, BigQuery 데이터셋명으로 사용)
-        DATA_PRECISION, DATA_SCALE, DATA_LENGTH
-        IS_PRIMARY_KEY, DATA_DEFAULT, COLUMN_COMMENT
 
-"""
-        print(help_text)
+def apply_type_samples_option(tool: SimpleMigrationTool, argv: Sequence[str]):
+    """--type-samples 옵션이 있으면 NUMBER 타입 축소용 샘플을 로드 (경로가 없으면 종료)"""
+    samples_option = get_option_value(argv, '--type-samples')
+    if not samples_option:
+        return
+    samples_path = Path(samples_option)
+    if not samples_path.exists():
+        logger.error("❌ 타입 축소 샘플을 찾을 수 없습니다: %s", samples_path)
+        sys.exit(1)
+    sample_count = tool.load_type_samples(samples_path)
+    logger.info("✓ 타입 축소 샘플 로드: %d개 컬럼 (%s)", sample_count, samples_path)
+
 
 def show_help():
     """도움말 표시"""
@@ -747,6 +4571,16 @@ def show_help():
 
 사용법:
   oracle-to-bq convert <input_file> [--output-dir <output_dir>] [옵션]
+  oracle-to-bq index <input_file>
+  oracle-to-bq estimate <input_file> [--output <file|->] [--format csv|json] [--columns <file>]
+  oracle-to-bq transcode <input_file> <data_file|data_dir> [--output-dir <dir>] [--format parquet|avro]
+                         [--workers N] [--row-group-rows N]
+  oracle-to-bq validate-data <input_file> <data_file|data_dir> [--output <file|->] [--format csv|json]
+                             [--max-errors N] [--batch-rows N]
+  oracle-to-bq watch <watch_dir> [--output-dir <output_dir>] [--interval <초>] [--once]
+  oracle-to-bq serve [--host 127.0.0.1] [--port 8765] [--workers 8]
+  oracle-to-bq apply <ddl_file|manifest.json|dir> [--client bigquery|fake] [--workers 8]
+                     [--rate-per-dataset <초당 문장 수>] [--retries 3] [--state <state_file>]
   oracle-to-bq init-config [config_file]
   oracle-to-bq --version
   oracle-to-bq --help
@@ -754,6 +4588,13 @@ def show_help():
 
 명령어:
   convert       Oracle 스키마 CSV 파일을 BigQuery DDL로 변환
+  index         테이블별 바이트 범위 색인 생성 (--table 선택 변환용)
+  estimate      테이블/컬럼별 BigQuery 저장 크기와 스캔 크기 추정 (NUM_ROWS, AVG_COL_LEN 통계)
+  transcode     테이블별 데이터 CSV를 생성된 타입의 Parquet/Avro 파일로 변환 (bq load용)
+  validate-data 적재 전에 데이터 CSV 값을 생성된 타입/NOT NULL로 검사하여 오류 행 보고
+  watch         디렉토리의 스키마 CSV 변경을 감시하여 변경된 테이블만 다시 변환
+  serve         로컬 HTTP 변환 서비스 실행 (DDL, JSON 스키마, 비교)
+  apply         생성된 DDL을 BigQuery에 동시 실행 (속도 제한, 재시도, 중단 후 재개)
   init-config   설정 파일 템플릿 생성
   --version     버전 정보 표시
   --help        이 도움말 표시
@@ -769,7 +4610,19 @@ def show_help():
   --preserve-string-length          STRING 타입에 길이 정보 포함 (예: STRING(100))
   --files                           개별 파일로 DDL 생성 (기본: 병합 파일)
   --no-primary-keys                 기본키 제약조건 생성 안함
+  --no-foreign-keys                 외래키 제약조건 생성 안함
+  --recommend-clusters              CLUSTER_YN이 없는 테이블에 인덱스/통계 기반 클러스터 컬럼 추천
+  --type-samples <파일|디렉토리>    샘플 통계 CSV 또는 테이블별 데이터 샘플로 NUMBER 타입 축소
   --create-or-replace               CREATE OR REPLACE TABLE 사용
+  --table <OWNER.TABLE,...>         지정한 테이블만 변환 (색인이 있으면 해당 범위만 읽음)
+  --workers <N>                     큰 CSV를 N개 프로세스로 병렬 파싱
+  --emit <형식,...>                 출력 형식 (ddl, json-schema, inventory-csv, cluster-report, export-sql, 기본값 ddl)
+  --profiles <이름,...|all>         설정 파일의 프로필별로 출력 (출력 디렉토리 아래 프로필 이름)
+  --max-script-bytes <N>            병합 DDL을 N바이트 이하 파일로 분할 (매니페스트 생성)
+  --max-statements <N>              병합 DDL을 N개 문장 이하 파일로 분할
+  --no-progress                     진행 상황 표시 안함 (터미널이 아니면 자동으로 꺼짐)
+  --quiet                           경고와 오류만 출력 (경고는 변환 후 요약으로 출력)
+  --log-file <path>                 DEBUG 로그까지 파일에 기록 (버퍼링)
 
 예시:
   # 기본 변환 (입력 파일과 같은 위치에 schema.sql 생성)
@@ -808,7 +4661,7 @@ class OracleToBigQueryConverter:
     
     def test_package(self):
         """포터블 패키지 테스트"""
-        print("🧪 포터블 패키지 테스트 중...")
+        logger.info("🧪 포터블 패키지 테스트 중...")
         
         # 기본 기능 테스트
         test_data = [
@@ -835,10 +4688,10 @@ class OracleToBigQueryConverter:
             shutil.rmtree(temp_output)
         
         if success:
-            print("✅ 포터블 패키지 테스트 성공!")
+            logger.info("✅ 포터블 패키지 테스트 성공!")
             return True
         else:
-            print("❌ 포터블 패키지 테스트 실패!")
+            logger.error("❌ 포터블 패키지 테스트 실패!")
             return False
 
 
@@ -851,6 +4704,9 @@ def main():
     
     command = sys.argv[1]
     
+    # 모든 명령 공통 로그 옵션 (--quiet: 경고/오류만 출력, --log-file: DEBUG까지 파일에 기록)
+    configure_logging(quiet='--quiet' in sys.argv, log_file=get_option_value(sys.argv, '--log-file'))
+    
     if command == '--version':
         tool = SimpleMigrationTool()
         tool.show_version()
@@ -872,7 +4728,7 @@ def main():
         sys.exit(0)
     elif command == 'convert':
         if len(sys.argv) < 3:
-            print("❌ 사용법: oracle-to-bq convert <input_file> [--output-dir <output_dir>] [옵션]")
+            logger.error("❌ 사용법: oracle-to-bq convert <input_file> [--output-dir <output_dir>] [옵션]")
             print("옵션:")
             print("  --project-id <project_id>         BigQuery 프로젝트 ID")
             print("  --config <config_file>            설정 파일 경로")
@@ -880,7 +4736,19 @@ def main():
             print("  --preserve-string-length          STRING 타입에 길이 정보 포함")
             print("  --files                           개별 파일로 DDL 생성 (기본: 병합 파일)")
             print("  --no-primary-keys                 기본키 제약조건 생성 안함")
+            print("  --no-foreign-keys                 외래키 제약조건 생성 안함")
+            print("  --recommend-clusters              CLUSTER_YN이 없는 테이블에 인덱스/통계 기반 클러스터 컬럼 추천")
+            print("  --type-samples <파일|디렉토리>    샘플 통계 CSV 또는 테이블별 데이터 샘플로 NUMBER 타입 축소")
             print("  --create-or-replace               CREATE OR REPLACE TABLE 사용")
+            print("  --table <OWNER.TABLE,...>         지정한 테이블만 변환")
+            print("  --workers <N>                     큰 CSV를 N개 프로세스로 병렬 파싱")
+            print("  --emit <형식,...>                 출력 형식 (ddl, json-schema, inventory-csv, cluster-report, export-sql, 기본값 ddl)")
+            print("  --profiles <이름,...|all>         설정 파일의 프로필별로 출력 (출력 디렉토리 아래 프로필 이름)")
+            print("  --max-script-bytes <N>            병합 DDL을 N바이트 이하 파일로 분할 (매니페스트 생성)")
+            print("  --max-statements <N>              병합 DDL을 N개 문장 이하 파일로 분할")
+            print("  --no-progress                     진행 상황 표시 안함 (터미널이 아니면 자동으로 꺼짐)")
+            print("  --quiet                           경고와 오류만 출력")
+            print("  --log-file <path>                 DEBUG 로그까지 파일에 기록")
             sys.exit(1)
         
         input_file = Path(sys.argv[2])
@@ -924,7 +4792,7 @@ def main():
             if string_mode_idx + 1 < len(sys.argv):
                 string_mode = sys.argv[string_mode_idx + 1]
                 if string_mode not in ['auto', 'string_only']:
-                    print("❌ --string-mode는 'auto' 또는 'string_only'만 가능합니다.")
+                    logger.error("❌ --string-mode는 'auto' 또는 'string_only'만 가능합니다.")
                     sys.exit(1)
         except ValueError:
             pass
@@ -939,11 +4807,43 @@ def main():
         # --no-primary-keys 옵션 확인
         create_primary_keys = '--no-primary-keys' not in sys.argv
         
+        # --no-foreign-keys 옵션 확인
+        create_foreign_keys = '--no-foreign-keys' not in sys.argv
+        
         # --create-or-replace 옵션 확인
         create_or_replace = '--create-or-replace' in sys.argv
         
+        # --table 옵션 확인 (쉼표로 구분한 OWNER.TABLE_NAME 또는 TABLE_NAME)
+        table_option = get_option_value(sys.argv, '--table')
+        table_filter = [name.strip() for name in table_option.split(',') if name.strip()] if table_option else None
+        
+        # --emit 옵션 확인 (쉼표로 구분한 출력 형식, 기본값 ddl)
+        emit_option = get_option_value(sys.argv, '--emit', 'ddl')
+        emitters = [name.strip() for name in emit_option.split(',') if name.strip()]
+        unknown_emitters = [name for name in emitters if name not in EMITTERS]
+        if not emitters or unknown_emitters:
+            logger.error("❌ 알 수 없는 --emit 형식: %s (사용 가능: %s)", ', '.join(unknown_emitters) or emit_option, ', '.join(EMITTERS))
+            sys.exit(1)
+        
+        # '-'는 표준 입력/출력 (입력이 '-'이고 출력 디렉토리가 없으면 표준 출력으로 DDL 출력)
+        read_stdin = str(input_file) == '-'
+        stream_output = (output_dir is not None and str(output_dir) == '-') or (output_dir is None and read_stdin)
+        
+        if stream_output:
+            # DDL만 표준 출력으로 내보내고 상태 메시지는 표준 에러로 보냄
+            ddl_stdout = sys.stdout
+            sys.stdout = sys.stderr
+            if separate_files:
+                logger.error("❌ 표준 출력(-)에는 --files 옵션을 사용할 수 없습니다.")
+                sys.exit(1)
+            if emitters != ['ddl']:
+                logger.error("❌ 표준 출력(-)에는 DDL만 출력할 수 있습니다. --emit 옵션에는 출력 디렉토리를 지정하세요.")
+                sys.exit(1)
+        
         # 도구 초기화
         tool = SimpleMigrationTool(config_file=config_file)
+        if tool.debug_mode:
+            enable_debug_logging()
         
         # 명령행 옵션으로 설정 덮어쓰기
         if project_id:
@@ -956,26 +4856,406 @@ def main():
             tool.merge_output = False  # --files 옵션이 있으면 개별 파일 생성
         if not create_primary_keys:
             tool.create_primary_keys = create_primary_keys
+        if not create_foreign_keys:
+            tool.create_foreign_keys = create_foreign_keys
+        if '--recommend-clusters' in sys.argv:
+            # 추천을 요청하면 설정 파일에서 꺼져 있어도 클러스터링을 켬
+            tool.enable_clustering = True
+            tool.recommend_clustering = True
         if create_or_replace:
             tool.create_or_replace = create_or_replace
+        if table_filter:
+            tool.table_filter = table_filter
+        tool.emitters = emitters
+        
+        # --workers 옵션 확인 (큰 CSV 병렬 파싱)
+        workers_option = get_option_value(sys.argv, '--workers')
+        if workers_option:
+            try:
+                tool.parse_workers = max(1, int(workers_option))
+            except ValueError:
+                logger.error("❌ --workers는 정수여야 합니다.")
+                sys.exit(1)
+        
+        # --max-script-bytes / --max-statements 옵션 확인 (병합 DDL 분할)
+        for option_name, attr_name in (('--max-script-bytes', 'max_script_bytes'), ('--max-statements', 'max_statements')):
+            limit_option = get_option_value(sys.argv, option_name)
+            if limit_option is None:
+                continue
+            try:
+                limit = int(limit_option)
+            except ValueError:
+                limit = 0
+            if limit <= 0:
+                logger.error("❌ %s는 양의 정수여야 합니다.", option_name)
+                sys.exit(1)
+            if separate_files or stream_output:
+                logger.error("❌ %s는 병합 파일 출력에서만 사용할 수 있습니다. (--files, 표준 출력 불가)", option_name)
+                sys.exit(1)
+            setattr(tool, attr_name, limit)
         
-        if not input_file.exists():
-            print(f"❌ 입력 파일을 찾을 수 없습니다: {input_file}")
+        if not read_stdin and not input_file.exists():
+            logger.error("❌ 입력 파일을 찾을 수 없습니다: %s", input_file)
             sys.exit(1)
         
+        # --type-samples 옵션 확인 (샘플 기반 NUMBER 타입 축소)
+        apply_type_samples_option(tool, sys.argv)
+        
+        # --profiles 옵션 확인 (쉼표로 구분한 프로필 이름 또는 all)
+        profiles_option = get_option_value(sys.argv, '--profiles')
+        profile_names = None
+        if profiles_option:
+            if profiles_option == 'all':
+                profile_names = list(tool.profiles)
+            else:
+                profile_names = [name.strip() for name in profiles_option.split(',') if name.strip()]
+            missing = [name for name in profile_names if name not in tool.profiles]
+            if not profile_names or missing:
+                logger.error("❌ 설정 파일에 없는 프로필: %s (정의된 프로필: %s)", ', '.join(missing) or profiles_option, ', '.join(tool.profiles) or '없음')
+                sys.exit(1)
+            if stream_output:
+                logger.error("❌ 표준 출력(-)에는 --profiles 옵션을 사용할 수 없습니다.")
+                sys.exit(1)
+        
+        if stream_output:
+            success = tool.stream_csv_to_ddl(input_file, ddl_stdout)
+            sys.exit(0 if success else 1)
+        
+        # 진행 상황 표시 (표준 출력이 터미널일 때만, --quiet/디버그 출력과는 섞이지 않도록 끔)
+        if '--no-progress' not in sys.argv and '--quiet' not in sys.argv and not tool.debug_mode:
+            tool.progress = ProgressReporter()
+        
         # output_dir이 지정되지 않았으면 입력 파일 기반으로 설정
         if output_dir is None:
             # 입력 파일과 같은 디렉토리에 파일명만 .sql로 변경
             output_dir = input_file.parent
             # 병합 파일명을 입력 파일명.sql로 설정하기 위해 tool에 전달
-            tool.output_filename = input_file.stem + '.sql'
+            tool.output_filename = schema_output_stem(input_file) + '.sql'
         else:
             tool.output_filename = 'merged_ddl.sql'  # 기본 병합 파일명
         
-        success = tool.process_csv_file(input_file, output_dir)
+        if profile_names:
+            success = tool.process_csv_file_profiles(input_file, output_dir, profile_names)
+        else:
+            success = tool.process_csv_file(input_file, output_dir)
         sys.exit(0 if success else 1)
+    elif command == 'index':
+        if len(sys.argv) < 3:
+            logger.error("❌ 사용법: oracle-to-bq index <input_file>")
+            sys.exit(1)
+        
+        input_file = Path(sys.argv[2])
+        if not input_file.is_file():
+            logger.error("❌ 입력 파일을 찾을 수 없습니다: %s", input_file)
+            sys.exit(1)
+        with open(input_file, 'rb') as f:
+            if detect_compression(f.read(6)) is not None:
+                logger.error("❌ 압축 파일은 색인을 만들 수 없습니다. 압축을 푼 파일을 사용하세요.")
+                sys.exit(1)
+        
+        tool = SimpleMigrationTool(config_file=get_option_value(sys.argv, '--config'))
+        index = TableOffsetIndex.build(input_file, tool.detect_encoding(input_file))
+        index.save()
+        logger.info("✓ %d개 테이블 색인 생성 완료: %s", len(index.tables), TableOffsetIndex.sidecar_path(input_file))
+        sys.exit(0)
+    elif command == 'estimate':
+        if len(sys.argv) < 3:
+            logger.error("❌ 사용법: oracle-to-bq estimate <input_file> [--output <file|->] [--format csv|json] [--columns <file>] [옵션]")
+            print("옵션:")
+            print("  --output <file|->                 테이블별 보고서 경로 (기본: <입력 파일명>_estimate.csv, -는 표준 출력)")
+            print("  --format csv|json                 보고서 형식 (기본: csv)")
+            print("  --columns <file>                  컬럼별 추정 보고서도 같은 형식으로 생성")
+            print("  --config <config_file>            설정 파일 경로 (파티션 설정은 생성될 DDL과 같게 적용)")
+            print("  --table <OWNER.TABLE,...>         지정한 테이블만 추정")
+            print("  --type-samples <파일|디렉토리>    샘플 기반 NUMBER 타입 축소를 반영")
+            sys.exit(1)
+        
+        input_file = Path(sys.argv[2])
+        read_stdin = str(input_file) == '-'
+        if not read_stdin and not input_file.is_file():
+            logger.error("❌ 입력 파일을 찾을 수 없습니다: %s", input_file)
+            sys.exit(1)
+        report_format = get_option_value(sys.argv, '--format', 'csv')
+        if report_format not in ('csv', 'json'):
+            logger.error("❌ --format은 'csv' 또는 'json'만 가능합니다.")
+            sys.exit(1)
+        
+        # 보고서 기본 경로: 입력 파일 옆 <파일명>_estimate.<형식> (표준 입력이면 표준 출력)
+        output_option = get_option_value(sys.argv, '--output')
+        if output_option is None:
+            output_option = '-' if read_stdin else str(
+                input_file.parent / f"{schema_output_stem(input_file)}_estimate.{report_format}")
+        stream_output = output_option == '-'
+        if stream_output:
+            # 보고서만 표준 출력으로 내보내고 상태 메시지는 표준 에러로 보냄
+            report_stdout = sys.stdout
+            sys.stdout = sys.stderr
+        
+        tool = SimpleMigrationTool(config_file=get_option_value(sys.argv, '--config'))
+        if tool.debug_mode:
+            enable_debug_logging()
+        table_option = get_option_value(sys.argv, '--table')
+        if table_option:
+            tool.table_filter = [name.strip() for name in table_option.split(',') if name.strip()]
+        apply_type_samples_option(tool, sys.argv)
+        if not stream_output and '--no-progress' not in sys.argv and '--quiet' not in sys.argv and not tool.debug_mode:
+            tool.progress = ProgressReporter()
+        
+        columns_option = get_option_value(sys.argv, '--columns')
+        try:
+            out = report_stdout if stream_output else open(output_option, 'w', encoding='utf-8', newline='')
+            column_out = open(columns_option, 'w', encoding='utf-8', newline='') if columns_option else None
+            try:
+                table_count = tool.write_estimate_report(input_file, out, report_format, column_out)
+            finally:
+                if not stream_output:
+                    out.close()
+                if column_out is not None:
+                    column_out.close()
+        except (OSError, ValueError) as e:
+            logger.error("❌ 크기 추정 오류: %s", e)
+            sys.exit(1)
+        
+        logger.info("✓ %d개 테이블 크기 추정 완료: %s", table_count, '표준 출력' if stream_output else output_option)
+        if columns_option:
+            logger.info("✓ 컬럼별 크기 추정 완료: %s", columns_option)
+        tool.report_warnings()
+        sys.exit(0)
+    elif command == 'transcode':
+        if len(sys.argv) < 4:
+            logger.error("❌ 사용법: oracle-to-bq transcode <input_file> <data_file|data_dir> [--output-dir <dir>] [--format parquet|avro] [옵션]")
+            print("옵션:")
+            print("  --output-dir <dir>                출력 디렉토리 (기본: 데이터 파일과 같은 위치)")
+            print("  --format parquet|avro             출력 형식 (기본: parquet, avro는 fastavro 패키지 필요)")
+            print("  --workers <N>                     동시에 변환할 테이블 수 (프로세스 풀, 기본: CPU 수)")
+            print(f"  --row-group-rows <N>              행 그룹(Avro 블록)당 행 수 (기본: {TRANSCODE_ROW_GROUP_ROWS})")
+            print("  --config <config_file>            설정 파일 경로 (생성된 DDL과 같은 타입 결정)")
+            print("  --table <OWNER.TABLE,...>         지정한 테이블만 변환 (데이터 파일이 하나면 필수)")
+            print("  --type-samples <파일|디렉토리>    샘플 기반 NUMBER 타입 축소를 반영")
+            sys.exit(1)
+        
+        input_file = Path(sys.argv[2])
+        data_path = Path(sys.argv[3])
+        if not input_file.is_file():
+            logger.error("❌ 입력 파일을 찾을 수 없습니다: %s", input_file)
+            sys.exit(1)
+        if not data_path.exists():
+            logger.error("❌ 데이터 파일을 찾을 수 없습니다: %s", data_path)
+            sys.exit(1)
+        output_format = get_option_value(sys.argv, '--format', 'parquet')
+        if output_format not in TRANSCODE_FORMATS:
+            logger.error("❌ --format은 %s만 가능합니다.", ' 또는 '.join(repr(name) for name in TRANSCODE_FORMATS))
+            sys.exit(1)
+        try:
+            workers = max(1, int(get_option_value(sys.argv, '--workers', str(os.cpu_count() or 1))))
+            row_group_rows = max(1, int(get_option_value(sys.argv, '--row-group-rows', str(TRANSCODE_ROW_GROUP_ROWS))))
+        except ValueError:
+            logger.error("❌ --workers, --row-group-rows는 정수여야 합니다.")
+            sys.exit(1)
+        output_dir = Path(get_option_value(sys.argv, '--output-dir', str(data_path if data_path.is_dir() else data_path.parent)))
+        
+        tool = SimpleMigrationTool(config_file=get_option_value(sys.argv, '--config'))
+        if tool.debug_mode:
+            enable_debug_logging()
+        table_option = get_option_value(sys.argv, '--table')
+        if table_option:
+            tool.table_filter = [name.strip() for name in table_option.split(',') if name.strip()]
+        apply_type_samples_option(tool, sys.argv)
+        if '--no-progress' not in sys.argv and '--quiet' not in sys.argv and not tool.debug_mode:
+            tool.progress = ProgressReporter()
+        
+        try:
+            converted, failed = tool.transcode_tables(input_file, data_path, output_dir, output_format, workers, row_group_rows)
+        except (OSError, ValueError) as e:
+            logger.error("❌ 데이터 변환 오류: %s", e)
+            sys.exit(1)
+        
+        logger.info("✓ %d개 테이블 데이터 변환 완료 (%s): %s", converted, output_format, output_dir)
+        tool.report_warnings()
+        sys.exit(1 if failed else 0)
+    elif command == 'validate-data':
+        if len(sys.argv) < 4:
+            logger.error("❌ 사용법: oracle-to-bq validate-data <input_file> <data_file|data_dir> [--output <file|->] [--format csv|json] [옵션]")
+            print("옵션:")
+            print("  --output <file|->                 오류 보고서 경로 (기본: <입력 파일명>_validation.csv, -는 표준 출력)")
+            print("  --format csv|json                 보고서 형식 (기본: csv)")
+            print(f"  --max-errors <N>                  테이블당 오류가 N건이면 검사 중단 (기본: {VALIDATION_MAX_ERRORS}, 0은 끝까지)")
+            print(f"  --batch-rows <N>                  컬럼별로 한 번에 검사할 행 수 (기본: {VALIDATION_BATCH_ROWS})")
+            print("  --config <config_file>            설정 파일 경로 (생성된 DDL과 같은 타입 결정)")
+            print("  --table <OWNER.TABLE,...>         지정한 테이블만 검사 (데이터 파일이 하나면 필수)")
+            print("  --type-samples <파일|디렉토리>    샘플 기반 NUMBER 타입 축소를 반영")
+            sys.exit(1)
+        
+        input_file = Path(sys.argv[2])
+        data_path = Path(sys.argv[3])
+        if not input_file.is_file():
+            logger.error("❌ 입력 파일을 찾을 수 없습니다: %s", input_file)
+            sys.exit(1)
+        if not data_path.exists():
+            logger.error("❌ 데이터 파일을 찾을 수 없습니다: %s", data_path)
+            sys.exit(1)
+        report_format = get_option_value(sys.argv, '--format', 'csv')
+        if report_format not in ('csv', 'json'):
+            logger.error("❌ --format은 'csv' 또는 'json'만 가능합니다.")
+            sys.exit(1)
+        try:
+            max_errors = max(0, int(get_option_value(sys.argv, '--max-errors', str(VALIDATION_MAX_ERRORS))))
+            batch_rows = max(1, int(get_option_value(sys.argv, '--batch-rows', str(VALIDATION_BATCH_ROWS))))
+        except ValueError:
+            logger.error("❌ --max-errors, --batch-rows는 정수여야 합니다.")
+            sys.exit(1)
+        
+        # 보고서 기본 경로: 입력 파일 옆 <파일명>_validation.<형식>
+        output_option = get_option_value(sys.argv, '--output')
+        if output_option is None:
+            output_option = str(input_file.parent / f"{schema_output_stem(input_file)}_validation.{report_format}")
+        stream_output = output_option == '-'
+        if stream_output:
+            # 보고서만 표준 출력으로 내보내고 상태 메시지는 표준 에러로 보냄
+            report_stdout = sys.stdout
+            sys.stdout = sys.stderr
+        
+        tool = SimpleMigrationTool(config_file=get_option_value(sys.argv, '--config'))
+        if tool.debug_mode:
+            enable_debug_logging()
+        table_option = get_option_value(sys.argv, '--table')
+        if table_option:
+            tool.table_filter = [name.strip() for name in table_option.split(',') if name.strip()]
+        apply_type_samples_option(tool, sys.argv)
+        if not stream_output and '--no-progress' not in sys.argv and '--quiet' not in sys.argv and not tool.debug_mode:
+            tool.progress = ProgressReporter()
+        
+        try:
+            out = report_stdout if stream_output else open(output_option, 'w', encoding='utf-8', newline='')
+            try:
+                table_count, error_count = tool.validate_data(input_file, data_path, out, report_format, max_errors, batch_rows)
+            finally:
+                if not stream_output:
+                    out.close()
+        except (OSError, ValueError) as e:
+            logger.error("❌ 데이터 검사 오류: %s", e)
+            sys.exit(1)
+        
+        if error_count:
+            logger.error("❌ %d개 테이블 검사, 오류 %d건: %s", table_count, error_count, '표준 출력' if stream_output else output_option)
+        else:
+            logger.info("✓ %d개 테이블 검사 완료, 오류 없음", table_count)
+        tool.report_warnings()
+        sys.exit(1 if error_count else 0)
+    elif command == 'watch':
+        if len(sys.argv) < 3:
+            logger.error("❌ 사용법: oracle-to-bq watch <watch_dir> [--output-dir <output_dir>] [--interval <초>] [--once] [옵션]")
+            sys.exit(1)
+        
+        watch_dir = Path(sys.argv[2])
+        if not watch_dir.is_dir():
+            logger.error("❌ 감시할 디렉토리를 찾을 수 없습니다: %s", watch_dir)
+            sys.exit(1)
+        
+        tool = SimpleMigrationTool(config_file=get_option_value(sys.argv, '--config'))
+        project_id = get_option_value(sys.argv, '--project-id')
+        if project_id:
+            tool.project_id = project_id
+        if '--files' in sys.argv:
+            tool.merge_output = False
+        
+        output_dir = get_option_value(sys.argv, '--output-dir')
+        try:
+            interval = float(get_option_value(sys.argv, '--interval', '5'))
+        except ValueError:
+            logger.error("❌ --interval은 숫자(초)여야 합니다.")
+            sys.exit(1)
+        if not 0 < interval < float('inf'):
+            logger.error("❌ --interval은 0보다 큰 숫자(초)여야 합니다.")
+            sys.exit(1)
+        
+        watcher = SchemaWatcher(tool, watch_dir, Path(output_dir) if output_dir else None)
+        if '--once' in sys.argv:
+            for csv_file, table_keys in watcher.scan_once().items():
+                logger.info("✓ %s: %d개 테이블 변환", csv_file.name, len(table_keys))
+            sys.exit(0)
+        watcher.run(interval)
+    elif command == 'serve':
+        tool = SimpleMigrationTool(config_file=get_option_value(sys.argv, '--config'))
+        project_id = get_option_value(sys.argv, '--project-id')
+        if project_id:
+            tool.project_id = project_id
+        
+        host = get_option_value(sys.argv, '--host', '127.0.0.1')
+        try:
+            port = int(get_option_value(sys.argv, '--port', '8765'))
+            workers = int(get_option_value(sys.argv, '--workers', '8'))
+        except ValueError:
+            logger.error("❌ --port와 --workers는 정수여야 합니다.")
+            sys.exit(1)
+        
+        server = ConversionHTTPServer((host, port), ConversionService(tool.to_options()), max_workers=workers)
+        logger.info("🌐 변환 서비스 시작: http://%s:%s (스레드 %d개)", host, server.server_address[1], workers)
+        logger.info("  POST /convert  (format: ddl | json-schema | diff)")
+        logger.info("  GET  /metrics  (요청 지연 시간 히스토그램, 캐시 적중률)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("서비스 종료")
+        finally:
+            server.server_close()
+    elif command == 'apply':
+        if len(sys.argv) < 3:
+            logger.error("❌ 사용법: oracle-to-bq apply <ddl_file|manifest.json|dir> [--client bigquery|fake] [--workers 8] "
+                         "[--rate-per-dataset <초당 문장 수>] [--retries 3] [--state <state_file>]")
+            sys.exit(1)
+        
+        ddl_path = Path(sys.argv[2])
+        if not ddl_path.exists():
+            logger.error("❌ DDL 파일을 찾을 수 없습니다: %s", ddl_path)
+            sys.exit(1)
+        
+        try:
+            workers = int(get_option_value(sys.argv, '--workers', '8'))
+            retries = int(get_option_value(sys.argv, '--retries', '3'))
+            rate_option = get_option_value(sys.argv, '--rate-per-dataset')
+            rate_per_dataset = float(rate_option) if rate_option else None
+        except ValueError:
+            logger.error("❌ --workers, --retries, --rate-per-dataset는 숫자여야 합니다.")
+            sys.exit(1)
+        
+        # 상태 파일 기본값: DDL 파일 옆 <파일명>_apply_state.json (디렉토리면 그 안의 apply_state.json)
+        state_option = get_option_value(sys.argv, '--state')
+        if state_option:
+            state_file = Path(state_option)
+        elif ddl_path.is_dir():
+            state_file = ddl_path / 'apply_state.json'
+        else:
+            state_file = ddl_path.with_name(ddl_path.stem + '_apply_state.json')
+        
+        try:
+            statements = load_ddl_statements(ddl_path)
+            client_name = get_option_value(sys.argv, '--client', 'bigquery')
+            if client_name == 'fake':
+                client = FakeBigQueryClient()
+            elif client_name == 'bigquery':
+                client = GoogleBigQueryClient(get_option_value(sys.argv, '--project-id'), get_option_value(sys.argv, '--location'))
+            else:
+                logger.error("❌ 알 수 없는 --client: %s (bigquery 또는 fake)", client_name)
+                sys.exit(1)
+        except (RuntimeError, ValueError) as e:
+            logger.error("❌ %s", e)
+            sys.exit(1)
+        
+        logger.info("✓ %d개 문장 실행 시작 (스레드 %d개, 상태 파일: %s)", len(statements), workers, state_file)
+        applier = DDLApplier(client, max_workers=workers, rate_per_dataset=rate_per_dataset,
+                             max_retries=retries, state_file=state_file)
+        try:
+            totals = applier.run(statements)
+        finally:
+            client.close()
+        logger.info("✓ 실행 완료: 성공 %d, 이전 실행에서 완료 %d, 실패 %d, 미실행 %d",
+                    totals['done'], totals['skipped'], totals['failed'], totals['pending'])
+        if totals['failed']:
+            logger.warning("⚠️ 실패한 문장은 상태 파일을 유지한 채 다시 실행하면 이어서 처리됩니다: %s", state_file)
+        sys.exit(1 if totals['failed'] else 0)
     else:
-        print(f"❌ 알 수 없는 명령어: {command}")
+        logger.error("❌ 알 수 없는 명령어: %s", command)
         tool = SimpleMigrationTool()
         tool.show_help()
         sys.exit(1)